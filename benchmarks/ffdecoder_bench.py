@@ -0,0 +1,317 @@
+"""
+===============================================
+DeFFcode library source-code is deployed under the Apache 2.0 License:
+
+Copyright (c) 2021 Abhishek Thakur(@abhiTronix) <abhi.una12@gmail.com>
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+===============================================
+"""
+
+# import the necessary packages
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+import itertools
+import multiprocessing
+from datetime import datetime, timezone
+
+from deffcode import FFdecoder, __version__
+from deffcode.utils import logger_handler
+from deffcode.ffhelper import get_valid_ffmpeg_path, check_sp_output
+
+# `resource` module is only available on Unix-like systems
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# define logger
+logger = logging.getLogger("Benchmark")
+logger.propagate = False
+logger.addHandler(logger_handler())
+logger.setLevel(logging.DEBUG)
+
+# synthetic FFmpeg `lavfi` sources
+SOURCES = {
+    "testsrc2": "testsrc2=size={}:rate=30",
+    "mandelbrot": "mandelbrot=size={}:rate=30",
+}
+
+# frame pixel-formats with their extra FFdecoder parameters
+FRAME_FORMATS = {
+    "rgb24": {},
+    "bgr24": {},
+    "gray": {},
+    "yuv420p": {"-enforce_cv_patch": True},
+    "rgb48le": {},
+    "rgb48be": {},
+}
+
+# source resolutions
+RESOLUTIONS = ["640x360", "1280x720", "1920x1080"]
+
+# output resolution variants, as functions of source width and height
+VARIANTS = {
+    "source": lambda w, h: {},
+    "custom_resolution": lambda w, h: {"-custom_resolution": (w // 2, h // 2)},
+    "vf_scale": lambda w, h: {"-vf": "scale={}:{}".format(w // 2, h // 2)},
+}
+
+
+def build_cases(
+    sources=None, frame_formats=None, resolutions=None, variants=None, num_frames=120
+):
+    """
+    ## build_cases
+
+    Builds benchmark cases for the matrix of given sources, frame pixel-formats, resolutions and variants.
+
+    Parameters:
+        sources (list): names of `lavfi` sources. Defaults to all.
+        frame_formats (list): frame pixel-formats. Defaults to all.
+        resolutions (list): source resolutions as `WxH` strings. Defaults to all.
+        variants (list): names of output resolution variants. Defaults to all.
+        num_frames (int): number of frames to decode in each case.
+
+    **Returns:** A list of benchmark cases as dictionaries.
+    """
+    cases = []
+    for source, frame_format, resolution, variant in itertools.product(
+        sources or list(SOURCES),
+        frame_formats or list(FRAME_FORMATS),
+        resolutions or RESOLUTIONS,
+        variants or list(VARIANTS),
+    ):
+        (width, height) = (int(x) for x in resolution.lower().split("x"))
+        ffparams = {
+            "-frames:v": num_frames,
+            **FRAME_FORMATS.get(frame_format, {}),
+            **VARIANTS[variant](width, height),
+        }
+        cases.append(
+            {
+                "source": source,
+                "frame_format": frame_format,
+                "resolution": resolution,
+                "variant": variant,
+                "ffparams": ffparams,
+            }
+        )
+    return cases
+
+
+def get_resource_usage():
+    """
+    ## get_resource_usage
+
+    Returns CPU times of current process and its reaped children(FFmpeg), and peak RSS of current process in MB.
+    """
+    if resource is None:
+        return None
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    # `ru_maxrss` is in bytes on macOS and in kilobytes elsewhere
+    rss_unit = 1 if sys.platform == "darwin" else 1024
+    return {
+        "cpu_user": own.ru_utime,
+        "cpu_system": own.ru_stime,
+        "ffmpeg_cpu_user": children.ru_utime,
+        "ffmpeg_cpu_system": children.ru_stime,
+        "peak_rss_mb": own.ru_maxrss * rss_unit / 2**20,
+    }
+
+
+def run_case(case, custom_ffmpeg=""):
+    """
+    ## run_case
+
+    Runs given benchmark case in current process, by decoding frames of its source with FFdecoder API.
+
+    Parameters:
+        case (dict): benchmark case.
+        custom_ffmpeg (str): path/directory of custom FFmpeg executable.
+
+    **Returns:** Benchmark case along with its measurements as dictionary, i.e. number of `frames`, decoding
+    `fps` and `mb_per_s` after first frame, time to first frame `ttff_s` _(including probing and launching)_,
+    total `wall_s` time, `peak_rss_mb` of Python process, and CPU seconds of Python and FFmpeg processes _(Unix only)_.
+    """
+    result = dict(case)
+    usage_before = get_resource_usage()
+    start = time.perf_counter()
+    decoder = None
+    try:
+        decoder = FFdecoder(
+            SOURCES[case["source"]].format(case["resolution"]),
+            source_demuxer="lavfi",
+            frame_format=case["frame_format"],
+            custom_ffmpeg=custom_ffmpeg,
+            **case["ffparams"]
+        ).formulate()
+        frames = decoder.generateFrame()
+        frame = next(frames, None)
+        first_frame = time.perf_counter()
+        num_frames = 0 if frame is None else 1
+        num_bytes = 0 if frame is None else frame.nbytes
+        for frame in frames:
+            num_frames += 1
+            num_bytes += frame.nbytes
+        end = time.perf_counter()
+    except Exception as e:
+        logger.error("Benchmark case `{}` failed: {}".format(case, str(e)))
+        result["error"] = str(e)
+        return result
+    finally:
+        not (decoder is None) and decoder.terminate()
+    decoding = end - first_frame
+    result.update(
+        {
+            "frames": num_frames,
+            "frame_bytes": num_bytes // num_frames if num_frames else 0,
+            "ttff_s": first_frame - start,
+            "wall_s": end - start,
+            "fps": (num_frames - 1) / decoding if decoding > 0 else None,
+            "mb_per_s": (
+                (num_bytes * (num_frames - 1) / num_frames) / 2**20 / decoding
+                if decoding > 0
+                else None
+            ),
+        }
+    )
+    usage_after = get_resource_usage()
+    if not (usage_after is None):
+        result["peak_rss_mb"] = usage_after["peak_rss_mb"]
+        for key in ["cpu_user", "cpu_system", "ffmpeg_cpu_user", "ffmpeg_cpu_system"]:
+            result[key] = usage_after[key] - usage_before[key]
+    return result
+
+
+def run_benchmarks(cases, custom_ffmpeg="", isolate=True):
+    """
+    ## run_benchmarks
+
+    Runs given benchmark cases one after another.
+
+    Parameters:
+        cases (list): benchmark cases.
+        custom_ffmpeg (str): path/directory of custom FFmpeg executable.
+        isolate (bool): whether to run each case in a fresh process, so that its peak RSS and CPU times are not affected by other cases.
+
+    **Returns:** A list of benchmark results.
+    """
+    results = []
+    pool = (
+        multiprocessing.get_context("spawn").Pool(processes=1, maxtasksperchild=1)
+        if isolate
+        else None
+    )
+    try:
+        for index, case in enumerate(cases, start=1):
+            result = (
+                pool.apply(run_case, (case, custom_ffmpeg))
+                if isolate
+                else run_case(case, custom_ffmpeg=custom_ffmpeg)
+            )
+            logger.info(
+                "[{}/{}] {source} {resolution} {frame_format} {variant}: {}".format(
+                    index,
+                    len(cases),
+                    (
+                        "fps={:.1f} MB/s={:.1f} ttff={:.3f}s".format(
+                            result["fps"] or 0.0,
+                            result["mb_per_s"] or 0.0,
+                            result["ttff_s"],
+                        )
+                        if not "error" in result
+                        else "failed"
+                    ),
+                    **case
+                )
+            )
+            results.append(result)
+    finally:
+        if not (pool is None):
+            pool.close()
+            pool.join()
+    return results
+
+
+def main(argv=None):
+    """
+    ## main
+
+    Command-line entry point, that runs benchmarks matrix and writes results to JSON file.
+
+    Parameters:
+        argv (list): command-line arguments. Defaults to `sys.argv[1:]`.
+
+    **Returns:** Exit code.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark DeFFcode FFdecoder API over synthetic FFmpeg lavfi sources.",
+    )
+    parser.add_argument(
+        "-o", "--output", default="benchmark_results.json", help="output JSON file"
+    )
+    parser.add_argument(
+        "-n", "--frames", type=int, default=120, help="frames to decode in each case"
+    )
+    parser.add_argument("--sources", nargs="+", choices=list(SOURCES))
+    parser.add_argument("--frame-formats", nargs="+")
+    parser.add_argument("--resolutions", nargs="+", help="for e.g. 1280x720")
+    parser.add_argument("--variants", nargs="+", choices=list(VARIANTS))
+    parser.add_argument("--ffmpeg", default="", help="custom FFmpeg executable")
+    parser.add_argument(
+        "--no-isolate",
+        action="store_true",
+        help="run all cases in current process",
+    )
+    args = parser.parse_args(argv)
+
+    cases = build_cases(
+        sources=args.sources,
+        frame_formats=args.frame_formats,
+        resolutions=args.resolutions,
+        variants=args.variants,
+        num_frames=args.frames,
+    )
+    logger.info("Running `{}` benchmark cases...".format(len(cases)))
+    results = run_benchmarks(
+        cases, custom_ffmpeg=args.ffmpeg, isolate=not args.no_isolate
+    )
+    # identify FFmpeg executable used
+    ffmpeg = get_valid_ffmpeg_path(
+        custom_ffmpeg=args.ffmpeg, is_windows=platform.system() == "Windows"
+    )
+    report = {
+        "deffcode_version": __version__,
+        "ffmpeg_version": (
+            check_sp_output([ffmpeg, "-version"]).decode("utf-8").splitlines()[0]
+            if ffmpeg
+            else None
+        ),
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": multiprocessing.cpu_count(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    logger.info("Benchmark results saved to `{}`.".format(args.output))
+    return 1 if any("error" in x for x in results) else 0
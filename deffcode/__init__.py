@@ -4,4 +4,19 @@
 
 from .ffdecoder import FFdecoder
 from .sourcer import Sourcer
-from .version import __version__
\ No newline at end of file
+from .version import __version__
+
+
+def __getattr__(name):
+    """
+    Lazily imports optional APIs on first access, so that only FFdecoder and Sourcer APIs are loaded with this package.
+    """
+    if name == "SharedFrameRing":
+        from .framering import SharedFrameRing
+
+        return SharedFrameRing
+    if name == "DecoderPool":
+        from .decoderpool import DecoderPool
+
+        return DecoderPool
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -0,0 +1,255 @@
+"""
+===============================================
+DeFFcode library source-code is deployed under the Apache 2.0 License:
+
+Copyright (c) 2021 Abhishek Thakur(@abhiTronix) <abhi.una12@gmail.com>
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+===============================================
+"""
+
+# import the necessary packages
+import os
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# import utils packages
+from .utils import logger_handler
+from .ffdecoder import FFdecoder
+
+# define logger
+logger = logging.getLogger("DecoderPool")
+logger.propagate = False
+logger.addHandler(logger_handler())
+logger.setLevel(logging.DEBUG)
+
+
+class DecoderPool:
+    """
+    > DecoderPool API decodes many sources in bulk with a bounded number of concurrent FFdecoder pipelines,
+    which all share the same FFdecoder parameters.
+
+    While frames of a source are being consumed, the next sources are already being probed and their FFmpeg pipelines
+    launched in background threads, so that source probing and pipeline launching overheads are overlapped with decoding
+    instead of being serialized. A failure with any source is logged and recorded without interrupting the rest, and every
+    FFmpeg subprocess is guaranteed to be terminated.
+
+    !!! note "DecoderPool only launches pipelines ahead, i.e. frames are read from one source at a time. Launched-ahead FFmpeg pipelines only decode as many frames as fit in their pipe buffers until they're consumed, so frames of many sources are not decoded in parallel."
+
+    !!! warning "Frames iterator of each source is valid only until next result is requested, after which its pipeline is terminated."
+    """
+
+    def __init__(
+        self,
+        max_workers=None,
+        frame_format=None,
+        custom_ffmpeg="",
+        verbose=False,
+        **ffparams
+    ):
+        """
+        This constructor method initializes the object state and attributes of the DecoderPool Class.
+
+        Parameters:
+            max_workers (int): maximum number of concurrently alive FFdecoder pipelines, including the one being consumed. Defaults to number of CPU cores.
+            frame_format (str): sets pixel format(`-pix_fmt`) of the decoded frames of each source.
+            custom_ffmpeg (str): assigns the location of custom path/directory for custom FFmpeg executable.
+            verbose (bool): enables/disables verbose.
+            ffparams (dict): provides the flexibility to control supported internal and FFmpeg parameters of each FFdecoder pipeline.
+        """
+        # enable verbose if specified
+        self.__verbose_logs = (
+            verbose if (verbose and isinstance(verbose, bool)) else False
+        )
+
+        # handle maximum concurrent pipelines
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        elif (
+            not isinstance(max_workers, int)
+            or isinstance(max_workers, bool)
+            or max_workers < 1
+        ):
+            # reset improper values
+            logger.warning(
+                "Discarding invalid `max_workers` value: `{}`!".format(max_workers)
+            )
+            max_workers = os.cpu_count() or 1
+        self.__max_workers = max_workers
+
+        # handles shared FFdecoder parameters
+        self.__decoder_params = dict(
+            frame_format=frame_format,
+            custom_ffmpeg=custom_ffmpeg,
+            verbose=self.__verbose_logs,
+            **ffparams
+        )
+
+        # handles failed sources as (source, error) tuples
+        self.__failures = []
+
+        # handles launched FFdecoder pipelines
+        self.__decoders = set()
+        self.__lock = threading.Lock()
+
+    @property
+    def failures(self):
+        """
+        A property object that returns sources failed so far, along with their errors.
+
+        **Returns:** A list of `(source, error)` tuples.
+        """
+        return list(self.__failures)
+
+    def __launch(self, source):
+        """
+        This Internal method probes given source and launches its FFdecoder pipeline.
+
+        Parameters:
+            source (str): source to be decoded.
+
+        **Returns:** A formulated FFdecoder object.
+        """
+        decoder = FFdecoder(source, **self.__decoder_params)
+        with self.__lock:
+            self.__decoders.add(decoder)
+        return decoder.formulate()
+
+    def __terminate(self, decoder):
+        """
+        This Internal method safely terminates given FFdecoder pipeline (if not already).
+
+        Parameters:
+            decoder (FFdecoder): pipeline to be terminated.
+        """
+        with self.__lock:
+            if not decoder in self.__decoders:
+                return
+            self.__decoders.discard(decoder)
+        try:
+            decoder.terminate()
+        except Exception as e:
+            logger.exception(str(e))
+
+    def __fail(self, source, error):
+        """
+        This Internal method logs and records failure with given source.
+        """
+        logger.error("Failed to decode `{}` source: {}".format(source, str(error)))
+        self.__failures.append((source, error))
+
+    def __iterate(self, source, decoder, batch_size):
+        """
+        This Internal method returns a Generator function of frames(or batches) of given source, that handles its failures.
+        """
+        try:
+            if batch_size is None:
+                yield from decoder.generateFrame()
+            else:
+                yield from decoder.generateBatch(batch_size)
+        except Exception as e:
+            self.__fail(source, e)
+        finally:
+            self.__terminate(decoder)
+
+    def decode(self, sources, batch_size=None, ordered=True):
+        """
+        This method returns a [Generator function](https://wiki.python.org/moin/Generators)
+        _(also an Iterator using `next()`)_ of `(source, frames)` tuples for given sources, where `frames` is a Generator
+        function of video frames _(or batches of video frames if `batch_size` is defined)_ of that source.
+
+        Sources that failed to probe or launch are skipped, and sources that failed while decoding end their frames early.
+        Both are logged and recorded in `failures` property object.
+
+        Parameters:
+            sources (iterable): sources to be decoded. Consumed lazily, so it can be a Generator itself.
+            batch_size (int): if defined, frames are generated as contiguous 4D `ndarray` batches of this size, with `generateBatch()` method.
+            ordered (bool): whether to yield results in order of sources, or as soon as their pipelines are launched.
+        """
+        # validate batch size
+        if not (batch_size is None) and (
+            not isinstance(batch_size, int)
+            or isinstance(batch_size, bool)
+            or batch_size < 1
+        ):
+            raise ValueError(
+                "Invalid `batch_size` value: `{}`! It must be a positive integer.".format(
+                    batch_size
+                )
+            )
+        sources = iter(sources)
+        pending = deque()  # launching (source, future) tuples
+        executor = ThreadPoolExecutor(
+            max_workers=self.__max_workers, thread_name_prefix="DecoderPool"
+        )
+        try:
+            while True:
+                # keep launching next sources upto concurrency limit, whereas pipeline
+                # being consumed counts towards it too (i.e. it is reaped beforehand)
+                while len(pending) < self.__max_workers:
+                    source = next(sources, StopIteration)
+                    if source is StopIteration:
+                        break
+                    pending.append((source, executor.submit(self.__launch, source)))
+                if not pending:
+                    break
+                # pick next launched source
+                if ordered:
+                    (source, future) = pending.popleft()
+                else:
+                    wait([x[1] for x in pending], return_when=FIRST_COMPLETED)
+                    (source, future) = next(x for x in pending if x[1].done())
+                    pending.remove((source, future))
+                try:
+                    decoder = future.result()
+                except Exception as e:
+                    self.__fail(source, e)
+                    continue
+                frames = self.__iterate(source, decoder, batch_size)
+                try:
+                    yield (source, frames)
+                finally:
+                    # invalidate frames and reap pipeline
+                    frames.close()
+                    self.__terminate(decoder)
+        finally:
+            # discard sources yet to be launched, and reap all pipelines
+            for _, future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+            self.close()
+
+    def close(self):
+        """
+        Safely terminates all launched FFdecoder pipelines.
+        """
+        with self.__lock:
+            decoders = list(self.__decoders)
+        for decoder in decoders:
+            self.__terminate(decoder)
+
+    def __enter__(self):
+        """
+        Handles entry with the `with` statement. See [PEP343 -- The 'with' statement'](https://peps.python.org/pep-0343/).
+
+        **Returns:** A reference to the DecoderPool class object.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Handles exit with the `with` statement. See [PEP343 -- The 'with' statement'](https://peps.python.org/pep-0343/).
+        """
+        self.close()
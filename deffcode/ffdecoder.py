@@ -19,18 +19,27 @@
 """
 
 # import the necessary packages
+import os
+import re
+import time
+import random
 import platform
 import logging
 import numpy as np
+import threading
 import subprocess as sp
+from queue import Queue, Empty, Full
+from bisect import bisect_right
 from collections import OrderedDict
 
 # import utils packages
-from .utils import dict2Args, logger_handler
+from .utils import dict2Args, logger_handler, LatencyHistogram
 from .sourcer import Sourcer
 from .ffhelper import (
     get_supported_pixfmts,
     get_supported_vdecoders,
+    check_sp_output,
+    FFmpegCapabilities,
 )
 
 # define FFdecoder logger
@@ -110,6 +119,13 @@ def __init__(
         # handles process to be frames written
         self.__process = None
 
+        # handles asyncio process to be frames written
+        self.__aprocess = None
+        self.__async_pipeline = False  # whether to launch with asyncio
+
+        # handles formulated FFmpeg command
+        self.__ffmpeg_cmd = None
+
         # handles disabling window for ffmpeg subprocess on Windows
         self.__ffmpeg_window_disabler_patch = False
 
@@ -124,6 +140,63 @@ def __init__(
         self.__raw_frame_depth = None  # raw-frame depth
         self.__raw_frame_resolution = None  # raw-frame resolution/dimension
 
+        # handles precomputed frame geometry
+        self.__raw_frame_size = None  # raw-frame size(in elements)
+        self.__raw_frame_nbytes = None  # raw-frame size(in bytes)
+        self.__raw_frame_shape = None  # raw-frame shape for reconstruction
+        self.__raw_frame_is_gray = False  # whether gray frames need slicing
+        self.__raw_frame_is_planar = False  # whether frames are planar(CHW)
+
+        # handles preallocated frame buffers pool
+        self.__frame_buffer_pool = []  # pool of writable flat buffers
+        self.__frame_buffer_index = 0  # next buffer in pool
+
+        # handles shared memory frames ring
+        self.__frame_ring = None
+
+        # handles regions of interest cropped within FFmpeg
+        self.__rois = None  # list of `(x, y, w, h)` regions
+        self.__roi_multiple = False  # whether each region is returned separately
+        self.__roi_slices = None  # regions as `(rows, columns)` slices of packed frame
+
+        # handles keyframe index(as frame numbers) for random access
+        self.__keyframe_index = None
+
+        # handles running parallel segments decoding processes
+        self.__segment_processes = []
+
+        # handles per-frame latency instrumentation
+        self.__latency_stats = None  # latency histograms (if enabled)
+        self.__latency_bytes = 0  # total bytes read
+        self.__latency_start = None  # time first frame was read
+
+        # handles FFmpeg progress statistics
+        self.__pipeline_stats = {}  # latest parsed statistics
+        self.__progress_fds = None  # dedicated progress pipe (read, write) fds
+        self.__progress_thread = None  # progress reader thread
+
+        # handles background frames prefetching
+        self.__prefetch_queue = None  # bounded frames queue
+        self.__prefetch_thread = None  # frames reader thread
+        self.__prefetch_error = None  # error raised in reader thread
+        self.__prefetch_stats = {
+            "frames_prefetched": 0,  # frames read by reader thread
+            "producer_stalls": 0,  # times reader thread found queue full
+            "consumer_stalls": 0,  # times consumer found queue empty
+            "frames_dropped": 0,  # stale frames overwritten in latest-frame-only mode
+        }
+
+        # handles automatic reconnection of live sources
+        self.__reconnect_lock = threading.Lock()  # guards relaunching process
+        self.__reconnect_failures = 0  # consecutive relaunches without any frame
+        self.__reconnect_down_since = None  # time stream dropped (if down)
+        self.__reconnect_stats = {
+            "reconnects": 0,  # relaunches of FFmpeg process
+            "recoveries": 0,  # relaunches that resumed frames
+            "downtime": 0.0,  # total seconds stream was down
+            "last_gap": None,  # latest recovered gap as `(wall time dropped, seconds)`
+        }
+
         # define supported mode of operation
         self.__supported_opmodes = {
             "av": "Audio-Video",  # audio is only for pass-through, not really for audio decoding yet.
@@ -175,6 +248,11 @@ def __init__(
             "-ffmpeg_download_path", ""
         )
 
+        # pass source metadata probing parameters(if specified) to Sourcer API
+        for key in ["-probe_cache", "-probe_backend", "-probe_timeout"]:
+            if key in self.__extra_params:
+                sourcer_params[key] = self.__extra_params.pop(key)
+
         # handle video and audio stream indexes in case of multiple ones.
         default_stream_indexes = self.__extra_params.pop(
             "-default_stream_indexes", (0, 0)
@@ -200,7 +278,7 @@ def __init__(
                 source_demuxer=source_demuxer,
                 verbose=verbose,
                 custom_ffmpeg=custom_ffmpeg if isinstance(custom_ffmpeg, str) else "",
-                **sourcer_params
+                **sourcer_params,
             )
             .probe_stream(default_stream_indexes=default_stream_indexes)
             .retrieve_metadata(force_retrieve_missing=True)
@@ -317,6 +395,236 @@ def __init__(
             # reset improper values
             self.__custom_resolution = None
 
+        # handle number of preallocated writable frame buffers to recycle
+        self.__frame_buffer_pool_size = self.__extra_params.pop("-frame_buffer_pool", 0)
+        if (
+            not isinstance(self.__frame_buffer_pool_size, int)
+            or isinstance(self.__frame_buffer_pool_size, bool)
+            or self.__frame_buffer_pool_size < 0
+        ):
+            # log it
+            logger.warning(
+                "Discarding invalid `-frame_buffer_pool` value: `{}`!".format(
+                    self.__frame_buffer_pool_size
+                )
+            )
+            # reset improper values
+            self.__frame_buffer_pool_size = 0
+
+        # handle number of frames to prefetch in background thread
+        self.__prefetch_frames = self.__extra_params.pop("-prefetch_frames", 0)
+        if (
+            not isinstance(self.__prefetch_frames, int)
+            or isinstance(self.__prefetch_frames, bool)
+            or self.__prefetch_frames < 0
+        ):
+            # log it
+            logger.warning(
+                "Discarding invalid `-prefetch_frames` value: `{}`!".format(
+                    self.__prefetch_frames
+                )
+            )
+            # reset improper values
+            self.__prefetch_frames = 0
+        # handle latest-frame-only (drop-stale) mode for live sources
+        self.__latest_frame_only = self.__extra_params.pop("-latest_frame_only", False)
+        if not isinstance(self.__latest_frame_only, bool):
+            # log it
+            logger.warning(
+                "Discarding invalid `-latest_frame_only` value of wrong type `{}`!".format(
+                    type(self.__latest_frame_only).__name__
+                )
+            )
+            # reset improper values
+            self.__latest_frame_only = False
+        if self.__latest_frame_only:
+            # reader thread keeps only newest frames in prefetch queue
+            self.__prefetch_frames = self.__prefetch_frames or 1
+            # reader thread may run arbitrarily ahead of consumer, so
+            # frames must never be read into recycled buffers
+            if self.__frame_buffer_pool_size:
+                logger.warning(
+                    "`-frame_buffer_pool` parameter is not supported in `-latest_frame_only` mode. Discarding!"
+                )
+                self.__frame_buffer_pool_size = 0
+        # queued frames, a frame being read and a frame being consumed
+        # must never share a recycled buffer
+        if (
+            self.__prefetch_frames
+            and self.__frame_buffer_pool_size
+            and self.__frame_buffer_pool_size < self.__prefetch_frames + 2
+        ):
+            logger.warning(
+                "`-frame_buffer_pool` value must be at least `-prefetch_frames + 2`. Increasing it to `{}`!".format(
+                    self.__prefetch_frames + 2
+                )
+            )
+            self.__frame_buffer_pool_size = self.__prefetch_frames + 2
+
+        # handle shared memory frames ring slots and consumers
+        self.__shm_ring_slots = self.__extra_params.pop("-shm_ring_slots", 0)
+        self.__shm_ring_consumers = self.__extra_params.pop("-shm_ring_consumers", 1)
+        if (
+            not isinstance(self.__shm_ring_slots, int)
+            or isinstance(self.__shm_ring_slots, bool)
+            or self.__shm_ring_slots < 0
+        ):
+            # log it
+            logger.warning(
+                "Discarding invalid `-shm_ring_slots` value: `{}`!".format(
+                    self.__shm_ring_slots
+                )
+            )
+            # reset improper values
+            self.__shm_ring_slots = 0
+        if (
+            not isinstance(self.__shm_ring_consumers, int)
+            or isinstance(self.__shm_ring_consumers, bool)
+            or self.__shm_ring_consumers < 1
+        ):
+            # log it
+            logger.warning(
+                "Discarding invalid `-shm_ring_consumers` value: `{}`!".format(
+                    self.__shm_ring_consumers
+                )
+            )
+            # reset improper values
+            self.__shm_ring_consumers = 1
+
+        # handle FFmpeg progress statistics of the pipeline
+        self.__pipeline_stats_mode = self.__extra_params.pop("-pipeline_stats", False)
+        if not isinstance(self.__pipeline_stats_mode, bool):
+            # log it
+            logger.warning(
+                "Discarding invalid `-pipeline_stats` value of wrong type `{}`!".format(
+                    type(self.__pipeline_stats_mode).__name__
+                )
+            )
+            # reset improper values
+            self.__pipeline_stats_mode = False
+
+        # handle per-frame latency instrumentation
+        latency_stats = self.__extra_params.pop("-latency_stats", False)
+        if not isinstance(latency_stats, bool):
+            # log it
+            logger.warning(
+                "Discarding invalid `-latency_stats` value of wrong type `{}`!".format(
+                    type(latency_stats).__name__
+                )
+            )
+            # reset improper values
+            latency_stats = False
+        if latency_stats:
+            self.__latency_stats = {
+                "pipe_read": LatencyHistogram(),  # time blocked on reading pipe
+                "reshape": LatencyHistogram(),  # time reconstructing frame
+                "consumer": LatencyHistogram(),  # time spent by consumer between frames
+            }
+
+        # handle maximum consecutive reconnect attempts for live sources
+        self.__auto_reconnect = self.__extra_params.pop("-auto_reconnect", 0)
+        if (
+            not isinstance(self.__auto_reconnect, int)
+            or isinstance(self.__auto_reconnect, bool)
+            or self.__auto_reconnect < 0
+        ):
+            # log it
+            logger.warning(
+                "Discarding invalid `-auto_reconnect` value: `{}`!".format(
+                    self.__auto_reconnect
+                )
+            )
+            # reset improper values
+            self.__auto_reconnect = 0
+        # handle initial and maximum reconnect backoff delays (in seconds)
+        self.__reconnect_backoff = self.__extra_params.pop(
+            "-auto_reconnect_backoff", (0.5, 30.0)
+        )
+        if not (
+            isinstance(self.__reconnect_backoff, (list, tuple))
+            and len(self.__reconnect_backoff) == 2
+            and all(
+                isinstance(x, (int, float)) and not isinstance(x, bool) and x >= 0
+                for x in self.__reconnect_backoff
+            )
+        ):
+            # log it
+            logger.warning(
+                "Discarding invalid `-auto_reconnect_backoff` value: `{}`!".format(
+                    self.__reconnect_backoff
+                )
+            )
+            # reset improper values
+            self.__reconnect_backoff = (0.5, 30.0)
+
+        # handle decode-time frame stride (i.e. every Nth frame)
+        self.__frame_stride = self.__extra_params.pop("-frame_stride", 1)
+        if (
+            not isinstance(self.__frame_stride, int)
+            or isinstance(self.__frame_stride, bool)
+            or self.__frame_stride < 1
+        ):
+            # log it
+            logger.warning(
+                "Discarding invalid `-frame_stride` value: `{}`!".format(
+                    self.__frame_stride
+                )
+            )
+            # reset improper values
+            self.__frame_stride = 1
+        # handle keyframes-only decoding
+        self.__keyframes_only = self.__extra_params.pop("-keyframes_only", False)
+        if not isinstance(self.__keyframes_only, bool):
+            # log it
+            logger.warning(
+                "Discarding invalid `-keyframes_only` value of wrong type `{}`!".format(
+                    type(self.__keyframes_only).__name__
+                )
+            )
+            # reset improper values
+            self.__keyframes_only = False
+
+        # handle region(s) of interest as `(x, y, w, h)` or list of them
+        rois = self.__extra_params.pop("-roi", None)
+        if not (rois is None):
+            self.__roi_multiple = isinstance(rois, list) and all(
+                isinstance(x, (list, tuple)) for x in rois
+            )
+            rois = list(rois) if self.__roi_multiple else [rois]
+            (width, height) = self.__sourcer_metadata["source_video_resolution"] or (
+                0,
+                0,
+            )
+            if not rois or not all(
+                isinstance(x, (list, tuple))
+                and len(x) == 4
+                and all(isinstance(y, int) and not isinstance(y, bool) for y in x)
+                and x[0] >= 0
+                and x[1] >= 0
+                and x[2] > 0
+                and x[3] > 0
+                and x[0] + x[2] <= width
+                and x[1] + x[3] <= height
+                for x in rois
+            ):
+                # log it
+                logger.warning(
+                    "Discarding invalid `-roi` value: `{}`! Each region must be a `(x, y, w, h)` tuple within source frame.".format(
+                        rois if self.__roi_multiple else rois[0]
+                    )
+                )
+                self.__roi_multiple = False
+            elif set(["-vf", "-filter_complex"]).intersection(
+                self.__extra_params.keys()
+            ) or not (self.__custom_resolution is None):
+                # log it
+                logger.warning(
+                    "`-roi` parameter is not supported with FFmpeg filters or `-custom_resolution` parameter. Discarding!"
+                )
+                self.__roi_multiple = False
+            else:
+                self.__rois = [tuple(x) for x in rois]
+
     def formulate(self):
         """
         This method formulates all necessary FFmpeg pipeline arguments and executes it inside the FFmpeg `subprocess` pipe.
@@ -480,6 +788,14 @@ def formulate(self):
                     self.__raw_frame_dtype = np.dtype("<u2")
                 else:
                     self.__raw_frame_dtype = np.dtype(">u2")
+            elif raw_bit_per_component == 32 and rawframe_pixfmt.endswith(
+                ("f32le", "f32be")
+            ):
+                # floating-point formats(such as `gbrpf32le`, `grayf32le` etc.)
+                if rawframe_pixfmt.endswith("le"):
+                    self.__raw_frame_dtype = np.dtype("<f4")
+                else:
+                    self.__raw_frame_dtype = np.dtype(">f4")
             else:
                 # reset to both pixel-format and datatype to default if not supported
                 not (self.__frame_format is None) and logger.warning(
@@ -509,8 +825,27 @@ def formulate(self):
                     "Discarding user-defined `-s` FFmpeg parameter as it can only be assigned with `-custom_resolution` attribute! Read docs for more details."
                 )
                 self.__extra_params.pop("-s", None)
+            # regions of interest are unsupported with YUV pixel formats patch
+            if (
+                self.__rois
+                and rawframe_pixfmt.startswith(("yuv", "nv"))
+                and self.__cv_patch
+            ):
+                logger.warning(
+                    "`-roi` parameter is not supported with `-enforce_cv_patch` parameter. Discarding!"
+                )
+                self.__rois = None
+                self.__roi_multiple = False
             # assign output rawframe resolution
-            if not (self.__custom_resolution is None) and not isinstance(
+            if self.__rois:
+                # crop regions of interest within FFmpeg
+                self.__raw_frame_resolution = self.__cropROIs()
+                self.__verbose_logs and logger.info(
+                    "Cropping `{}` region(s) of interest for this pipeline.".format(
+                        len(self.__rois)
+                    )
+                )
+            elif not (self.__custom_resolution is None) and not isinstance(
                 self.__custom_resolution, str
             ):
                 # assign if assigned by user and not "null"(str)
@@ -624,13 +959,22 @@ def formulate(self):
                     )
                 )
 
+            # apply FFmpeg-side frames selection (if enabled)
+            self.__selectFrames(input_params, output_params)
+
+            # reorder planes of planar RGB(A) frames to RGB(A) order (if applicable)
+            self.__raw_frame_is_planar = self.__raw_frame_pixfmt.startswith(
+                ("gbrp", "gbrap")
+            )
+            self.__raw_frame_is_planar and self.__reorderPlanes(output_params)
+
             # add rest to output parameters
             output_params.update(self.__extra_params)
 
             # dynamically calculate raw-frame numbers based on source (if not assigned by user).
             # TODO Added support for `-re -stream_loop` and `-loop`
-            if "-frames:v" in input_params:
-                self.__raw_frame_num = input_params["-frames:v"]
+            if "-frames:v" in output_params:
+                self.__raw_frame_num = output_params["-frames:v"]
             elif (
                 not (self.__sourcer_metadata["approx_video_nframes"] is None)
                 and self.__sourcer_metadata["approx_video_nframes"] > 0
@@ -642,6 +986,69 @@ def formulate(self):
                 self.__verbose_logs and logger.info(
                     "Number of frames in given source are unknown. Live/Network/Looping stream detected!"
                 )
+            # automatic reconnection is only meant for live sources
+            if self.__auto_reconnect and self.__raw_frame_num:
+                logger.warning(
+                    "Optional `-auto_reconnect` parameter is only available for live sources with unknown number of frames. Discarding!"
+                )
+                self.__auto_reconnect = 0
+            # account selected frames (if enabled and not assigned by user)
+            if not ("-frames:v" in output_params) and (
+                self.__keyframes_only or self.__frame_stride > 1
+            ):
+                self.__accountSelectedFrames()
+
+            # precompute raw-frame geometry once for all frames
+            # and apply YUV pixel formats patch(if applicable)
+            (width, height) = self.__raw_frame_resolution
+            if self.__raw_frame_pixfmt.startswith(("yuv", "nv")) and self.__cv_patch:
+                # exclusive YUV formats frames for OpenCV APIs
+                self.__raw_frame_size = width * (height * 3 // 2)
+                self.__raw_frame_shape = (height * 3 // 2, width)
+            elif self.__raw_frame_is_planar:
+                # planar RGB(A) frames as CHW
+                self.__raw_frame_size = self.__raw_frame_depth * width * height
+                self.__raw_frame_shape = (self.__raw_frame_depth, height, width)
+            else:
+                # default frames
+                self.__raw_frame_size = self.__raw_frame_depth * width * height
+                self.__raw_frame_shape = (height, width, self.__raw_frame_depth)
+                # exclusive `gray` frames
+                self.__raw_frame_is_gray = self.__raw_frame_pixfmt.startswith("gray")
+            self.__raw_frame_nbytes = (
+                self.__raw_frame_size * self.__raw_frame_dtype.itemsize
+            )
+            # preallocate writable frame buffers pool (if enabled)
+            if self.__frame_buffer_pool_size:
+                self.__frame_buffer_pool = [
+                    np.empty(self.__raw_frame_size, dtype=self.__raw_frame_dtype)
+                    for _ in range(self.__frame_buffer_pool_size)
+                ]
+                self.__verbose_logs and logger.debug(
+                    "Preallocated `{}` recyclable frame buffers for this pipeline.".format(
+                        self.__frame_buffer_pool_size
+                    )
+                )
+
+            # create shared memory frames ring (if enabled)
+            if self.__shm_ring_slots:
+                from .framering import SharedFrameRing
+
+                self.__frame_ring = SharedFrameRing(
+                    slots=self.__shm_ring_slots,
+                    frame_shape=(
+                        self.__raw_frame_shape[:2]
+                        if self.__raw_frame_is_gray
+                        else self.__raw_frame_shape
+                    ),
+                    dtype=self.__raw_frame_dtype,
+                    consumers=self.__shm_ring_consumers,
+                )
+                self.__verbose_logs and logger.debug(
+                    "Created `{}` shared memory frames ring with `{}` slots.".format(
+                        self.__frame_ring.name, self.__shm_ring_slots
+                    )
+                )
 
             # log Mode of Operation
             self.__verbose_logs and logger.critical(
@@ -660,153 +1067,1289 @@ def formulate(self):
             logger.error("This pipeline is already created and running!")
         return self
 
-    def __fetchNextfromPipeline(self):
-        """
-        This Internal method to fetch next dataframes(1D arrays) from `subprocess` pipe's standard output(`stdout`) into a Numpy buffer.
+    def __cropROIs(self):
         """
-        assert not (
-            self.__process is None
-        ), "Pipeline is not running! You must call `formulate()` method first."
+        This Internal method adds FFmpeg `crop` filter for single region of interest, or `split` and `crop` filters for multiple
+        regions that are packed into one frame with `vstack` or `hstack` filter (whichever wastes less padding), so that only
+        regions of interest are converted and piped.
 
-        # formulated raw frame size and apply YUV pixel formats patch(if applicable)
-        raw_frame_size = (
-            (self.__raw_frame_resolution[0] * (self.__raw_frame_resolution[1] * 3 // 2))
-            if self.__raw_frame_pixfmt.startswith(("yuv", "nv")) and self.__cv_patch
-            else (
-                self.__raw_frame_depth
-                * self.__raw_frame_resolution[0]
-                * self.__raw_frame_resolution[1]
+        **Returns:** Resolution of raw-frames as `(width, height)` tuple.
+        """
+        (source_width, source_height) = self.__sourcer_metadata[
+            "source_video_resolution"
+        ]
+        crops = []
+        for x, y, w, h in self.__rois:
+            # crop region aligned outward to chroma subsampling grid within source pixel-format
+            # first, so that only fine crop happens after conversion to output pixel-format
+            (left, top) = (x // 4 * 4, y // 4 * 4)
+            (right, bottom) = (
+                min(-(-(x + w) // 4) * 4, source_width),
+                min(-(-(y + h) // 4) * 4, source_height),
+            )
+            crops.append(
+                "crop={}:{}:{}:{},format={}".format(
+                    right - left, bottom - top, left, top, self.__raw_frame_pixfmt
+                )
+                + (
+                    ",crop={}:{}:{}:{}".format(w, h, x - left, y - top)
+                    if (left, top, right, bottom) != (x, y, x + w, y + h)
+                    else ""
+                )
             )
+        if not self.__roi_multiple:
+            self.__extra_params["-vf"] = crops[0]
+            return self.__rois[0][2:]
+        widths = [x[2] for x in self.__rois]
+        heights = [x[3] for x in self.__rois]
+        # stack regions along axis with least padded area
+        vertical = sum(heights) * max(widths) <= max(heights) * sum(widths)
+        (width, height) = (
+            (max(widths), sum(heights)) if vertical else (sum(widths), max(heights))
         )
-        # next dataframe as numpy ndarray
-        nparray = None
-        try:
-            # read bytes frames from buffer
-            nparray = np.frombuffer(
-                self.__process.stdout.read(
-                    raw_frame_size * self.__raw_frame_dtype.itemsize
-                ),
-                dtype=self.__raw_frame_dtype,
+        chains = [
+            "split={}{}".format(
+                len(crops), "".join("[r{}]".format(i) for i in range(len(crops)))
+            )
+        ]
+        self.__roi_slices = []
+        offset = 0
+        for i, (crop, w, h) in enumerate(zip(crops, widths, heights)):
+            # pad regions to common width(or height) for stacking
+            pad = (w, h) != ((width, h) if vertical else (w, height))
+            chains.append(
+                "[r{0}]{1}{2}[p{0}]".format(
+                    i,
+                    crop,
+                    (
+                        ",pad={}:{}:0:0".format(
+                            *((width, h) if vertical else (w, height))
+                        )
+                        if pad
+                        else ""
+                    ),
+                )
+            )
+            self.__roi_slices.append(
+                (slice(offset, offset + h), slice(0, w))
+                if vertical
+                else (slice(0, h), slice(offset, offset + w))
+            )
+            offset += h if vertical else w
+        chains.append(
+            "{}{}=inputs={}".format(
+                "".join("[p{}]".format(i) for i in range(len(crops))),
+                "vstack" if vertical else "hstack",
+                len(crops),
             )
-        except Exception as e:
-            raise RuntimeError("Frame buffering failed with error: {}".format(str(e)))
-        return (
-            nparray
-            if not (nparray is None) and len(nparray) == raw_frame_size
-            else None
         )
+        self.__extra_params["-vf"] = ";".join(chains)
+        return (width, height)
 
-    def __fetchNextFrame(self):
+    def __reorderPlanes(self, output_params):
         """
-        This Internal method grabs and decodes next 3D `ndarray` video-frame from the buffer.
+        This Internal method appends FFmpeg `shuffleplanes` filter to the filtergraph, that reorders planes of planar
+        RGB(A) frames from FFmpeg's `G, B, R(, A)` order to `R, G, B(, A)` order without any pixel-format conversion.
+
+        Parameters:
+            output_params (dict): Output FFmpeg parameters
         """
-        # Read next and reconstruct as numpy array
-        frame = self.__fetchNextfromPipeline()
-        # check if empty
-        if frame is None:
-            return frame
-        elif self.__raw_frame_pixfmt.startswith("gray"):
-            # reconstruct exclusive `gray` frames
-            frame = frame.reshape(
-                (
-                    self.__raw_frame_resolution[1],
-                    self.__raw_frame_resolution[0],
-                    self.__raw_frame_depth,
-                )
-            )[:, :, 0]
-        elif self.__raw_frame_pixfmt.startswith(("yuv", "nv")) and self.__cv_patch:
-            # reconstruct exclusive YUV formats frames for OpenCV APIs
-            frame = frame.reshape(
-                self.__raw_frame_resolution[1] * 3 // 2,
-                self.__raw_frame_resolution[0],
-            )
-        else:
-            # reconstruct default frames
-            frame = frame.reshape(
-                (
-                    self.__raw_frame_resolution[1],
-                    self.__raw_frame_resolution[0],
-                    self.__raw_frame_depth,
+        if "-filter_complex" in self.__extra_params:
+            # cannot be safely chained with complex filtergraphs
+            logger.warning(
+                "Planes of `{}` frames remain in FFmpeg's `G, B, R` order with `-filter_complex` FFmpeg parameter!".format(
+                    self.__raw_frame_pixfmt
                 )
             )
-        # return frame
-        return frame
+            return
+        shuffle = "format={},shuffleplanes=2:0:1{}".format(
+            self.__raw_frame_pixfmt, ":3" if self.__raw_frame_depth == 4 else ""
+        )
+        filters = output_params.pop("-vf", None) or self.__extra_params.pop("-vf", "")
+        output_params["-vf"] = "{},{}".format(filters, shuffle) if filters else shuffle
 
-    def generateFrame(self):
+    def __splitROIs(self, frame, batched=False):
         """
-        This method returns a [Generator function](https://wiki.python.org/moin/Generators)
-        _(also an Iterator using `next()`)_ of video frames, grabbed continuously from the buffer.
+        This Internal method splits packed frame(or batch of frames) of multiple regions of interest into zero-copy views of each region.
+
+        Parameters:
+            frame (ndarray): packed frame or batch of frames.
+            batched (bool): whether frame is a batch of frames.
+
+        **Returns:** List of `ndarray` regions, in order of `-roi` parameter value.
         """
-        if self.__raw_frame_num is None or not self.__raw_frame_num:
-            while not self.__terminate_stream:  # infinite raw frames
-                frame = self.__fetchNextFrame()
-                if frame is None:
-                    self.__terminate_stream = True
-                    break
-                yield frame
-        else:
-            for _ in range(self.__raw_frame_num):  # finite raw frames
-                frame = self.__fetchNextFrame()
-                if frame is None:
-                    self.__terminate_stream = True
-                    break
-                yield frame
+        return [
+            (
+                frame[..., rows, columns]
+                if self.__raw_frame_is_planar or self.__raw_frame_is_gray
+                else frame[:, rows, columns] if batched else frame[rows, columns]
+            )
+            for (rows, columns) in self.__roi_slices
+        ]
 
-    def __enter__(self):
+    def __selectFrames(self, input_params, output_params):
         """
-        Handles entry with the `with` statement. See [PEP343 -- The 'with' statement'](https://peps.python.org/pep-0343/).
+        This Internal method adds FFmpeg parameters for decode-time frames selection, i.e. `-skip_frame nokey` for decoding only keyframes,
+        and `select` filter for keeping every Nth frame, along with passthrough video sync method so that FFmpeg doesn't duplicate frames
+        to fill the gaps.
 
-        **Returns:** Output of `formulate()` method.
+        Parameters:
+            input_params (dict): Input FFmpeg parameters
+            output_params (dict): Output FFmpeg parameters
         """
-        return self.formulate()
+        if self.__frame_stride > 1:
+            if "-filter_complex" in self.__extra_params:
+                # select filter cannot be safely chained with complex filtergraphs
+                logger.warning(
+                    "`-frame_stride` parameter is not supported with `-filter_complex` FFmpeg parameter. Discarding!"
+                )
+                self.__frame_stride = 1
+            else:
+                # select frames before user-defined filters (if any)
+                select = "select=not(mod(n\\,{}))".format(self.__frame_stride)
+                user_filters = self.__extra_params.pop("-vf", "")
+                output_params["-vf"] = (
+                    "{},{}".format(select, user_filters) if user_filters else select
+                )
+        if self.__keyframes_only:
+            # skip decoding of non-keyframes completely
+            input_params["-skip_frame"] = "nokey"
+        if (self.__keyframes_only or self.__frame_stride > 1) and not set(
+            ["-vsync", "-fps_mode"]
+        ).intersection(self.__extra_params.keys()):
+            # `-fps_mode` replaced `-vsync` in FFmpeg 5.1
+            version = re.match(
+                r"n?(\d+)\.(\d+)", FFmpegCapabilities.get(self.__ffmpeg).version
+            )
+            legacy = version and (int(version.group(1)), int(version.group(2))) < (5, 1)
+            output_params["-vsync" if legacy else "-fps_mode"] = "passthrough"
+        self.__verbose_logs and (
+            self.__keyframes_only or self.__frame_stride > 1
+        ) and logger.info(
+            "Selecting {}{} for this pipeline.".format(
+                (
+                    "every {} ".format(self.__frame_stride)
+                    if self.__frame_stride > 1
+                    else ""
+                ),
+                "keyframes" if self.__keyframes_only else "frames",
+            )
+        )
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
+    def __accountSelectedFrames(self):
         """
-        Handles exit with the `with` statement. See [PEP343 -- The 'with' statement'](https://peps.python.org/pep-0343/).
+        This Internal method updates number of raw-frames and framerate metadata to match decode-time frames selection.
+        Number and rate of keyframes are unknown beforehand, so they're read until EOF.
         """
-        self.terminate()
+        framerate = self.__rawFrameRate()
+        if self.__keyframes_only:
+            # number and rate of keyframes are unknown
+            self.__raw_frame_num = None
+            framerate = 0.0
+        if self.__frame_stride > 1:
+            self.__raw_frame_num = (
+                -(-self.__raw_frame_num // self.__frame_stride)
+                if self.__raw_frame_num
+                else self.__raw_frame_num
+            )
+            framerate /= self.__frame_stride
+        # update metadata, whereas output framerate overrides any source counterpart
+        self.__sourcer_metadata["approx_video_nframes"] = self.__raw_frame_num
+        self.__missing_prop["output_framerate"] = framerate
 
-    @property
-    def metadata(self):
+    def __fetchNextfromPipeline(self, out=None):
         """
-        A property object that dumps metadata information as JSON string.
+        This Internal method to fetch next dataframes(1D arrays) from `subprocess` pipe's standard output(`stdout`) into a Numpy buffer.
 
-        **Returns:** Metadata as JSON string.
+        Parameters:
+            out (ndarray): writable buffer to read dataframe into (if any).
         """
-        # import dependency
-        import json
+        assert not (
+            self.__process is None
+        ), "Pipeline is not running! You must call `formulate()` method first."
 
-        # return complete metadata information as JSON string
-        return json.dumps(
-            {
-                **self.__sourcer_metadata,  # source video
-                **self.__missing_prop,  # missing properties
-                **self.__user_metadata,  # user-defined
-            },
-            indent=2,
-        )
+        # choose user-defined or next recyclable buffer (if available)
+        if out is None and self.__frame_buffer_pool:
+            out = self.__frame_buffer_pool[self.__frame_buffer_index]
+            self.__frame_buffer_index = (self.__frame_buffer_index + 1) % len(
+                self.__frame_buffer_pool
+            )
+        while True:
+            # next dataframe as numpy ndarray
+            nparray = None
+            try:
+                if out is None:
+                    # read bytes frames from buffer
+                    nparray = np.frombuffer(
+                        self.__process.stdout.read(self.__raw_frame_nbytes),
+                        dtype=self.__raw_frame_dtype,
+                    )
+                else:
+                    # read bytes frames directly into writable buffer
+                    nparray = (
+                        out.reshape(-1)
+                        if self.__readintoBuffer(out) == self.__raw_frame_nbytes
+                        else None
+                    )
+            except Exception as e:
+                raise RuntimeError(
+                    "Frame buffering failed with error: {}".format(str(e))
+                )
+            if not (nparray is None) and len(nparray) == self.__raw_frame_size:
+                # record recovery of dropped stream (if any)
+                not (self.__reconnect_down_since is None) and self.__recordRecovery()
+                return nparray
+            # relaunch pipeline on short read (if enabled), otherwise end stream
+            if not self.__reconnectPipeline():
+                return None
+
+    def __readintoBuffer(self, buffer, stream=None):
+        """
+        This Internal method reads bytes from `subprocess` pipe's standard output(`stdout`) directly into given writable buffer, until it is full or stream ends.
 
-    @metadata.setter
-    def metadata(self, value):
+        Parameters:
+            buffer (ndarray): writable C-contiguous buffer.
+            stream (file): readable binary stream to read from, otherwise pipeline's `stdout` if `None`.
+
+        **Returns:** Number of bytes read.
         """
-        A property object that updates metadata information with user-defined dictionary.
+        stream = self.__process.stdout if stream is None else stream
+        view = memoryview(buffer.reshape(-1).view(np.uint8))
+        nbytes = 0
+        while nbytes < len(view):
+            nread = stream.readinto(view[nbytes:])
+            if not nread:
+                break
+            nbytes += nread
+        return nbytes
+
+    def __fetchNextBatch(self, batch_size, out=None):
+        """
+        This Internal method grabs and decodes next batch of 3D `ndarray` video-frames from the buffer
+        as a single contiguous 4D `ndarray`.
 
         Parameters:
-            value (dict): User-defined dictionary.
+            batch_size (int): number of frames to grab.
+            out (ndarray): preallocated contiguous batch of atleast `batch_size` frames to read frames into (if any).
+
+        **Returns:** Batch of frames or `None` if stream ended.
         """
-        # check if value dict type
-        if value and isinstance(value, dict):
-            # log it
-            self.__verbose_logs and logger.info("Updating Metadata...")
-            # extract any source and output internal metadata keys
-            default_keys = set(value).intersection(
-                {**self.__sourcer_metadata, **self.__missing_prop}
+        assert not (
+            self.__process is None
+        ), "Pipeline is not running! You must call `formulate()` method first."
+        # preallocate contiguous batch (if not given)
+        batch = (
+            np.empty(
+                (batch_size,) + self.__batchFrameShape(),
+                dtype=self.__raw_frame_dtype,
             )
-            # counterpart source properties for each output properties
-            counterpart_prop = {
-                "output_frames_resolution": "source_video_resolution",
-                "output_frames_pixfmt": "source_video_pixfmt",
-                "output_framerate": "source_video_framerate",
+            if out is None
+            else out[:batch_size]
+        )
+        if self.__prefetch_frames:
+            # fill batch from prefetched frames
+            num_frames = 0
+            while num_frames < batch_size:
+                frame = self.__fetchPrefetchedFrame(out=batch[num_frames])
+                if frame is None:
+                    break
+                num_frames += 1
+        else:
+            # read all frames with one large read, resuming after reconnects (if enabled)
+            num_frames = 0
+            while num_frames < batch_size:
+                try:
+                    nframes = (
+                        self.__readintoBuffer(batch[num_frames:])
+                        // self.__raw_frame_nbytes
+                    )
+                except Exception as e:
+                    raise RuntimeError(
+                        "Frame buffering failed with error: {}".format(str(e))
+                    )
+                num_frames += nframes
+                # record recovery of dropped stream (if any)
+                nframes and not (
+                    self.__reconnect_down_since is None
+                ) and self.__recordRecovery()
+                # relaunch pipeline on short read (if enabled), otherwise end stream
+                if num_frames < batch_size and not self.__reconnectPipeline():
+                    break
+        # return complete or short final batch
+        return batch[:num_frames] if num_frames else None
+
+    def __fetchNextFrame(self, out=None):
+        """
+        This Internal method grabs and decodes next 3D `ndarray` video-frame from the buffer.
+
+        Parameters:
+            out (ndarray): writable buffer to read frame into (if any).
+        """
+        # use instrumented counterpart (if enabled)
+        if not (self.__latency_stats is None):
+            return self.__fetchNextFrameInstrumented(out=out)
+        # Read next and reconstruct as numpy array
+        frame = self.__fetchNextfromPipeline(out=out)
+        # check if empty
+        if frame is None or not (out is None):
+            return frame if frame is None else out
+        # reconstruct frames using precomputed shape
+        frame = frame.reshape(self.__raw_frame_shape)
+        # return exclusive `gray` frames or default frames
+        return frame[:, :, 0] if self.__raw_frame_is_gray else frame
+
+    def __fetchNextFrameInstrumented(self, out=None):
+        """
+        This Internal method is the counterpart of `__fetchNextFrame()` method, that also records pipe read and reshape latencies.
+
+        Parameters:
+            out (ndarray): writable buffer to read frame into (if any).
+        """
+        start = time.perf_counter()
+        if self.__latency_start is None:
+            self.__latency_start = start
+        # Read next and reconstruct as numpy array
+        frame = self.__fetchNextfromPipeline(out=out)
+        end = time.perf_counter()
+        self.__latency_stats["pipe_read"].record(end - start)
+        # check if empty
+        if frame is None:
+            return None
+        self.__latency_bytes += self.__raw_frame_nbytes
+        if not (out is None):
+            return out
+        # reconstruct frames using precomputed shape
+        frame = frame.reshape(self.__raw_frame_shape)
+        # return exclusive `gray` frames or default frames
+        frame = frame[:, :, 0] if self.__raw_frame_is_gray else frame
+        self.__latency_stats["reshape"].record(time.perf_counter() - end)
+        return frame
+
+    def __prefetchFrames(self):
+        """
+        This Internal method continuously reads next frames into the bounded
+        prefetch queue, until stream ends or is terminated.
+        """
+        frame = None
+        try:
+            while not self.__terminate_stream:
+                frame = self.__fetchNextFrame()
+                if frame is None:
+                    break
+                self.__prefetch_stats["frames_prefetched"] += 1
+                try:
+                    self.__prefetch_queue.put_nowait(frame)
+                except Full:
+                    if self.__latest_frame_only:
+                        # overwrite stalest frame, as only this thread puts frames
+                        try:
+                            self.__prefetch_queue.get_nowait()
+                            self.__prefetch_stats["frames_dropped"] += 1
+                        except Empty:
+                            pass
+                        self.__prefetch_queue.put_nowait(frame)
+                        continue
+                    # consumer is lagging behind
+                    self.__prefetch_stats["producer_stalls"] += 1
+                    while not self.__terminate_stream:
+                        try:
+                            self.__prefetch_queue.put(frame, timeout=0.1)
+                            break
+                        except Full:
+                            continue
+        except Exception as e:
+            # handover error to consumer unless terminating
+            if not self.__terminate_stream:
+                self.__prefetch_error = e
+        finally:
+            # signal end of stream
+            while not self.__terminate_stream:
+                try:
+                    self.__prefetch_queue.put(None, timeout=0.1)
+                    break
+                except Full:
+                    continue
+
+    def __fetchPrefetchedFrame(self, out=None):
+        """
+        This Internal method grabs next prefetched 3D `ndarray` video-frame from the bounded queue.
+
+        Parameters:
+            out (ndarray): writable buffer to copy frame into (if any).
+        """
+        # start reader thread on first run
+        if self.__prefetch_thread is None:
+            self.__prefetch_queue = Queue(maxsize=self.__prefetch_frames)
+            self.__prefetch_thread = threading.Thread(
+                target=self.__prefetchFrames, name="FFdecoder-prefetch", daemon=True
+            )
+            self.__prefetch_thread.start()
+            self.__verbose_logs and logger.debug(
+                "Prefetching upto `{}` frames in background thread.".format(
+                    self.__prefetch_frames
+                )
+            )
+        try:
+            frame = self.__prefetch_queue.get_nowait()
+        except Empty:
+            # reader thread is lagging behind
+            self.__prefetch_stats["consumer_stalls"] += 1
+            frame = None
+            while not self.__terminate_stream:
+                try:
+                    frame = self.__prefetch_queue.get(timeout=0.1)
+                    break
+                except Empty:
+                    if not self.__prefetch_thread.is_alive():
+                        break
+        # raise if reader thread failed
+        if frame is None and not (self.__prefetch_error is None):
+            raise self.__prefetch_error
+        # copy into user-defined buffer (if any)
+        if not (frame is None or out is None):
+            np.copyto(out, frame.reshape(out.shape))
+            frame = out
+        return frame
+
+    def generateFrame(self, out=None):
+        """
+        This method returns a [Generator function](https://wiki.python.org/moin/Generators)
+        _(also an Iterator using `next()`)_ of video frames, grabbed continuously from the buffer.
+
+        Parameters:
+            out (ndarray): user-defined writable C-contiguous buffer of exactly same shape and dtype as frames, to which every frame is directly read into. Each yielded frame is this buffer itself _(or list of its views of every region for multiple regions of interest)_.
+
+        !!! note "If multiple regions of interest are defined with `-roi` parameter, each item is a list of `ndarray` views of every region instead."
+        """
+        # validate user-defined output buffer (if any)
+        if not (out is None) and not (
+            isinstance(out, np.ndarray)
+            and out.dtype == self.__raw_frame_dtype
+            and out.shape == self.__batchFrameShape()
+            and out.flags.c_contiguous
+            and out.flags.writeable
+        ):
+            raise ValueError(
+                "Invalid `out` buffer! It must be a writable C-contiguous ndarray of `{}` shape and `{}` dtype.".format(
+                    self.__batchFrameShape(), self.__raw_frame_dtype
+                )
+            )
+        # choose frames source
+        fetch_frame = (
+            self.__fetchPrefetchedFrame
+            if self.__prefetch_frames
+            else self.__fetchNextFrame
+        )
+        # record time spent by consumer between frames (if enabled)
+        consumer_latency = (
+            None if self.__latency_stats is None else self.__latency_stats["consumer"]
+        )
+        if self.__raw_frame_num is None or not self.__raw_frame_num:
+            while not self.__terminate_stream:  # infinite raw frames
+                frame = fetch_frame(out=out)
+                if frame is None:
+                    self.__terminate_stream = True
+                    break
+                if consumer_latency is None:
+                    yield self.__splitROIs(frame) if self.__roi_multiple else frame
+                else:
+                    start = time.perf_counter()
+                    yield self.__splitROIs(frame) if self.__roi_multiple else frame
+                    consumer_latency.record(time.perf_counter() - start)
+        else:
+            for _ in range(self.__raw_frame_num):  # finite raw frames
+                frame = fetch_frame(out=out)
+                if frame is None:
+                    self.__terminate_stream = True
+                    break
+                if consumer_latency is None:
+                    yield self.__splitROIs(frame) if self.__roi_multiple else frame
+                else:
+                    start = time.perf_counter()
+                    yield self.__splitROIs(frame) if self.__roi_multiple else frame
+                    consumer_latency.record(time.perf_counter() - start)
+
+    def generateSharedFrame(self, timeout=None):
+        """
+        This method returns a [Generator function](https://wiki.python.org/moin/Generators)
+        _(also an Iterator using `next()`)_ of lightweight picklable `SharedFrameHandle(slot, seq)` handles to video frames,
+        that are directly written into shared memory frames ring _(enabled with `-shm_ring_slots` parameter)_.
+
+        Consumers in other processes can attach to this ring using its name _(available with `frame_ring` property object)_
+        for mapping these handles to zero-copy `ndarray` views. A slot is reused only after all consumers have released its frame.
+
+        Parameters:
+            timeout (float): maximum time in seconds to wait for a free slot, or wait indefinitely if `None`. Generator ends on timeout.
+        """
+        assert not (
+            self.__frame_ring is None
+        ), "Shared memory frames ring is not available! You must define `-shm_ring_slots` parameter and call `formulate()` method first."
+        # choose frames source
+        fetch_frame = (
+            self.__fetchPrefetchedFrame
+            if self.__prefetch_frames
+            else self.__fetchNextFrame
+        )
+        frames_left = self.__raw_frame_num if self.__raw_frame_num else None
+        while not self.__terminate_stream and (frames_left is None or frames_left > 0):
+            # wait for a free slot
+            reserved = self.__frame_ring.reserve(
+                timeout=timeout, abort=lambda: self.__terminate_stream
+            )
+            if reserved is None:
+                self.__verbose_logs and not self.__terminate_stream and logger.warning(
+                    "Timed out waiting for consumers to release a frames ring slot!"
+                )
+                break
+            (slot, seq, slot_frame) = reserved
+            # write next frame directly into slot
+            if fetch_frame(out=slot_frame) is None:
+                self.__terminate_stream = True
+                break
+            if not (frames_left is None):
+                frames_left -= 1
+            yield self.__frame_ring.publish(slot, seq)
+
+    def __batchFrameShape(self):
+        """
+        This Internal method returns shape of each frame within batches.
+        """
+        return (
+            self.__raw_frame_shape[:2]
+            if self.__raw_frame_is_gray
+            else self.__raw_frame_shape
+        )
+
+    def __normalizationParams(self, mean, std):
+        """
+        This Internal method validates per-channel normalization values and reshapes them for broadcasting over batches.
+
+        Parameters:
+            mean (int, float, list, tuple): mean value(s) to subtract.
+            std (int, float, list, tuple): standard deviation value(s) to divide by.
+
+        **Returns:** A tuple of broadcastable `float32` mean and reciprocal of standard deviation arrays.
+        """
+        frame_shape = self.__batchFrameShape()
+        # channels axis of planar or packed frames, and none otherwise
+        if self.__raw_frame_is_planar:
+            (channels, shape) = (frame_shape[0], (frame_shape[0], 1, 1))
+        elif len(frame_shape) == 3:
+            (channels, shape) = (frame_shape[-1], (frame_shape[-1],))
+        else:
+            (channels, shape) = (1, ())
+        values = []
+        for name, value, default in [("mean", mean, 0.0), ("std", std, 1.0)]:
+            value = np.asarray(default if value is None else value, dtype=np.float32)
+            if not (value.size == 1 or value.size == channels) or (
+                name == "std" and not np.all(value)
+            ):
+                raise ValueError(
+                    "Invalid `{}` value: `{}`! It must be a non-zero number or a sequence of `{}` non-zero numbers.".format(
+                        name, value.tolist(), channels
+                    )
+                    if name == "std"
+                    else "Invalid `mean` value: `{}`! It must be a number or a sequence of `{}` numbers.".format(
+                        value.tolist(), channels
+                    )
+                )
+            values.append(value.reshape(shape) if value.size > 1 else value.reshape(()))
+        (mean, std) = values
+        return (mean, np.reciprocal(std))
+
+    def generateBatch(self, batch_size, mean=None, std=None):
+        """
+        This method returns a [Generator function](https://wiki.python.org/moin/Generators)
+        _(also an Iterator using `next()`)_ of video frames batches, grabbed continuously from the buffer
+        as contiguous 4D `ndarray` of shape `(N, height, width, channels)` _(or `(N, height, width)` for gray frames,
+        and `(N, channels, height, width)` for planar frames such as `gbrp`, `gbrpf32le`)_.
+
+        If `mean` or `std` is defined, every batch is normalized per channel as `(frame - mean) / std` with vectorized in-place
+        operations into a preallocated `float32` batch, which is read directly into in case of `float32` frames _(such as `gbrpf32le`,
+        `grayf32le`)_, thereby without any full-frame temporaries. Such normalized batch is reused for every batch, so it must be
+        consumed(or copied) before next one.
+
+        Parameters:
+            batch_size (int): number of frames in each batch. Final batch may contain fewer frames at end of stream.
+            mean (int, float, list, tuple): mean value per channel _(or for all channels)_, in units of frame values _(i.e. `0-255` for `gbrp`, and `0.0-1.0` for `gbrpf32le`)_.
+            std (int, float, list, tuple): standard deviation value per channel _(or for all channels)_, in units of frame values.
+
+        !!! note "If multiple regions of interest are defined with `-roi` parameter, each item is a list of 4D `ndarray` views of every region instead."
+        """
+        # validate batch size
+        if (
+            not isinstance(batch_size, int)
+            or isinstance(batch_size, bool)
+            or batch_size < 1
+        ):
+            raise ValueError(
+                "Invalid `batch_size` value: `{}`! It must be a positive integer.".format(
+                    batch_size
+                )
+            )
+        # preallocate raw and normalized batches (if normalizing)
+        raw_batch = None
+        normalize = not (mean is None and std is None)
+        if normalize:
+            (mean, inv_std) = self.__normalizationParams(mean, std)
+            raw_batch = np.empty(
+                (batch_size,) + self.__batchFrameShape(), dtype=self.__raw_frame_dtype
+            )
+            normalized_batch = (
+                raw_batch
+                if self.__raw_frame_dtype == np.float32
+                else np.empty(raw_batch.shape, dtype=np.float32)
+            )
+        # handle remaining raw frames (if finite)
+        frames_left = self.__raw_frame_num if self.__raw_frame_num else None
+        while not self.__terminate_stream:
+            num_frames = (
+                batch_size if frames_left is None else min(batch_size, frames_left)
+            )
+            if num_frames < 1:
+                break
+            batch = self.__fetchNextBatch(num_frames, out=raw_batch)
+            if batch is None:
+                self.__terminate_stream = True
+                break
+            if not (frames_left is None):
+                frames_left -= len(batch)
+            if normalize:
+                # normalize in-place
+                normalized = normalized_batch[: len(batch)]
+                np.subtract(batch, mean, out=normalized)
+                np.multiply(normalized, inv_std, out=normalized)
+                batch = normalized
+            yield (
+                self.__splitROIs(batch, batched=True) if self.__roi_multiple else batch
+            )
+            if len(batch) < num_frames:
+                # stream ended with short final batch
+                self.__terminate_stream = True
+                break
+
+    def __buildKeyframeIndex(self, framerate):
+        """
+        This Internal method builds index of keyframes _(as frame numbers)_ in the source once, by decoding only
+        its keyframes with FFmpeg `-skip_frame nokey` parameter and reading their timestamps with `showinfo` filter.
+
+        Parameters:
+            framerate (float): raw-frames framerate for converting timestamps to frame numbers.
+
+        **Returns:** Sorted list of keyframe numbers.
+        """
+        if self.__keyframe_index is None:
+            cmd = (
+                [self.__ffmpeg, "-hide_banner", "-skip_frame", "nokey"]
+                + (
+                    ["-f", self.__sourcer_metadata["source_demuxer"]]
+                    if ("source_demuxer" in self.__sourcer_metadata.keys())
+                    else []
+                )
+                + ["-i", self.__sourcer_metadata["source"]]
+                + ["-an", "-sn", "-vf", "showinfo", "-f", "null", "-"]
+            )
+            self.__verbose_logs and logger.debug(
+                "Building keyframe index with FFmpeg command: `{}`".format(
+                    " ".join(cmd)
+                )
+            )
+            output = check_sp_output(cmd, force_retrieve_stderr=True).decode("utf-8")
+            # convert keyframe timestamps to frame numbers
+            keyframes = {0}  # source can always be decoded from start
+            for pts_time in re.findall(
+                r"Parsed_showinfo.*?pts_time:\s*(-?\d+(?:\.\d+)?)", output
+            ):
+                keyframes.add(max(int(round(float(pts_time) * framerate)), 0))
+            self.__keyframe_index = sorted(keyframes)
+            self.__verbose_logs and logger.debug(
+                "Found `{}` keyframes in the source.".format(len(self.__keyframe_index))
+            )
+        return self.__keyframe_index
+
+    def __seekCommand(self, keyframe, framerate, num_frames):
+        """
+        This Internal method derives FFmpeg command from the formulated pipeline, that seeks the input to given keyframe
+        and decodes given number of frames from it.
+
+        Parameters:
+            keyframe (int): keyframe number to seek to.
+            framerate (float): raw-frames framerate.
+            num_frames (int): number of frames to decode.
+
+        **Returns:** FFmpeg command as list.
+        """
+        cmd = self.__ffmpeg_cmd
+        # find input source position in formulated command
+        input_pos = next(
+            i
+            for i, x in enumerate(cmd[:-1])
+            if x == "-i" and cmd[i + 1] == self.__sourcer_metadata["source"]
+        )
+        # discard any user-defined output frames limit
+        output_parameters = []
+        parameters = iter(cmd[input_pos + 2 : -3])
+        for param in parameters:
+            if param in ["-frames:v", "-vframes"]:
+                next(parameters, None)
+            else:
+                output_parameters.append(param)
+        # seek half a frame past keyframe, so demuxer lands exactly on it
+        # irrespective of timestamps rounding, and output starts from there.
+        seek_parameters = (
+            [
+                "-noaccurate_seek",
+                "-ss",
+                "{:.6f}".format((keyframe + 0.5) / framerate),
+            ]
+            if keyframe
+            else []
+        )
+        return (
+            cmd[:input_pos]
+            + seek_parameters
+            + cmd[input_pos : input_pos + 2]
+            + output_parameters
+            + ["-frames:v", str(num_frames)]
+            + cmd[-3:]
+        )
+
+    def __launchSeekProcess(self, keyframe, framerate, num_frames):
+        """
+        This Internal method executes FFmpeg command seeking to given keyframe inside a new `subprocess` pipe.
+
+        Parameters:
+            keyframe (int): keyframe number to seek to.
+            framerate (float): raw-frames framerate.
+            num_frames (int): number of frames to decode.
+
+        **Returns:** A `subprocess.Popen` object.
+        """
+        cmd = self.__seekCommand(keyframe, framerate, num_frames)
+        self.__verbose_logs and logger.debug(
+            "Executing FFmpeg command: `{}`".format(" ".join(cmd))
+        )
+        return sp.Popen(
+            cmd,
+            stdin=sp.DEVNULL,
+            stdout=sp.PIPE,
+            stderr=None if self.__verbose_logs else sp.DEVNULL,
+            creationflags=(  # this prevents ffmpeg creation window from opening when building exe files on Windows
+                sp.DETACHED_PROCESS if self.__ffmpeg_window_disabler_patch else 0
+            ),
+        )
+
+    @staticmethod
+    def __reapSeekProcess(process):
+        """
+        This Internal method safely closes given seeking `subprocess` pipe and waits for it to exit.
+
+        Parameters:
+            process (subprocess.Popen): process to be reaped.
+        """
+        process.stdout.close()
+        process.poll() is None and process.terminate()
+        process.wait()
+
+    def __rawFrameRate(self):
+        """
+        This Internal method returns the framerate at which FFmpeg outputs raw-frames, i.e. the `fps` filter
+        value _(if defined)_ or otherwise the source framerate.
+        """
+        return (
+            self.__sourcer_metadata["output_framerate"]
+            if "output_framerate" in self.__sourcer_metadata
+            and self.__sourcer_metadata["output_framerate"] > 0.0
+            else self.__sourcer_metadata["source_video_framerate"]
+        )
+
+    def get_frame(self, index):
+        """
+        This method grabs and decodes a single 3D `ndarray` video-frame at given frame number
+        with frame-accurate random access. See `get_frames()` method for more details.
+
+        Parameters:
+            index (int): zero-based frame number.
+
+        **Returns:** A 3D `ndarray` video-frame, or `None` if it is beyond end of source.
+        """
+        return self.get_frames([index])[0]
+
+    def get_frames(self, indices):
+        """
+        This method grabs and decodes 3D `ndarray` video-frames at given frame numbers with frame-accurate random access,
+        independent of frames generated by other methods.
+
+        A keyframe index is built once per source on first call. Requested frames are then grouped by their preceding keyframe,
+        and each group is decoded by a single FFmpeg subprocess that seeks(input-side `-ss`) directly to that keyframe and
+        decodes forward only upto the last requested frame in the group. Nearby requests thereby share one subprocess.
+
+        !!! warning "Random access requires a constant framerate source with known number of frames, and FFmpeg filters that alter frames timing _(such as `select`)_ are not supported."
+
+        Parameters:
+            indices (list): zero-based frame numbers, in any order and may contain duplicates.
+
+        **Returns:** A list of 3D `ndarray` video-frames in the requested order, with `None` for frames beyond end of source.
+        """
+        assert not (
+            self.__ffmpeg_cmd is None
+        ), "Pipeline is not formulated! You must call `formulate()` method first."
+        # validate frame numbers
+        if not isinstance(indices, (list, tuple)) or not all(
+            isinstance(x, int) and not isinstance(x, bool) and x >= 0 for x in indices
+        ):
+            raise ValueError(
+                "Invalid `indices` value: `{}`! It must be a list of non-negative integers.".format(
+                    indices
+                )
+            )
+        # random access is only possible within finite sources
+        if not self.__raw_frame_num:
+            raise RuntimeError(
+                "Random access is only supported for sources with known number of frames!"
+            )
+        # selected frames don't map to source frame numbers
+        if self.__keyframes_only or self.__frame_stride > 1:
+            raise RuntimeError(
+                "Random access is not supported with `-frame_stride` or `-keyframes_only` parameters!"
+            )
+        framerate = self.__rawFrameRate()
+        keyframes = self.__buildKeyframeIndex(framerate)
+        # group requested frames by preceding keyframe, and append to previous group instead
+        # if there's no keyframe in between, since decoding simply continues forward.
+        groups = []
+        for index in sorted(set(indices)):
+            keyframe = keyframes[bisect_right(keyframes, index) - 1]
+            if groups and keyframe <= groups[-1][1][-1]:
+                groups[-1][1].append(index)
+            else:
+                groups.append((keyframe, [index]))
+        # decode each group with one subprocess
+        frames = {}
+        scratch = np.empty(self.__raw_frame_shape, dtype=self.__raw_frame_dtype)
+        for keyframe, group in groups:
+            process = self.__launchSeekProcess(
+                keyframe, framerate, group[-1] - keyframe + 1
+            )
+            try:
+                wanted = set(group)
+                for position in range(keyframe, group[-1] + 1):
+                    # read wanted frames into new arrays and discard rest
+                    frame = (
+                        np.empty(self.__raw_frame_shape, dtype=self.__raw_frame_dtype)
+                        if position in wanted
+                        else scratch
+                    )
+                    if (
+                        self.__readintoBuffer(frame, stream=process.stdout)
+                        != self.__raw_frame_nbytes
+                    ):
+                        break
+                    if position in wanted:
+                        frames[position] = (
+                            frame[:, :, 0] if self.__raw_frame_is_gray else frame
+                        )
+            finally:
+                self.__reapSeekProcess(process)
+        return [
+            (
+                self.__splitROIs(frames[index])
+                if self.__roi_multiple and index in frames
+                else frames.get(index)
+            )
+            for index in indices
+        ]
+
+    def __decodeSegment(self, process, start, frames_queue, stop):
+        """
+        This Internal method continuously reads frames of a segment from its `subprocess` pipe into given bounded queue
+        as `(frame number, frame)` tuples, until segment ends or decoding is stopped.
+
+        Parameters:
+            process (subprocess.Popen): segment decoding process.
+            start (int): frame number of first frame in segment.
+            frames_queue (queue.Queue): bounded frames queue.
+            stop (threading.Event): signals decoding must be stopped.
+        """
+        error = None
+        try:
+            index = start
+            while not (stop.is_set() or self.__terminate_stream):
+                frame = np.empty(self.__raw_frame_shape, dtype=self.__raw_frame_dtype)
+                if (
+                    self.__readintoBuffer(frame, stream=process.stdout)
+                    != self.__raw_frame_nbytes
+                ):
+                    break
+                if not self.__putSegmentItem(frames_queue, (index, frame), stop):
+                    break
+                index += 1
+        except Exception as e:
+            # handover error to consumer
+            error = e
+        finally:
+            # signal end of segment
+            self.__putSegmentItem(frames_queue, (None, error), stop)
+
+    def __putSegmentItem(self, frames_queue, item, stop):
+        """
+        This Internal method puts given item into bounded queue, waiting until there's room or decoding is stopped.
+
+        **Returns:** A boolean value, confirming whether item was queued, or not?
+        """
+        while not (stop.is_set() or self.__terminate_stream):
+            try:
+                frames_queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def __getSegmentItem(self, frames_queue):
+        """
+        This Internal method gets next item from given bounded queue, waiting until available or pipeline is terminated.
+
+        **Returns:** A `(frame number, frame)` tuple, or `(None, error)` tuple at end of segment.
+        """
+        while not self.__terminate_stream:
+            try:
+                return frames_queue.get(timeout=0.1)
+            except Empty:
+                continue
+        return (None, None)
+
+    def generateFrameParallel(
+        self, segments=None, ordered=True, queue_size=16, buffer_limit=512 * 2**20
+    ):
+        """
+        This method returns a [Generator function](https://wiki.python.org/moin/Generators)
+        _(also an Iterator using `next()`)_ of video frames, decoded in parallel by splitting the source into multiple segments.
+
+        The source is split evenly into given number of segments by frames count _(calculated from source duration)_, with each
+        boundary snapped to its preceding keyframe. Every segment is then decoded by its own FFmpeg subprocess that seeks
+        directly to its keyframe, and a background thread reads its frames into a bounded queue. This way decoding of a single
+        source can scale across many CPU cores, and is meant for offline bulk processing where total throughput matters more
+        than per-frame latency.
+
+        !!! warning "Parallel decoding requires a constant framerate source with known number of frames, and FFmpeg filters that alter frames timing _(such as `select`)_ are not supported."
+
+        !!! tip "In ordered mode, segments ahead of current one keep decoding into their buffers, which are sized upto their whole length within `buffer_limit` bytes in total, and not less than `queue_size` frames. Any segment whose buffer is full waits for its turn, so use unordered mode for maximum throughput with limited memory."
+
+        Parameters:
+            segments (int): number of segments to decode in parallel. Defaults to number of CPU cores. Fewer segments are used if source has fewer keyframes.
+            ordered (bool): whether to yield frames in order, or as soon as available as `(frame number, frame)` tuples.
+            queue_size (int): minimum number of decoded frames buffered for each segment.
+            buffer_limit (int): total memory budget _(in bytes)_ for frames buffered by segments ahead of current one in ordered mode.
+        """
+        assert not (
+            self.__ffmpeg_cmd is None
+        ), "Pipeline is not formulated! You must call `formulate()` method first."
+        # validate parameters
+        for name, value in [
+            ("segments", segments),
+            ("queue_size", queue_size),
+            ("buffer_limit", buffer_limit),
+        ]:
+            if not (name == "segments" and value is None) and (
+                not isinstance(value, int) or isinstance(value, bool) or value < 1
+            ):
+                raise ValueError(
+                    "Invalid `{}` value: `{}`! It must be a positive integer.".format(
+                        name, value
+                    )
+                )
+        # parallel decoding is only possible within finite sources
+        if not self.__raw_frame_num:
+            raise RuntimeError(
+                "Parallel decoding is only supported for sources with known number of frames!"
+            )
+        # selected frames don't map to source frame numbers
+        if self.__keyframes_only or self.__frame_stride > 1:
+            raise RuntimeError(
+                "Parallel decoding is not supported with `-frame_stride` or `-keyframes_only` parameters!"
+            )
+        framerate = self.__rawFrameRate()
+        keyframes = self.__buildKeyframeIndex(framerate)
+        segments = segments or os.cpu_count() or 1
+        # split frames evenly and snap boundaries to their preceding keyframes
+        boundaries = sorted(
+            {
+                keyframes[
+                    bisect_right(keyframes, self.__raw_frame_num * i // segments) - 1
+                ]
+                for i in range(segments)
+            }
+        ) + [self.__raw_frame_num]
+        self.__verbose_logs and logger.debug(
+            "Decoding source in `{}` parallel segments starting at frames: `{}`.".format(
+                len(boundaries) - 1, boundaries[:-1]
+            )
+        )
+        # launch segments decoding
+        stop = threading.Event()
+        if ordered:
+            # share memory budget among segments ahead of first one, so that they
+            # can keep decoding (upto their whole length) while waiting for their turn
+            ahead_size = max(
+                queue_size,
+                buffer_limit
+                // max(self.__raw_frame_nbytes, 1)
+                // max(len(boundaries) - 2, 1),
+            )
+            queues = [
+                Queue(
+                    maxsize=(
+                        queue_size
+                        if segment == 0
+                        else min(end - start, ahead_size) + 1  # and end marker
+                    )
+                )
+                for segment, (start, end) in enumerate(
+                    zip(boundaries[:-1], boundaries[1:])
+                )
+            ]
+        else:
+            queues = [Queue(maxsize=queue_size * (len(boundaries) - 1))]
+        processes = []
+        workers = []
+        try:
+            for segment, (start, end) in enumerate(
+                zip(boundaries[:-1], boundaries[1:])
+            ):
+                process = self.__launchSeekProcess(start, framerate, end - start)
+                processes.append(process)
+                self.__segment_processes.append(process)
+                worker = threading.Thread(
+                    target=self.__decodeSegment,
+                    args=(process, start, queues[segment if ordered else 0], stop),
+                    name="FFdecoder-segment-{}".format(segment),
+                    daemon=True,
+                )
+                worker.start()
+                workers.append(worker)
+            # collect frames from segments
+            pending = len(workers)
+            segment = 0
+            while pending:
+                (index, frame) = self.__getSegmentItem(
+                    queues[segment if ordered else 0]
+                )
+                if index is None:
+                    # raise if segment decoding failed
+                    if not (frame is None):
+                        raise frame
+                    if self.__terminate_stream:
+                        break
+                    # move to next segment
+                    pending -= 1
+                    segment += 1
+                    continue
+                # return exclusive `gray` frames or default frames
+                frame = frame[:, :, 0] if self.__raw_frame_is_gray else frame
+                frame = self.__splitROIs(frame) if self.__roi_multiple else frame
+                yield frame if ordered else (index, frame)
+        finally:
+            # stop all segments, terminate processes first to unblock any pending pipe read
+            stop.set()
+            for process in processes:
+                process.poll() is None and process.terminate()
+            for worker in workers:
+                worker.join()
+            for process in processes:
+                self.__reapSeekProcess(process)
+                self.__segment_processes.remove(process)
+
+    def __enter__(self):
+        """
+        Handles entry with the `with` statement. See [PEP343 -- The 'with' statement'](https://peps.python.org/pep-0343/).
+
+        **Returns:** Output of `formulate()` method.
+        """
+        return self.formulate()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Handles exit with the `with` statement. See [PEP343 -- The 'with' statement'](https://peps.python.org/pep-0343/).
+        """
+        self.terminate()
+
+    async def aformulate(self):
+        """
+        This method is the [asyncio](https://docs.python.org/3/library/asyncio.html) counterpart of `formulate()` method, that formulates
+        same FFmpeg pipeline arguments but executes it inside a non-blocking `asyncio` subprocess.
+
+        **Returns:** A reference to the FFdecoder class object.
+        """
+        if not self.__initializing:
+            # warn if pipeline is recreated
+            logger.error("This pipeline is already created and running!")
+            return self
+        # discard unsupported parameters
+        if self.__prefetch_frames:
+            logger.warning(
+                "Discarding `{}` parameter as it is not supported with asyncio pipeline!".format(
+                    "-latest_frame_only"
+                    if self.__latest_frame_only
+                    else "-prefetch_frames"
+                )
+            )
+            self.__prefetch_frames = 0
+            self.__latest_frame_only = False
+        if self.__frame_buffer_pool_size:
+            logger.warning(
+                "Discarding `-frame_buffer_pool` parameter as it is not supported with asyncio pipeline!"
+            )
+            self.__frame_buffer_pool_size = 0
+        if self.__shm_ring_slots:
+            logger.warning(
+                "Discarding `-shm_ring_slots` parameter as it is not supported with asyncio pipeline!"
+            )
+            self.__shm_ring_slots = 0
+        if self.__auto_reconnect:
+            logger.warning(
+                "Discarding `-auto_reconnect` parameter as it is not supported with asyncio pipeline!"
+            )
+            self.__auto_reconnect = 0
+        if not (self.__latency_stats is None):
+            logger.warning(
+                "Discarding `-latency_stats` parameter as it is not supported with asyncio pipeline!"
+            )
+            self.__latency_stats = None
+        # formulate pipeline arguments only
+        self.__async_pipeline = True
+        self.formulate()
+        # import asyncio only when asyncio pipeline is used
+        import asyncio
+
+        # compose the asyncio FFmpeg process
+        self.__verbose_logs and logger.debug(
+            "Executing FFmpeg command: `{}`".format(" ".join(self.__ffmpeg_cmd))
+        )
+        if self.__pipeline_stats_mode and self.__machine_OS == "Windows":
+            logger.warning(
+                "Discarding `-pipeline_stats` parameter as it is not supported with asyncio pipeline on Windows!"
+            )
+            self.__pipeline_stats_mode = False
+        (progress_parameters, progress_kwargs) = self.__progressParameters()
+        try:
+            self.__aprocess = await asyncio.create_subprocess_exec(
+                *(self.__ffmpeg_cmd[:1] + progress_parameters + self.__ffmpeg_cmd[1:]),
+                stdin=sp.DEVNULL,
+                stdout=sp.PIPE,
+                stderr=None if self.__verbose_logs else sp.DEVNULL,
+                limit=max(self.__raw_frame_nbytes, 2**16),
+                creationflags=(  # this prevents ffmpeg creation window from opening when building exe files on Windows
+                    sp.DETACHED_PROCESS if self.__ffmpeg_window_disabler_patch else 0
+                ),
+                **progress_kwargs,
+            )
+        except BaseException:
+            # release progress pipe (if any) on failed launch
+            self.__closeProgressPipe()
+            raise
+        self.__startProgressReader()
+        return self
+
+    async def __afetchNextFrame(self):
+        """
+        This Internal method asynchronously grabs and decodes next 3D `ndarray` video-frame from the asyncio `subprocess` pipe.
+        """
+        assert not (
+            self.__aprocess is None
+        ), "Pipeline is not running! You must call `aformulate()` method first."
+        # already imported by running event loop
+        import asyncio
+
+        try:
+            # read bytes frames from stream reader
+            data = await self.__aprocess.stdout.readexactly(self.__raw_frame_nbytes)
+        except asyncio.IncompleteReadError:
+            # stream ended
+            return None
+        except Exception as e:
+            raise RuntimeError("Frame buffering failed with error: {}".format(str(e)))
+        # reconstruct frames using precomputed shape
+        frame = np.frombuffer(data, dtype=self.__raw_frame_dtype).reshape(
+            self.__raw_frame_shape
+        )
+        # return exclusive `gray` frames or default frames
+        return frame[:, :, 0] if self.__raw_frame_is_gray else frame
+
+    async def agenerateFrame(self):
+        """
+        This method returns an [Asynchronous Generator](https://peps.python.org/pep-0525/)
+        _(usable with `async for`)_ of video frames, grabbed continuously from the asyncio pipeline.
+        """
+        if self.__raw_frame_num is None or not self.__raw_frame_num:
+            while not self.__terminate_stream:  # infinite raw frames
+                frame = await self.__afetchNextFrame()
+                if frame is None:
+                    self.__terminate_stream = True
+                    break
+                yield self.__splitROIs(frame) if self.__roi_multiple else frame
+        else:
+            for _ in range(self.__raw_frame_num):  # finite raw frames
+                frame = await self.__afetchNextFrame()
+                if frame is None:
+                    self.__terminate_stream = True
+                    break
+                yield self.__splitROIs(frame) if self.__roi_multiple else frame
+
+    async def __aenter__(self):
+        """
+        Handles entry with the `async with` statement. See [PEP492 -- Asynchronous Context Managers](https://peps.python.org/pep-0492/#asynchronous-context-managers-and-async-with).
+
+        **Returns:** Output of `aformulate()` method.
+        """
+        return await self.aformulate()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """
+        Handles exit with the `async with` statement. See [PEP492 -- Asynchronous Context Managers](https://peps.python.org/pep-0492/#asynchronous-context-managers-and-async-with).
+        """
+        await self.aterminate()
+
+    @property
+    def metadata(self):
+        """
+        A property object that dumps metadata information as JSON string.
+
+        **Returns:** Metadata as JSON string.
+        """
+        # import dependency
+        import json
+
+        # return complete metadata information as JSON string
+        return json.dumps(
+            {
+                **self.__sourcer_metadata,  # source video
+                **self.__missing_prop,  # missing properties
+                **self.__user_metadata,  # user-defined
+            },
+            indent=2,
+        )
+
+    @metadata.setter
+    def metadata(self, value):
+        """
+        A property object that updates metadata information with user-defined dictionary.
+
+        Parameters:
+            value (dict): User-defined dictionary.
+        """
+        # check if value dict type
+        if value and isinstance(value, dict):
+            # log it
+            self.__verbose_logs and logger.info("Updating Metadata...")
+            # extract any source and output internal metadata keys
+            default_keys = set(value).intersection(
+                {**self.__sourcer_metadata, **self.__missing_prop}
+            )
+            # counterpart source properties for each output properties
+            counterpart_prop = {
+                "output_frames_resolution": "source_video_resolution",
+                "output_frames_pixfmt": "source_video_pixfmt",
+                "output_framerate": "source_video_framerate",
             }
             # iterate over source metadata keys and sanitize it
             for key in default_keys or []:
@@ -870,6 +2413,92 @@ def metadata(self, value):
             # otherwise raise error
             raise ValueError("Invalid datatype metadata assigned. Aborting!")
 
+    @property
+    def frame_ring(self):
+        """
+        A property object that returns shared memory frames ring _(if enabled with `-shm_ring_slots` parameter)_.
+        Its `name` attribute can be used by consumers in other processes for attaching to it with `SharedFrameRing(name=..., consumer_id=...)`.
+
+        **Returns:** A `SharedFrameRing` object or `None`.
+        """
+        return self.__frame_ring
+
+    @property
+    def prefetch_stats(self):
+        """
+        A property object that returns background frames prefetching statistics, i.e. current queue depth and capacity,
+        number of frames prefetched, stall counters of reader thread(producer) and `generateFrame()`(consumer), and number of
+        stale frames dropped _(in `-latest_frame_only` mode)_.
+
+        **Returns:** Prefetching statistics as python dictionary.
+        """
+        return {
+            "queue_depth": (
+                self.__prefetch_queue.qsize() if self.__prefetch_queue else 0
+            ),
+            "queue_capacity": self.__prefetch_frames,
+            **self.__prefetch_stats,
+        }
+
+    @property
+    def latency_stats(self):
+        """
+        A property object that returns a snapshot of per-frame latency histograms _(if enabled with `-latency_stats` parameter)_,
+        i.e. time blocked on reading each frame from pipe (`pipe_read`), time reconstructing each frame (`reshape`), and time spent by
+        consumer between frames yielded by `generateFrame()` method (`consumer`), along with total bytes read (`bytes_total`), and
+        bytes per second read from pipe (`read_bytes_per_second`) and overall since first frame (`bytes_per_second`).
+
+        Each histogram contains `count`, `total`, `mean`, `min`, `max` and estimated `p50`/`p90`/`p99` durations in seconds, and
+        non-empty logarithmic `buckets` as `{upper bound in microseconds: count}` dictionary.
+
+        !!! tip "If `pipe_read` time dominates, pipeline is producer(FFmpeg) bound, whereas if `consumer` time dominates, it is consumer bound."
+
+        **Returns:** Latency statistics as python dictionary, or empty dictionary if disabled.
+        """
+        if self.__latency_stats is None:
+            return {}
+        snapshot = {k: v.snapshot() for k, v in self.__latency_stats.items()}
+        read_time = snapshot["pipe_read"]["total"]
+        elapsed = (
+            time.perf_counter() - self.__latency_start
+            if not (self.__latency_start is None)
+            else 0.0
+        )
+        snapshot["bytes_total"] = self.__latency_bytes
+        snapshot["read_bytes_per_second"] = (
+            self.__latency_bytes / read_time if read_time > 0 else None
+        )
+        snapshot["bytes_per_second"] = (
+            self.__latency_bytes / elapsed if elapsed > 0 else None
+        )
+        return snapshot
+
+    @property
+    def pipeline_stats(self):
+        """
+        A property object that returns latest FFmpeg progress statistics of the pipeline _(if enabled with `-pipeline_stats` parameter)_,
+        i.e. frames decoded so far (`frame`), decoding `fps`, decoding `speed` relative to realtime, output timestamp (`out_time` and `out_time_seconds`),
+        duplicated and dropped frames counts (`dup_frames` and `drop_frames`), total bytes output (`total_size`), and `progress`
+        state (`continue` or `end`). Unavailable values are `None`.
+
+        **Returns:** Statistics as python dictionary, or empty dictionary if unavailable yet.
+        """
+        return dict(self.__pipeline_stats)
+
+    @property
+    def reconnect_stats(self):
+        """
+        A property object that returns automatic reconnection statistics of live sources _(if enabled with `-auto_reconnect` parameter)_,
+        i.e. number of FFmpeg process relaunches (`reconnects`), relaunches that resumed frames (`recoveries`), total seconds stream was down
+        (`downtime`), latest recovered gap as `(wall-clock time stream dropped, seconds)` tuple (`last_gap`), and whether stream is currently down (`down`).
+
+        **Returns:** Reconnection statistics as python dictionary.
+        """
+        return {
+            **self.__reconnect_stats,
+            "down": not (self.__reconnect_down_since is None),
+        }
+
     def __launch_FFdecoderline(self, input_params, output_params):
         """
         This Internal method executes FFmpeg pipeline arguments inside a `subprocess` pipe in a new process.
@@ -899,24 +2528,231 @@ def __launch_FFdecoderline(self, input_params, output_params):
             + output_parameters
             + ["-f", "rawvideo", "-"]
         )
+        # save formulated command
+        self.__ffmpeg_cmd = cmd
+        # asyncio pipeline is launched separately within `aformulate()`
+        if self.__async_pipeline:
+            return
+        # execute the saved command
+        self.__spawnPipeline()
+
+    def __spawnPipeline(self):
+        """
+        This Internal method executes saved FFmpeg command inside a `subprocess` pipe in a new process.
+        """
+        # add FFmpeg progress parameters (if enabled)
+        (progress_parameters, progress_kwargs) = self.__progressParameters()
+        cmd = self.__ffmpeg_cmd[:1] + progress_parameters + self.__ffmpeg_cmd[1:]
         # compose the FFmpeg process
-        if self.__verbose_logs:
-            logger.debug("Executing FFmpeg command: `{}`".format(" ".join(cmd)))
-            # In debugging mode
-            self.__process = sp.Popen(
-                cmd, stdin=sp.DEVNULL, stdout=sp.PIPE, stderr=None
+        try:
+            if self.__verbose_logs:
+                logger.debug("Executing FFmpeg command: `{}`".format(" ".join(cmd)))
+                # In debugging mode
+                self.__process = sp.Popen(
+                    cmd,
+                    stdin=sp.DEVNULL,
+                    stdout=sp.PIPE,
+                    stderr=progress_kwargs.pop("stderr", None),
+                    **progress_kwargs,
+                )
+            else:
+                # In silent mode
+                self.__process = sp.Popen(
+                    cmd,
+                    stdin=sp.DEVNULL,
+                    stdout=sp.PIPE,
+                    stderr=progress_kwargs.pop("stderr", sp.DEVNULL),
+                    creationflags=(  # this prevents ffmpeg creation window from opening when building exe files on Windows
+                        sp.DETACHED_PROCESS
+                        if self.__ffmpeg_window_disabler_patch
+                        else 0
+                    ),
+                    **progress_kwargs,
+                )
+        except BaseException:
+            # release progress pipe (if any) on failed launch
+            self.__closeProgressPipe()
+            raise
+        # start FFmpeg progress reader (if enabled)
+        self.__startProgressReader()
+
+    def __reconnectPipeline(self):
+        """
+        This Internal method relaunches saved FFmpeg command of a dropped live source after an exponential backoff delay
+        with jitter, reusing already probed metadata. It gives up once `-auto_reconnect` consecutive relaunches
+        end without yielding any frame.
+
+        **Returns:** `True` if relaunched, otherwise `False`.
+        """
+        if (
+            not self.__auto_reconnect
+            or self.__terminate_stream
+            or self.__reconnect_failures >= self.__auto_reconnect
+        ):
+            # log it
+            self.__auto_reconnect and not self.__terminate_stream and logger.error(
+                "Failed to reconnect source after `{}` attempts!".format(
+                    self.__reconnect_failures
+                )
             )
-        else:
-            # In silent mode
-            self.__process = sp.Popen(
-                cmd,
-                stdin=sp.DEVNULL,
-                stdout=sp.PIPE,
-                stderr=sp.DEVNULL,
-                creationflags=(  # this prevents ffmpeg creation window from opening when building exe files on Windows
-                    sp.DETACHED_PROCESS if self.__ffmpeg_window_disabler_patch else 0
-                ),
+            return False
+        # mark when stream dropped
+        if self.__reconnect_down_since is None:
+            self.__reconnect_down_since = (time.monotonic(), time.time())
+        # exponential backoff delay with equal jitter
+        (initial_delay, maximum_delay) = self.__reconnect_backoff
+        delay = min(maximum_delay, initial_delay * 2**self.__reconnect_failures)
+        delay = delay / 2 + random.uniform(0, delay / 2)
+        self.__reconnect_failures += 1
+        logger.warning(
+            "Source stream dropped! Reconnecting in `{:.2f}` seconds (attempt {}/{})...".format(
+                delay, self.__reconnect_failures, self.__auto_reconnect
             )
+        )
+        # wait for delay, unless terminated meanwhile
+        deadline = time.monotonic() + delay
+        while not self.__terminate_stream and time.monotonic() < deadline:
+            time.sleep(min(0.1, max(deadline - time.monotonic(), 0)))
+        with self.__reconnect_lock:
+            if self.__terminate_stream:
+                return False
+            # reap dropped process
+            self.__process.stdout and self.__process.stdout.close()
+            self.__process.poll() is None and self.__process.terminate()
+            self.__process.wait()
+            # relaunch saved command
+            self.__spawnPipeline()
+            self.__reconnect_stats["reconnects"] += 1
+        return True
+
+    def __recordRecovery(self):
+        """
+        This Internal method records downtime of a dropped live source once its relaunched pipeline yields frames again.
+        """
+        (dropped, dropped_wall) = self.__reconnect_down_since
+        downtime = time.monotonic() - dropped
+        self.__reconnect_stats["recoveries"] += 1
+        self.__reconnect_stats["downtime"] += downtime
+        self.__reconnect_stats["last_gap"] = (dropped_wall, downtime)
+        self.__reconnect_down_since = None
+        self.__reconnect_failures = 0
+        self.__verbose_logs and logger.info(
+            "Source stream recovered after `{:.2f}` seconds downtime.".format(downtime)
+        )
+
+    def __progressParameters(self):
+        """
+        This Internal method prepares FFmpeg `-progress` parameters that report progress statistics to a dedicated pipe,
+        or to `stderr` pipe on Windows where passing extra file descriptors to subprocess is not supported.
+
+        **Returns:** A tuple of FFmpeg parameters list and extra `subprocess` keyword arguments dictionary.
+        """
+        if not self.__pipeline_stats_mode:
+            return ([], {})
+        if self.__machine_OS == "Windows":
+            return (["-nostats", "-progress", "pipe:2"], {"stderr": sp.PIPE})
+        self.__progress_fds = os.pipe()
+        return (
+            ["-progress", "pipe:{}".format(self.__progress_fds[1])],
+            {"pass_fds": (self.__progress_fds[1],)},
+        )
+
+    def __closeProgressPipe(self):
+        """
+        This Internal method closes both ends of dedicated FFmpeg progress pipe (if any) that are left unused.
+        """
+        if self.__progress_fds is None:
+            return
+        for fd in self.__progress_fds:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self.__progress_fds = None
+
+    def __startProgressReader(self):
+        """
+        This Internal method starts background thread that reads FFmpeg progress statistics of launched pipeline.
+        """
+        if not self.__pipeline_stats_mode:
+            return
+        if self.__progress_fds is None:
+            # read from `stderr` pipe
+            stream = self.__process.stderr
+        else:
+            # close write end inherited by FFmpeg, and read from dedicated pipe
+            os.close(self.__progress_fds[1])
+            stream = os.fdopen(self.__progress_fds[0], "rb")
+            self.__progress_fds = None
+        self.__progress_thread = threading.Thread(
+            target=self.__readProgress,
+            args=(stream,),
+            name="FFdecoder-progress",
+            daemon=True,
+        )
+        self.__progress_thread.start()
+
+    def __readProgress(self, stream):
+        """
+        This Internal method continuously parses FFmpeg progress `key=value` blocks from given stream into pipeline statistics, until stream ends.
+
+        Parameters:
+            stream (file): readable binary stream.
+        """
+        block = {}
+        try:
+            for line in iter(stream.readline, b""):
+                (key, separator, value) = (
+                    line.decode("utf-8", errors="ignore").strip().partition("=")
+                )
+                # skip anything else, such as FFmpeg logs
+                if not separator or not key or " " in key:
+                    continue
+                block[key] = value.strip()
+                # each block ends with `progress` key
+                if key == "progress":
+                    self.__pipeline_stats = self.__parseProgress(block)
+                    block = {}
+        except Exception as e:
+            self.__verbose_logs and logger.exception(str(e))
+        finally:
+            stream.close()
+
+    @staticmethod
+    def __parseProgress(block):
+        """
+        This Internal method converts FFmpeg progress `key=value` block into statistics dictionary.
+
+        Parameters:
+            block (dict): FFmpeg progress block.
+
+        **Returns:** Statistics as python dictionary.
+        """
+
+        def convert(key, datatype):
+            try:
+                return datatype(block[key].rstrip("x"))
+            except (KeyError, ValueError):
+                return None
+
+        # `out_time_ms` is actually in microseconds in FFmpeg
+        out_time_us = convert("out_time_us", int)
+        out_time_us = (
+            convert("out_time_ms", int) if out_time_us is None else out_time_us
+        )
+        return {
+            "frame": convert("frame", int),
+            "fps": convert("fps", float),
+            "speed": convert("speed", float),
+            "out_time": block.get("out_time"),
+            "out_time_seconds": (
+                None if out_time_us is None else max(out_time_us, 0) / 1e6
+            ),
+            "dup_frames": convert("dup_frames", int),
+            "drop_frames": convert("drop_frames", int),
+            "total_size": convert("total_size", int),
+            "progress": block.get("progress"),
+        }
 
     def terminate(self):
         """
@@ -926,8 +2762,26 @@ def terminate(self):
         # signal we are closing
         self.__verbose_logs and logger.debug("Terminating FFdecoder Pipeline...")
         self.__terminate_stream = True
+        # stop background prefetch thread (if running)
+        if not (self.__prefetch_thread is None):
+            # terminate process first to unblock any pending pipe read
+            with self.__reconnect_lock:
+                not (self.__process is None) and self.__process.poll() is None and (
+                    self.__process.terminate()
+                )
+            self.__prefetch_thread.join()
+            self.__prefetch_thread = None
+        # stop parallel segments decoding processes (if running)
+        for process in self.__segment_processes:
+            process.poll() is None and process.terminate()
+        # destroy shared memory frames ring (if available)
+        if not (self.__frame_ring is None):
+            self.__frame_ring.unlink()
+            self.__frame_ring = None
         # check if no process was initiated at first place
         if self.__process is None or not (self.__process.poll() is None):
+            # wait for FFmpeg progress reader to finish (if running)
+            self.__progress_thread and self.__progress_thread.join(timeout=1.0)
             logger.info("Pipeline already terminated.")
             return
         # Attempt to close pipeline.
@@ -940,4 +2794,33 @@ def terminate(self):
         # wait if not exiting
         self.__process.wait()
         self.__process = None
+        # wait for FFmpeg progress reader to finish (if running)
+        self.__progress_thread and self.__progress_thread.join(timeout=1.0)
+        logger.info("Pipeline terminated successfully.")
+
+    async def aterminate(self):
+        """
+        Safely terminates asyncio pipeline processes.
+        """
+        # signal we are closing
+        self.__verbose_logs and logger.debug("Terminating FFdecoder Pipeline...")
+        self.__terminate_stream = True
+        # destroy shared memory frames ring (if available)
+        if not (self.__frame_ring is None):
+            self.__frame_ring.unlink()
+            self.__frame_ring = None
+        # check if no process was initiated at first place
+        if self.__aprocess is None or not (self.__aprocess.returncode is None):
+            logger.info("Pipeline already terminated.")
+            return
+        # terminate process if still processing
+        self.__aprocess.terminate()
+        # drain `stdout` output so process isn't blocked on writing
+        while await self.__aprocess.stdout.read(self.__raw_frame_nbytes):
+            pass
+        # wait if not exiting
+        await self.__aprocess.wait()
+        self.__aprocess = None
+        # wait for FFmpeg progress reader to finish (if running)
+        self.__progress_thread and self.__progress_thread.join(timeout=1.0)
         logger.info("Pipeline terminated successfully.")
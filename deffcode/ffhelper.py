@@ -20,14 +20,15 @@
 
 # import the necessary packages
 import os, re
-import requests
+import json
+import shutil
 import logging
 import platform
+import tempfile
+import threading
 import subprocess as sp
 
-from tqdm import tqdm
 from pathlib import Path
-from requests.adapters import HTTPAdapter, Retry
 
 # import utils packages
 from .utils import logger_handler, delete_file_safe
@@ -41,24 +42,51 @@
 # set default timer for download requests
 DEFAULT_TIMEOUT = 3
 
+# handles lazily defined `TimeoutHTTPAdapter` class
+_timeout_http_adapter = None
 
-class TimeoutHTTPAdapter(HTTPAdapter):
+# handles persistent FFmpeg capabilities cache loaded in memory
+_capabilities_cache = {"path": None, "entries": {}}
+_capabilities_lock = threading.Lock()
+
+
+def __getattr__(name):
     """
-    A custom Transport Adapter with default timeouts
+    Lazily defines download helpers on first access, so that `requests` isn't imported with this module.
     """
+    if name == "TimeoutHTTPAdapter":
+        return _get_timeout_http_adapter()
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def _get_timeout_http_adapter():
+    """
+    Returns a custom `requests` Transport Adapter class with default timeouts, defined once on first use.
+    """
+    global _timeout_http_adapter
+    if _timeout_http_adapter is None:
+        from requests.adapters import HTTPAdapter
+
+        class TimeoutHTTPAdapter(HTTPAdapter):
+            """
+            A custom Transport Adapter with default timeouts
+            """
 
-    def __init__(self, *args, **kwargs):
-        self.timeout = DEFAULT_TIMEOUT
-        if "timeout" in kwargs:
-            self.timeout = kwargs["timeout"]
-            del kwargs["timeout"]
-        super().__init__(*args, **kwargs)
+            def __init__(self, *args, **kwargs):
+                self.timeout = DEFAULT_TIMEOUT
+                if "timeout" in kwargs:
+                    self.timeout = kwargs["timeout"]
+                    del kwargs["timeout"]
+                super().__init__(*args, **kwargs)
 
-    def send(self, request, **kwargs):
-        timeout = kwargs.get("timeout")
-        if timeout is None:
-            kwargs["timeout"] = self.timeout
-        return super().send(request, **kwargs)
+            def send(self, request, **kwargs):
+                timeout = kwargs.get("timeout")
+                if timeout is None:
+                    kwargs["timeout"] = self.timeout
+                return super().send(request, **kwargs)
+
+        _timeout_http_adapter = TimeoutHTTPAdapter
+    return _timeout_http_adapter
 
 
 def get_valid_ffmpeg_path(
@@ -188,6 +216,9 @@ def download_ffmpeg_binaries(path, os_windows=False, os_bit=""):
         else:
             # import libs
             import zipfile
+            import requests
+            from tqdm import tqdm
+            from requests.adapters import Retry
 
             # check if given path has write access
             assert os.access(path, os.W_OK), (
@@ -210,7 +241,9 @@ def download_ffmpeg_binaries(path, os_windows=False, os_bit=""):
                         status_forcelist=[429, 500, 502, 503, 504],
                     )
                     # Mount it for https usage
-                    adapter = TimeoutHTTPAdapter(timeout=2.0, max_retries=retries)
+                    adapter = _get_timeout_http_adapter()(
+                        timeout=2.0, max_retries=retries
+                    )
                     http.mount("https://", adapter)
                     response = http.get(file_url, stream=True)
                     response.raise_for_status()
@@ -253,11 +286,15 @@ def validate_ffmpeg(path, verbose=False):
     """
     try:
         # get the FFmpeg version
-        version = check_sp_output([path, "-version"])
-        firstline = version.split(b"\n")[0]
-        version = firstline.split(b" ")[2].strip()
+        capabilities = FFmpegCapabilities.get(path)
+        version = capabilities.version
         if verbose:  # log if test are passed
             logger.debug("FFmpeg validity Test Passed!")
+            capabilities.is_cached("version") and logger.debug(
+                "Using FFmpeg capabilities cached at `{}`.".format(
+                    get_capabilities_cache_path()
+                )
+            )
             logger.debug(
                 "Found valid FFmpeg Version: `{}` installed on this system".format(
                     version
@@ -272,18 +309,18 @@ def validate_ffmpeg(path, verbose=False):
     return True
 
 
-def get_supported_pixfmts(path):
+def _parse_version(version):
     """
-    ## get_supported_pixfmts
-
-    Find and returns all FFmpeg's supported pixel formats.
+    Parses FFmpeg version.
+    """
+    firstline = version.split(b"\n")[0]
+    return firstline.split(b" ")[2].strip().decode("utf-8")
 
-    Parameters:
-        path (string): absolute path of FFmpeg binaries
 
-    **Returns:** List of supported pixel formats as (PIXEL FORMAT, NB_COMPONENTS, BITS_PER_PIXEL).
+def _parse_pixfmts(pxfmts):
+    """
+    Parses supported pixel formats.
     """
-    pxfmts = check_sp_output([path, "-hide_banner", "-pix_fmts"])
     splitted = pxfmts.split(b"\n")
     srtindex = [i for i, s in enumerate(splitted) if b"-----" in s]
     # extract video encoders
@@ -297,25 +334,17 @@ def get_supported_pixfmts(path):
     # find all outputs
     outputs = finder.findall("\n".join(supported_pxfmts))
     # return output findings
-    return [
+    return tuple(
         ([s for s in o[0].split(" ")][-1], o[1].strip(), o[2].strip())
         for o in outputs
         if len(o) == 3
-    ]
+    )
 
 
-def get_supported_vdecoders(path):
+def _parse_vdecoders(decoders):
     """
-    ## get_supported_vdecoders
-
-    Find and returns all FFmpeg's supported video decoders.
-
-    Parameters:
-        path (string): absolute path of FFmpeg binaries
-
-    **Returns:** List of supported decoders.
+    Parses supported video decoders.
     """
-    decoders = check_sp_output([path, "-hide_banner", "-decoders"])
     splitted = decoders.split(b"\n")
     # extract video encoders
     supported_vdecoders = [
@@ -328,7 +357,233 @@ def get_supported_vdecoders(path):
     # find all outputs
     outputs = finder.findall("\n".join(supported_vdecoders))
     # return output findings
-    return [[s for s in o.split(" ")][-1] for o in outputs]
+    return tuple([s for s in o.split(" ")][-1] for o in outputs)
+
+
+def _parse_demuxers(demuxers):
+    """
+    Parses supported demuxers.
+    """
+    splitted = [x.decode("utf-8").strip() for x in demuxers.split(b"\n")]
+    split_index = [idx for idx, s in enumerate(splitted) if "--" in s][0]
+    supported_demuxers = splitted[split_index + 1 : len(splitted) - 1]
+    # search all demuxers
+    outputs = [re.search(r"\s[a-z0-9_,-]{2,}\s", d) for d in supported_demuxers]
+    outputs = [o.group(0) for o in outputs if o]
+    # return demuxers output
+    return tuple(
+        o.strip() if not ("," in o) else o.split(",")[-1].strip() for o in outputs
+    )
+
+
+def _parse_protocols(protocols):
+    """
+    Parses supported protocols.
+    """
+    splitted = [x.decode("utf-8").strip() for x in protocols.split(b"\n")]
+    return tuple(splitted[splitted.index("Output:") + 1 : len(splitted) - 1])
+
+
+def _parse_image_pipe_formats(formats):
+    """
+    Parses supported image pipe formats.
+    """
+    extract_formats = re.findall(r"\w+_pipe", formats.decode("utf-8").strip())
+    return tuple(x.split("_")[0] for x in extract_formats if x.endswith("_pipe"))
+
+
+class FFmpegCapabilities:
+    """
+    ## FFmpegCapabilities
+
+    Process-wide registry of FFmpeg binary's capabilities, i.e. its supported pixel formats, video decoders,
+    demuxers, protocols and image pipe formats. Only one object exists per FFmpeg binary _(identified by its
+    resolved path, modification time and size)_, which is shared by all APIs and methods in the process. Each
+    capability is queried lazily on first access, and then memoized, so that every query is paid only once.
+
+    All accesses are thread-safe, and concurrent first accesses of same capability runs its query only once.
+    """
+
+    # FFmpeg arguments and output parser of each capability query
+    __queries = {
+        "version": (["-version"], _parse_version),
+        "pixfmts": (["-hide_banner", "-pix_fmts"], _parse_pixfmts),
+        "vdecoders": (["-hide_banner", "-decoders"], _parse_vdecoders),
+        "demuxers": (["-hide_banner", "-demuxers"], _parse_demuxers),
+        "protocols": (["-hide_banner", "-protocols"], _parse_protocols),
+        "image_pipe_formats": (["-hide_banner", "-formats"], _parse_image_pipe_formats),
+    }
+
+    # handles objects per FFmpeg binary
+    __registry = {}
+    __registry_lock = threading.Lock()
+
+    def __init__(self, path):
+        """
+        This constructor method initializes the object state and attributes of the FFmpegCapabilities Class.
+
+        !!! warning "Use `FFmpegCapabilities.get(path)` instead, to obtain the object shared in the process."
+
+        Parameters:
+            path (string): absolute path of FFmpeg binaries
+        """
+        self.__path = path
+        self.__fields = {}
+        self.__cache_hits = set()  # capabilities served from persistent cache
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def get(cls, path):
+        """
+        Returns FFmpegCapabilities object of given FFmpeg binary shared in the process, creating it if needed.
+
+        Parameters:
+            path (string): absolute path of FFmpeg binaries
+
+        **Returns:** A FFmpegCapabilities object.
+        """
+        key = get_ffmpeg_binary_key(path) or path
+        with cls.__registry_lock:
+            capabilities = cls.__registry.get(key)
+            if capabilities is None:
+                capabilities = cls.__registry[key] = cls(path)
+        return capabilities
+
+    @classmethod
+    def clear(cls):
+        """
+        Discards all FFmpegCapabilities objects of the process, so that capabilities are queried again on next access.
+        """
+        with cls.__registry_lock:
+            cls.__registry.clear()
+
+    @property
+    def path(self):
+        """
+        A property object that returns path of FFmpeg binaries.
+        """
+        return self.__path
+
+    def __query(self, name):
+        """
+        This Internal method returns memoized value of given capability, querying and parsing it on first access.
+        """
+        value = self.__fields.get(name)
+        if value is None:
+            with self.__lock:
+                value = self.__fields.get(name)
+                if value is None:
+                    # nothing is memoized if query or parser fails
+                    (args, parser) = self.__queries[name]
+                    (output, hit) = check_cached_sp_output(
+                        [self.__path] + args, report_hit=True
+                    )
+                    value = self.__fields[name] = parser(output)
+                    hit and self.__cache_hits.add(name)
+        return value
+
+    def is_cached(self, name):
+        """
+        Returns whether given capability was served from persistent capabilities cache, instead of querying FFmpeg.
+
+        Parameters:
+            name (str): name of capability _(such as `version`, `demuxers` etc.)_.
+
+        **Returns:** A boolean value.
+        """
+        return name in self.__cache_hits
+
+    async def aprefetch(self, *names):
+        """
+        This method is the [asyncio](https://docs.python.org/3/library/asyncio.html) counterpart of accessing capabilities,
+        that runs queries of given capabilities not memoized yet in non-blocking `asyncio` subprocesses, so that their later
+        accesses don't block the event loop.
+
+        Parameters:
+            names (str): names of capabilities _(such as `demuxers`, `protocols` etc.)_. Defaults to all.
+        """
+        for name in names or list(self.__queries):
+            if not (self.__fields.get(name) is None):
+                continue
+            (args, parser) = self.__queries[name]
+            (output, hit) = await acheck_cached_sp_output(
+                [self.__path] + args, report_hit=True
+            )
+            # parse and memoize (unless already memoized meanwhile)
+            value = parser(output)
+            with self.__lock:
+                if self.__fields.setdefault(name, value) is value and hit:
+                    self.__cache_hits.add(name)
+
+    @property
+    def version(self):
+        """
+        A property object that returns FFmpeg version as string.
+        """
+        return self.__query("version")
+
+    @property
+    def pixfmts(self):
+        """
+        A property object that returns list of supported pixel formats as (PIXEL FORMAT, NB_COMPONENTS, BITS_PER_PIXEL).
+        """
+        return list(self.__query("pixfmts"))
+
+    @property
+    def vdecoders(self):
+        """
+        A property object that returns list of supported video decoders.
+        """
+        return list(self.__query("vdecoders"))
+
+    @property
+    def demuxers(self):
+        """
+        A property object that returns list of supported demuxers.
+        """
+        return list(self.__query("demuxers"))
+
+    @property
+    def protocols(self):
+        """
+        A property object that returns list of supported protocols.
+        """
+        return list(self.__query("protocols"))
+
+    @property
+    def image_pipe_formats(self):
+        """
+        A property object that returns list of supported image pipe formats _(i.e. image sequence extensions)_.
+        """
+        return list(self.__query("image_pipe_formats"))
+
+
+def get_supported_pixfmts(path):
+    """
+    ## get_supported_pixfmts
+
+    Find and returns all FFmpeg's supported pixel formats.
+
+    Parameters:
+        path (string): absolute path of FFmpeg binaries
+
+    **Returns:** List of supported pixel formats as (PIXEL FORMAT, NB_COMPONENTS, BITS_PER_PIXEL).
+    """
+    return FFmpegCapabilities.get(path).pixfmts
+
+
+def get_supported_vdecoders(path):
+    """
+    ## get_supported_vdecoders
+
+    Find and returns all FFmpeg's supported video decoders.
+
+    Parameters:
+        path (string): absolute path of FFmpeg binaries
+
+    **Returns:** List of supported decoders.
+    """
+    return FFmpegCapabilities.get(path).vdecoders
 
 
 def get_supported_demuxers(path):
@@ -342,16 +597,7 @@ def get_supported_demuxers(path):
 
     **Returns:** List of supported demuxers.
     """
-    # extract and clean FFmpeg output
-    demuxers = check_sp_output([path, "-hide_banner", "-demuxers"])
-    splitted = [x.decode("utf-8").strip() for x in demuxers.split(b"\n")]
-    split_index = [idx for idx, s in enumerate(splitted) if "--" in s][0]
-    supported_demuxers = splitted[split_index + 1 : len(splitted) - 1]
-    # search all demuxers
-    outputs = [re.search(r"\s[a-z0-9_,-]{2,}\s", d) for d in supported_demuxers]
-    outputs = [o.group(0) for o in outputs if o]
-    # return demuxers output
-    return [o.strip() if not ("," in o) else o.split(",")[-1].strip() for o in outputs]
+    return FFmpegCapabilities.get(path).demuxers
 
 
 def extract_device_n_demuxer(path, machine_OS=None, verbose=False):
@@ -587,12 +833,8 @@ def is_valid_image_seq(path, source=None, verbose=False):
     if source is None or not (source):
         logger.error("Source is empty!")
         return False
-    # extract all FFmpeg supported protocols
-    formats = check_sp_output([path, "-hide_banner", "-formats"])
-    extract_formats = re.findall(r"\w+_pipe", formats.decode("utf-8").strip())
-    supported_image_formats = [
-        x.split("_")[0] for x in extract_formats if x.endswith("_pipe")
-    ]
+    # extract all FFmpeg supported image pipe formats
+    supported_image_formats = FFmpegCapabilities.get(path).image_pipe_formats
     filename, extension = os.path.splitext(source)
     # Test and return result whether scheme is supported
     if extension and source.endswith(tuple(supported_image_formats)):
@@ -632,14 +874,11 @@ def is_valid_url(path, url=None, verbose=False):
     # extract URL scheme
     extracted_scheme_url = url.split("://", 1)[0]
     # extract all FFmpeg supported protocols
-    protocols = check_sp_output([path, "-hide_banner", "-protocols"])
-    splitted = [x.decode("utf-8").strip() for x in protocols.split(b"\n")]
-    supported_protocols = splitted[splitted.index("Output:") + 1 : len(splitted) - 1]
+    capabilities = FFmpegCapabilities.get(path)
+    supported_protocols = capabilities.protocols
     # RTSP is a demuxer somehow
     # support both RTSP and RTSPS(over SSL)
-    supported_protocols += (
-        ["rtsp", "rtsps"] if "rtsp" in get_supported_demuxers(path) else []
-    )
+    supported_protocols += ["rtsp", "rtsps"] if "rtsp" in capabilities.demuxers else []
     # Test and return result whether scheme is supported
     if extracted_scheme_url and extracted_scheme_url in supported_protocols:
         verbose and logger.debug(
@@ -661,7 +900,8 @@ def check_sp_output(*args, **kwargs):
 
     Parameters:
         args (based on input): Non Keyword Arguments
-        kwargs (based on input): Keyword Arguments
+        kwargs (based on input): Keyword Arguments _(including `force_retrieve_stderr` and `timeout` in seconds, after which
+            the process is killed and `subprocess.TimeoutExpired` is raised)_
 
     **Returns:** A string value.
     """
@@ -671,6 +911,7 @@ def check_sp_output(*args, **kwargs):
         sp._cleanup = lambda: None
     # handle additional params
     retrieve_stderr = kwargs.pop("force_retrieve_stderr", False)
+    timeout = kwargs.pop("timeout", None)
     # execute command in subprocess
     process = sp.Popen(
         stdout=sp.PIPE,
@@ -679,7 +920,13 @@ def check_sp_output(*args, **kwargs):
         **kwargs,
     )
     # communicate and poll process
-    output, stderr = process.communicate()
+    try:
+        output, stderr = process.communicate(timeout=timeout)
+    except sp.TimeoutExpired:
+        # kill and reap process on timeout
+        process.kill()
+        process.communicate()
+        raise
     retcode = process.poll()
     # handle return code
     if retcode and not (retrieve_stderr):
@@ -698,3 +945,265 @@ def check_sp_output(*args, **kwargs):
     )
     # return output otherwise
     return stderr if retrieve_stderr and stderr else output
+
+
+async def acheck_sp_output(cmd, **kwargs):
+    """
+    ## acheck_sp_output
+
+    The [asyncio](https://docs.python.org/3/library/asyncio.html) counterpart of `check_sp_output()` method, that executes
+    command in a non-blocking `asyncio` subprocess. The subprocess is killed and reaped if the awaiting task is cancelled
+    or timed out.
+
+    Parameters:
+        cmd (list): command to be executed.
+        kwargs (based on input): Keyword Arguments _(including `force_retrieve_stderr` and `timeout` in seconds, after which
+            the process is killed and `subprocess.TimeoutExpired` is raised)_
+
+    **Returns:** A string value.
+    """
+    import asyncio
+
+    # handle additional params
+    retrieve_stderr = kwargs.pop("force_retrieve_stderr", False)
+    timeout = kwargs.pop("timeout", None)
+    # execute command in subprocess
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=sp.PIPE,
+        stderr=sp.DEVNULL if not (retrieve_stderr) else sp.PIPE,
+        **kwargs,
+    )
+    # communicate and poll process
+    try:
+        output, stderr = await asyncio.wait_for(process.communicate(), timeout)
+    except BaseException as e:
+        # kill and reap process on timeout or cancellation
+        process.returncode is None and process.kill()
+        await asyncio.shield(process.wait())
+        if isinstance(e, asyncio.TimeoutError):
+            raise sp.TimeoutExpired(cmd, timeout) from None
+        raise
+    retcode = process.returncode
+    # handle return code
+    if retcode and not (retrieve_stderr):
+        logger.error("[Pipeline-Error] :: {}".format(output.decode("utf-8")))
+        error = sp.CalledProcessError(retcode, cmd)
+        error.output = output
+        raise error
+    # raise error if no output
+    bool(output) or bool(stderr) or logger.error(
+        "[Pipeline-Error] :: Pipeline failed to exact any data from command: {}!".format(
+            cmd
+        )
+    )
+    # return output otherwise
+    return stderr if retrieve_stderr and stderr else output
+
+
+def get_capabilities_cache_path():
+    """
+    ## get_capabilities_cache_path
+
+    Returns location of persistent FFmpeg capabilities cache file, which defaults to user's cache directory
+    and can be overridden with `DEFFCODE_CACHE_DIR` environment variable. Cache can be disabled completely by setting
+    `DEFFCODE_CACHE` environment variable to `0`.
+
+    **Returns:** Cache file path as string, or `None` if disabled.
+    """
+    if os.environ.get("DEFFCODE_CACHE", "1").strip().lower() in ["0", "false", "off"]:
+        return None
+    cache_dir = os.environ.get("DEFFCODE_CACHE_DIR", "")
+    if not cache_dir:
+        cache_dir = os.path.join(
+            (
+                os.environ.get("LOCALAPPDATA", "")
+                if platform.system() == "Windows"
+                else os.environ.get("XDG_CACHE_HOME", "")
+            )
+            or os.path.join(str(Path.home()), ".cache"),
+            "deffcode",
+        )
+    return os.path.join(os.path.abspath(cache_dir), "ffmpeg_capabilities.json")
+
+
+def get_ffprobe_path(path):
+    """
+    ## get_ffprobe_path
+
+    Finds FFprobe binary next to given FFmpeg binary, or in system's `PATH` if FFmpeg binary itself is found there.
+
+    Parameters:
+        path (string): path of FFmpeg binaries
+
+    **Returns:** FFprobe executable path as string, or `None` if not found.
+    """
+    if not path:
+        return None
+    (directory, filename) = os.path.split(path)
+    ffprobe = re.sub("ffmpeg", "ffprobe", filename, count=1, flags=re.IGNORECASE)
+    if ffprobe == filename:
+        return None
+    if directory:
+        ffprobe = os.path.join(directory, ffprobe)
+        return (
+            ffprobe if os.path.isfile(ffprobe) and os.access(ffprobe, os.X_OK) else None
+        )
+    return shutil.which(ffprobe)
+
+
+def get_ffmpeg_binary_key(path):
+    """
+    ## get_ffmpeg_binary_key
+
+    Identifies FFmpeg binary by its resolved path, inode, modification time and size, which all change whenever
+    it is replaced with another version.
+
+    Parameters:
+        path (string): path of FFmpeg binaries
+
+    **Returns:** Identity as string, or `None` if binary is not found.
+    """
+    try:
+        resolved = os.path.realpath(shutil.which(path) or path)
+        stat = os.stat(resolved)
+    except (OSError, TypeError):
+        return None
+    return "{}|{}|{}|{}".format(resolved, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _load_capabilities_cache(cache_path):
+    """
+    Loads persistent FFmpeg capabilities cache file into memory once per process.
+    """
+    if _capabilities_cache["path"] != cache_path:
+        entries = {}
+        try:
+            with open(cache_path, "r") as f:
+                entries = json.load(f)
+            if not isinstance(entries, dict):
+                entries = {}
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(
+                "Discarding unreadable FFmpeg capabilities cache: {}".format(str(e))
+            )
+        _capabilities_cache.update({"path": cache_path, "entries": entries})
+    return _capabilities_cache["entries"]
+
+
+def _save_capabilities_cache(cache_path, key):
+    """
+    Atomically writes given FFmpeg binary entry to persistent capabilities cache file, while retaining
+    entries of other binaries written by other processes, and discarding stale entries of same binary path.
+    Failing to write cache is a silent no-op, as cache is only an optimization.
+    """
+    entry = _capabilities_cache["entries"][key]
+    temp_path = None
+    try:
+        entries = {}
+        try:
+            with open(cache_path, "r") as f:
+                entries = json.load(f)
+            if not isinstance(entries, dict):
+                entries = {}
+        except (OSError, ValueError):
+            pass
+        binary_path = key.rsplit("|", 3)[0]
+        entries = {
+            k: v for k, v in entries.items() if k.rsplit("|", 3)[0] != binary_path
+        }
+        entries[key] = entry
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(entries, f)
+        os.replace(temp_path, cache_path)
+        temp_path = None
+        _capabilities_cache["entries"] = entries
+    except Exception:
+        pass
+    finally:
+        # discard partially written file (if any)
+        if not (temp_path is None):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+
+def _lookup_cached_sp_output(cmd):
+    """
+    Returns `(cache_path, key, output)` of given capabilities query command, where output is `None` on cache misses,
+    and key is `None` if caching is disabled or unavailable.
+    """
+    cache_path = get_capabilities_cache_path()
+    key = get_ffmpeg_binary_key(cmd[0]) if cache_path else None
+    if key is None:
+        return (cache_path, None, None)
+    query = " ".join(cmd[1:])
+    with _capabilities_lock:
+        entry = _load_capabilities_cache(cache_path).get(key, {})
+        if query in entry.get("queries", {}):
+            return (cache_path, key, entry["queries"][query].encode("utf-8"))
+    return (cache_path, key, None)
+
+
+def _store_cached_sp_output(cache_path, key, cmd, output):
+    """
+    Caches output of given capabilities query command for given FFmpeg binary key.
+    """
+    query = " ".join(cmd[1:])
+    with _capabilities_lock:
+        entry = _load_capabilities_cache(cache_path).setdefault(
+            key, {"version": None, "queries": {}}
+        )
+        entry["queries"][query] = output.decode("utf-8", errors="replace")
+        if query == "-version":
+            entry["version"] = entry["queries"][query].split("\n")[0].strip()
+        _save_capabilities_cache(cache_path, key)
+
+
+def check_cached_sp_output(cmd, report_hit=False):
+    """
+    ## check_cached_sp_output
+
+    Returns FFmpeg `stdout` output of given capabilities query command _(such as `-pix_fmts`, `-decoders` etc.)_
+    from persistent cache if available for same FFmpeg binary, otherwise executes and caches it.
+
+    Parameters:
+        cmd (list): FFmpeg command, starting with path of FFmpeg binaries.
+        report_hit (bool): whether to also report if output was served from cache.
+
+    **Returns:** A bytes value, or `(bytes value, cache hit)` tuple if `report_hit` is enabled.
+    """
+    (cache_path, key, output) = _lookup_cached_sp_output(cmd)
+    hit = not (output is None)
+    if not hit:
+        # execute query otherwise
+        output = check_sp_output(cmd)
+        key is None or _store_cached_sp_output(cache_path, key, cmd, output)
+    return (output, hit) if report_hit else output
+
+
+async def acheck_cached_sp_output(cmd, report_hit=False):
+    """
+    ## acheck_cached_sp_output
+
+    The [asyncio](https://docs.python.org/3/library/asyncio.html) counterpart of `check_cached_sp_output()` method,
+    that executes query in a non-blocking `asyncio` subprocess on cache misses.
+
+    Parameters:
+        cmd (list): FFmpeg command, starting with path of FFmpeg binaries.
+        report_hit (bool): whether to also report if output was served from cache.
+
+    **Returns:** A bytes value, or `(bytes value, cache hit)` tuple if `report_hit` is enabled.
+    """
+    (cache_path, key, output) = _lookup_cached_sp_output(cmd)
+    hit = not (output is None)
+    if not hit:
+        # execute query otherwise
+        output = await acheck_sp_output(cmd)
+        key is None or _store_cached_sp_output(cache_path, key, cmd, output)
+    return (output, hit) if report_hit else output
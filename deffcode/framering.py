@@ -0,0 +1,303 @@
+"""
+===============================================
+DeFFcode library source-code is deployed under the Apache 2.0 License:
+
+Copyright (c) 2021 Abhishek Thakur(@abhiTronix) <abhi.una12@gmail.com>
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+===============================================
+"""
+
+# import the necessary packages
+import sys
+import time
+import logging
+import numpy as np
+from collections import namedtuple
+from multiprocessing import shared_memory, resource_tracker
+
+# import utils packages
+from .utils import logger_handler
+
+# define logger
+logger = logging.getLogger("FrameRing")
+logger.propagate = False
+logger.addHandler(logger_handler())
+logger.setLevel(logging.DEBUG)
+
+# lightweight picklable handle to a frame published in shared memory ring
+SharedFrameHandle = namedtuple("SharedFrameHandle", ["slot", "seq"])
+
+# ring header layout: 8 x int64 values followed by dtype string
+_HEADER_INTS = 8  # slots, consumers, ndim, shape(upto 4 dims), reserved
+_HEADER_DTYPE_LEN = 16
+_HEADER_SIZE = _HEADER_INTS * 8 + _HEADER_DTYPE_LEN
+# data alignment in bytes
+_ALIGNMENT = 64
+# names of rings created by this process (inherited by forked processes that
+# share its resource tracker)
+_OWNED_RINGS = set()
+
+
+class SharedFrameRing:
+    """
+    > SharedFrameRing is a fixed-size ring of video-frame slots inside a single
+    [`multiprocessing.shared_memory`](https://docs.python.org/3/library/multiprocessing.shared_memory.html) block,
+    which lets FFdecoder API hand over decoded frames to consumers in other processes without pickling or copying them.
+
+    The producer writes each frame directly into a free slot and publishes a lightweight picklable
+    `SharedFrameHandle(slot, seq)` that can be sent to consumers _(for e.g. through a `multiprocessing.Queue`)_. Consumers
+    map the handle to a zero-copy `ndarray` view with `view()` method and acknowledge it with `release()` method once done.
+    A slot is reused only when every consumer has acknowledged the frame it holds, thereby acting as reference counting
+    without any cross-process locks.
+
+    !!! warning "Each consumer must use a unique `consumer_id` in range `[0, consumers)`, since acknowledgements are tracked per consumer."
+    """
+
+    def __init__(
+        self,
+        name=None,
+        slots=4,
+        frame_shape=None,
+        dtype="u1",
+        consumers=1,
+        consumer_id=0,
+    ):
+        """
+        This constructor method creates a new ring if `frame_shape` is defined, or otherwise attaches to an existing ring by its `name`.
+
+        Parameters:
+            name (str): name of the shared memory block. Required for attaching to an existing ring.
+            slots (int): number of frame slots in the new ring.
+            frame_shape (tuple): shape of each frame in the new ring.
+            dtype (str, numpy.dtype): datatype of each frame in the new ring.
+            consumers (int): number of consumers that must acknowledge each frame in the new ring.
+            consumer_id (int): index of this consumer, used for acknowledging frames.
+        """
+        # check whether creating a new ring
+        self.__owner = not (frame_shape is None)
+        if self.__owner:
+            # validate parameters
+            assert (
+                isinstance(slots, int) and slots > 0
+            ), "Invalid `slots` value: `{}`!".format(slots)
+            assert (
+                isinstance(consumers, int) and consumers > 0
+            ), "Invalid `consumers` value: `{}`!".format(consumers)
+            assert (
+                isinstance(frame_shape, (list, tuple)) and 0 < len(frame_shape) <= 4
+            ), "Invalid `frame_shape` value: `{}`!".format(frame_shape)
+            self.__slots = slots
+            self.__consumers = consumers
+            self.__frame_shape = tuple(int(x) for x in frame_shape)
+            self.__dtype = np.dtype(dtype)
+        else:
+            assert (
+                isinstance(name, str) and name
+            ), "Ring `name` is required for attaching to an existing ring!"
+        if self.__owner:
+            # create shared memory block
+            self.__shm = shared_memory.SharedMemory(
+                name=name,
+                create=True,
+                size=self.__layout(
+                    self.__slots,
+                    self.__consumers,
+                    int(np.prod(self.__frame_shape)) * self.__dtype.itemsize,
+                ),
+            )
+            _OWNED_RINGS.add(self.__shm.name)
+            # write header
+            header = np.ndarray((_HEADER_INTS,), dtype=np.int64, buffer=self.__shm.buf)
+            header[:] = 0
+            header[0:3] = (self.__slots, self.__consumers, len(self.__frame_shape))
+            header[3 : 3 + len(self.__frame_shape)] = self.__frame_shape
+            self.__shm.buf[_HEADER_INTS * 8 : _HEADER_SIZE] = self.__dtype.str.encode(
+                "ascii"
+            ).ljust(_HEADER_DTYPE_LEN, b"\0")
+        else:
+            # attach to existing shared memory block
+            if sys.version_info >= (3, 13):
+                self.__shm = shared_memory.SharedMemory(name=name, track=False)
+            else:
+                self.__shm = shared_memory.SharedMemory(name=name)
+                # untrack attached block, so that resource tracker of consumer
+                # process doesn't destroy it when that process exits
+                name in _OWNED_RINGS or resource_tracker.unregister(
+                    self.__shm._name, "shared_memory"
+                )
+            # read header
+            header = np.ndarray((_HEADER_INTS,), dtype=np.int64, buffer=self.__shm.buf)
+            self.__slots, self.__consumers, ndim = (int(x) for x in header[0:3])
+            self.__frame_shape = tuple(int(x) for x in header[3 : 3 + ndim])
+            self.__dtype = np.dtype(
+                bytes(self.__shm.buf[_HEADER_INTS * 8 : _HEADER_SIZE])
+                .rstrip(b"\0")
+                .decode("ascii")
+            )
+        # validate consumer index
+        assert (
+            isinstance(consumer_id, int) and 0 <= consumer_id < self.__consumers
+        ), "Invalid `consumer_id` value: `{}`!".format(consumer_id)
+        self.__consumer_id = consumer_id
+        # map sequence numbers, acknowledgements and frames data
+        offset = _HEADER_SIZE
+        self.__seqs = np.ndarray(
+            (self.__slots,), dtype=np.int64, buffer=self.__shm.buf, offset=offset
+        )
+        offset += self.__slots * 8
+        self.__acks = np.ndarray(
+            (self.__slots, self.__consumers),
+            dtype=np.int64,
+            buffer=self.__shm.buf,
+            offset=offset,
+        )
+        offset += self.__slots * self.__consumers * 8
+        offset = -(-offset // _ALIGNMENT) * _ALIGNMENT
+        self.__frames = np.ndarray(
+            (self.__slots,) + self.__frame_shape,
+            dtype=self.__dtype,
+            buffer=self.__shm.buf,
+            offset=offset,
+        )
+        if self.__owner:
+            self.__seqs[:] = 0
+            self.__acks[:] = 0
+        # handles next sequence number(producer only)
+        self.__next_seq = 1
+
+    @staticmethod
+    def __layout(slots, consumers, frame_nbytes):
+        """
+        This Internal method calculates total shared memory size for given ring parameters.
+        """
+        offset = _HEADER_SIZE + slots * 8 + slots * consumers * 8
+        offset = -(-offset // _ALIGNMENT) * _ALIGNMENT
+        return offset + slots * frame_nbytes
+
+    @property
+    def name(self):
+        """
+        A property object that returns name of the shared memory block, to be used for attaching consumers.
+
+        **Returns:** Shared memory block name as string.
+        """
+        return self.__shm.name
+
+    @property
+    def frame_shape(self):
+        """
+        A property object that returns shape of each frame in the ring.
+
+        **Returns:** Frame shape as tuple.
+        """
+        return self.__frame_shape
+
+    @property
+    def dtype(self):
+        """
+        A property object that returns datatype of each frame in the ring.
+
+        **Returns:** Frame datatype as `numpy.dtype`.
+        """
+        return self.__dtype
+
+    def reserve(self, timeout=None, abort=None):
+        """
+        This method waits for next slot to be acknowledged by all consumers, and reserves it for writing a new frame. _(Producer only)_
+
+        Parameters:
+            timeout (float): maximum time in seconds to wait for slot, or wait indefinitely if `None`.
+            abort (callable): function returning `True` if waiting must be aborted.
+
+        **Returns:** `(slot, seq, frame)` tuple with writable `ndarray` frame view, or `None` if aborted or timed out.
+        """
+        assert self.__owner, "Only ring owner(producer) can reserve slots!"
+        seq = self.__next_seq
+        slot = (seq - 1) % self.__slots
+        deadline = None if timeout is None else time.monotonic() + timeout
+        # wait until frame in slot is acknowledged by all consumers
+        while self.__acks[slot].min() < self.__seqs[slot]:
+            if (abort and abort()) or (
+                not (deadline is None) and time.monotonic() > deadline
+            ):
+                return None
+            time.sleep(0.0005)
+        return (slot, seq, self.__frames[slot])
+
+    def publish(self, slot, seq):
+        """
+        This method publishes a frame written to a reserved slot. _(Producer only)_
+
+        Parameters:
+            slot (int): reserved slot index.
+            seq (int): reserved sequence number.
+
+        **Returns:** A picklable `SharedFrameHandle(slot, seq)` for consumers.
+        """
+        assert self.__owner, "Only ring owner(producer) can publish frames!"
+        self.__seqs[slot] = seq
+        self.__next_seq = seq + 1
+        return SharedFrameHandle(slot, seq)
+
+    def view(self, handle):
+        """
+        This method maps given handle to a zero-copy `ndarray` view of its frame.
+
+        Parameters:
+            handle (SharedFrameHandle): handle of published frame.
+
+        **Returns:** Frame as `ndarray` view into shared memory.
+        """
+        slot, seq = handle
+        if self.__seqs[slot] != seq:
+            raise ValueError(
+                "Frame with sequence `{}` is no longer available in slot `{}`!".format(
+                    seq, slot
+                )
+            )
+        return self.__frames[slot]
+
+    def release(self, handle):
+        """
+        This method acknowledges given handle on behalf of this consumer, so its slot can be reused once all consumers have done the same.
+
+        Parameters:
+            handle (SharedFrameHandle): handle of published frame.
+        """
+        slot, seq = handle
+        if self.__acks[slot, self.__consumer_id] < seq:
+            self.__acks[slot, self.__consumer_id] = seq
+
+    def close(self):
+        """
+        Safely closes access to the shared memory block from this instance.
+        """
+        # drop all views before closing
+        self.__seqs = self.__acks = self.__frames = None
+        try:
+            self.__shm.close()
+        except Exception as e:
+            logger.exception(str(e))
+
+    def unlink(self):
+        """
+        Safely closes and destroys the shared memory block. _(Producer only)_
+        """
+        self.close()
+        if self.__owner:
+            _OWNED_RINGS.discard(self.__shm.name)
+            try:
+                self.__shm.unlink()
+            except FileNotFoundError:
+                pass
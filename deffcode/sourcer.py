@@ -26,16 +26,27 @@
 import logging
 import platform
 import numpy as np
+from fractions import Fraction
 
 # import utils packages
-from .utils import logger_handler, validate_device_index, dict2Args
+from .utils import (
+    logger_handler,
+    validate_device_index,
+    dict2Args,
+    log_version,
+    ProbeCache,
+)
 from .ffhelper import (
     check_sp_output,
+    acheck_sp_output,
+    FFmpegCapabilities,
     get_supported_demuxers,
     is_valid_url,
     is_valid_image_seq,
     get_valid_ffmpeg_path,
     extract_device_n_demuxer,
+    get_ffmpeg_binary_key,
+    get_ffprobe_path,
 )
 
 # define logger
@@ -44,6 +55,124 @@
 logger.addHandler(logger_handler())
 logger.setLevel(logging.DEBUG)
 
+# precompiled patterns for parsing FFmpeg's metadata
+_video_bitrate_pattern = re.compile(r",\s[0-9]+\s\w\w[\/]s")
+_video_decoder_pattern = re.compile(r"Video:\s[a-z0-9_-]*")
+_video_pixfmt_pattern = re.compile(r",\s[a-z][a-z0-9_-]*")
+_audio_bitrate_pattern = re.compile(r"[\w)]+,\s[0-9]+\s\w\w[\/]s")
+_audio_samplerate_pattern = re.compile(r",\s[0-9]+\sHz")
+_resolution_pattern = re.compile(r"([1-9]\d+)x([1-9]\d+)")
+_framerate_pattern = re.compile(r"\d+(?:\.\d+)?\sfps")
+_tbr_pattern = re.compile(r"\d+(?:\.\d+)?\stbr")
+_number_pattern = re.compile(r"[\d\.\d]+")
+_orientation_pattern = re.compile(r"[-]?\d+\.\d+")
+_duration_pattern = re.compile(
+    r"(?:[01]\d|2[0123]):(?:[012345]\d):(?:[012345]\d+(?:\.\d+)?)"
+)
+_stream_pattern = re.compile(
+    r"Stream #\d+:(\d+)(?:\[\w+\])?(?:\((\w+)\))?:\s(\w+):\s([a-z0-9_-]+)"
+)
+_stream_bitrate_pattern = re.compile(r",\s([0-9]+)\skb[\/]s")
+_channel_layout_pattern = re.compile(r"\sHz,\s([^,]+)")
+_disposition_pattern = re.compile(r"\(([a-z ]+)\)")
+
+# stream dispositions printed by FFmpeg
+_dispositions = [
+    "default",
+    "dub",
+    "original",
+    "comment",
+    "lyrics",
+    "karaoke",
+    "forced",
+    "hearing impaired",
+    "visual impaired",
+    "clean effects",
+    "attached pic",
+    "timed thumbnails",
+    "non diegetic",
+    "captions",
+    "descriptions",
+    "metadata",
+    "dependent",
+    "still image",
+]
+
+
+class StreamInfo:
+    """
+    ## StreamInfo
+
+    Compact record of a single stream of the probed source, with its properties that are unknown or not applicable
+    to its type set to `None`.
+
+    Its `kind_index` attribute is the position of the stream among streams of the same type, as expected by
+    `default_stream_indexes` parameter of Sourcer API's `probe_stream()` method.
+    """
+
+    __slots__ = (
+        "index",
+        "kind",
+        "kind_index",
+        "codec",
+        "language",
+        "width",
+        "height",
+        "framerate",
+        "pixfmt",
+        "bitrate",
+        "samplerate",
+        "channel_layout",
+        "disposition",
+    )
+
+    def __init__(self, index, kind, kind_index, codec="", **properties):
+        """
+        This constructor method initializes the object state and attributes of the StreamInfo Class.
+
+        Parameters:
+            index (int): index of stream within source.
+            kind (str): type of stream, i.e. `video`, `audio`, `subtitle`, `data` or `attachment`.
+            kind_index (int): index of stream among streams of same type.
+            codec (str): name of stream's codec.
+            properties (dict): rest of stream properties, i.e. `language`, `width` and `height` in pixels, `framerate`,
+                `pixfmt`, `bitrate` in kb/s, `samplerate` in Hz, `channel_layout`, and `disposition` tuple.
+        """
+        self.index = index
+        self.kind = kind
+        self.kind_index = kind_index
+        self.codec = codec
+        for name in self.__slots__[4:]:
+            setattr(self, name, properties.pop(name, None))
+        self.disposition = tuple(self.disposition or ())
+        assert not properties, "Invalid stream properties: {}".format(list(properties))
+
+    @property
+    def resolution(self):
+        """
+        A property object that returns `(width, height)` of video stream, or `None`.
+        """
+        return (
+            (self.width, self.height)
+            if not (self.width is None or self.height is None)
+            else None
+        )
+
+    def to_dict(self):
+        """
+        Returns stream properties as python dictionary.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return "StreamInfo({})".format(
+            ", ".join(
+                "{}={!r}".format(name, getattr(self, name))
+                for name in self.__slots__
+                if not (getattr(self, name) is None)
+            )
+        )
+
 
 class Sourcer:
     """
@@ -94,9 +223,16 @@ def __init__(
         self.__verbose_logs = (  # enable verbose if specified
             verbose if (verbose and isinstance(verbose, bool)) else False
         )
+        # log current version for debugging
+        self.__verbose_logs and log_version()
 
         # handle metadata received
         self.__ffsp_output = None
+        # handle lines of input and output stream records parsed from metadata
+        self.__input_lines = None
+        self.__output_lines = None
+        # handle records of all probed streams
+        self.__streams = []
 
         # sanitize sourcer_params
         self.__sourcer_params = {
@@ -116,6 +252,45 @@ def __init__(
             # reset improper values
             self.__forcevalidatesource = False
 
+        # handle source metadata probe cache (if specified)
+        probe_cache = self.__sourcer_params.pop("-probe_cache", False)
+        if probe_cache is True or (isinstance(probe_cache, str) and probe_cache):
+            self.__probe_cache = ProbeCache.get_shared(
+                path=None if probe_cache is True else probe_cache
+            )
+        else:
+            # reset improper values
+            probe_cache is False or logger.warning(
+                "Discarding invalid `-probe_cache` value: `{}`!".format(probe_cache)
+            )
+            self.__probe_cache = None
+
+        # handle timeout(in seconds) of each probing subprocess
+        self.__probe_timeout = self.__sourcer_params.pop("-probe_timeout", None)
+        if not (self.__probe_timeout is None) and (
+            not isinstance(self.__probe_timeout, (int, float))
+            or isinstance(self.__probe_timeout, bool)
+            or self.__probe_timeout <= 0
+        ):
+            # reset improper values
+            logger.warning(
+                "Discarding invalid `-probe_timeout` value: `{}`!".format(
+                    self.__probe_timeout
+                )
+            )
+            self.__probe_timeout = None
+
+        # handle metadata probing backend
+        self.__probe_backend = self.__sourcer_params.pop("-probe_backend", "regex")
+        if not (self.__probe_backend in ["auto", "ffprobe", "regex"]):
+            # reset improper values
+            logger.warning(
+                "Discarding invalid `-probe_backend` value: `{}`!".format(
+                    self.__probe_backend
+                )
+            )
+            self.__probe_backend = "regex"
+
         # handle user defined ffmpeg pre-headers(parameters such as `-re`) parameters (must be a list)
         self.__ffmpeg_prefixes = self.__sourcer_params.pop("-ffprefixes", [])
         if not isinstance(self.__ffmpeg_prefixes, list):
@@ -153,6 +328,17 @@ def __init__(
                 "[DeFFcode:ERROR] :: Failed to find FFmpeg assets on this system. Kindly compile/install FFmpeg or provide a valid custom FFmpeg binary path!"
             )
 
+        # find FFprobe binaries next to FFmpeg (if required)
+        self.__ffprobe = (
+            get_ffprobe_path(self.__ffmpeg) if self.__probe_backend != "regex" else None
+        )
+        if self.__probe_backend == "ffprobe" and self.__ffprobe is None:
+            logger.warning(
+                "Failed to find FFprobe binaries next to FFmpeg. Falling back to `regex` probe backend!"
+            )
+        # handles metadata probed with FFprobe
+        self.__ffprobe_metadata = None
+
         # sanitize externally accessible parameters and assign them
         # handles source demuxer
         if source is None:
@@ -241,62 +427,146 @@ def probe_stream(self, default_stream_indexes=(0, 0)):
             and all(isinstance(x, int) for x in default_stream_indexes)
         ), "Invalid default_stream_indexes value!"
         # validate source and extract metadata
-        self.__ffsp_output = self.__validate_source(
+        self.__ffsp_output = self.__run_probe(
+            self.__validate_source(
+                self.__source,
+                source_demuxer=self.__source_demuxer,
+                forced_validate=(
+                    self.__forcevalidatesource
+                    if self.__source_demuxer is None
+                    else True
+                ),
+            )
+        )
+        # parse metadata and return reference to the instance object.
+        return self.__parse_probed_metadata(default_stream_indexes)
+
+    async def aprobe_stream(self, default_stream_indexes=(0, 0)):
+        """
+        This method is the [asyncio](https://docs.python.org/3/library/asyncio.html) counterpart of `probe_stream()` method,
+        that runs source validation and metadata probing commands in non-blocking `asyncio` subprocesses, so that many sources
+        can be probed concurrently within a single event loop.
+
+        Probing is aborted and its subprocess is killed, if the awaiting task is cancelled, or if `-probe_timeout` parameter
+        is defined and exceeded _(with `subprocess.TimeoutExpired` error)_.
+
+        !!! warning "Enumerating devices for `source_demuxer="auto"` still runs blocking subprocesses."
+
+        Parameters:
+            default_stream_indexes (list, tuple): selects specific video and audio stream index in case of multiple ones. Value can be of format: `(int,int)`. For example `(0,1)` is ("0th video stream", "1st audio stream").
+
+        **Returns:** Reference to the instance object.
+        """
+        assert (
+            isinstance(default_stream_indexes, (list, tuple))
+            and len(default_stream_indexes) == 2
+            and all(isinstance(x, int) for x in default_stream_indexes)
+        ), "Invalid default_stream_indexes value!"
+        # query FFmpeg capabilities required for validating source beforehand
+        if not (self.__source_demuxer is None):
+            capabilities = ["demuxers"] if self.__source_demuxer != "auto" else []
+        elif not self.__forcevalidatesource and not os.path.isfile(self.__source):
+            # URLs validation also requires demuxers (for e.g. RTSP)
+            capabilities = ["image_pipe_formats", "protocols", "demuxers"]
+        else:
+            capabilities = []
+        capabilities and await FFmpegCapabilities.get(self.__ffmpeg).aprefetch(
+            *capabilities
+        )
+        # validate source and extract metadata
+        probe = self.__validate_source(
             self.__source,
             source_demuxer=self.__source_demuxer,
             forced_validate=(
                 self.__forcevalidatesource if self.__source_demuxer is None else True
             ),
         )
-        # parse resolution and framerate
-        video_rfparams = self.__extract_resolution_framerate(
-            default_stream=default_stream_indexes[0]
-        )
-        if video_rfparams:
-            self.__default_video_resolution = video_rfparams["resolution"]
-            self.__default_video_framerate = video_rfparams["framerate"]
-            self.__default_video_orientation = video_rfparams["orientation"]
+        try:
+            cmd = next(probe)
+            while True:
+                output = await acheck_sp_output(
+                    cmd, force_retrieve_stderr=True, timeout=self.__probe_timeout
+                )
+                cmd = probe.send(output.decode("utf-8").strip())
+        except StopIteration as result:
+            self.__ffsp_output = result.value
+        finally:
+            probe.close()
+        # parse metadata and return reference to the instance object.
+        return self.__parse_probed_metadata(default_stream_indexes)
+
+    def __parse_probed_metadata(self, default_stream_indexes=(0, 0)):
+        """
+        This Internal method parses probed metadata and Populates the information in private class variables.
 
-        # parse output parameters through filters (if available)
-        if not (self.__metadata_output is None):
-            # parse output resolution and framerate
-            out_video_rfparams = self.__extract_resolution_framerate(
-                default_stream=default_stream_indexes[0], extract_output=True
-            )
-            if out_video_rfparams:
-                self.__output_frames_resolution = out_video_rfparams["resolution"]
-                self.__output_framerate = out_video_rfparams["framerate"]
-                self.__output_orientation = out_video_rfparams["orientation"]
-            # parse output pixel-format
-            self.__output_frames_pixfmt = self.__extract_video_pixfmt(
-                default_stream=default_stream_indexes[0], extract_output=True
-            )
-
-        # parse pixel-format
-        self.__default_video_pixfmt = self.__extract_video_pixfmt(
-            default_stream=default_stream_indexes[0]
-        )
+        Parameters:
+            default_stream_indexes (list, tuple): selects specific video and audio stream index in case of multiple ones.
 
-        # parse video decoder
-        self.__default_video_decoder = self.__extract_video_decoder(
-            default_stream=default_stream_indexes[0]
-        )
-        # parse rest of metadata
-        if not self.__contains_images:
-            # parse video bitrate
-            self.__default_video_bitrate = self.__extract_video_bitrate(
+        **Returns:** Reference to the instance object.
+        """
+        if not (self.__ffprobe_metadata is None):
+            # parse structured metadata probed with FFprobe
+            self.__parse_ffprobe_metadata(default_stream_indexes)
+        else:
+            # split input and output metadata into stream records once
+            self.__input_lines = self.__parse_metadata_lines(self.__ffsp_output)
+            self.__output_lines = (
+                self.__parse_metadata_lines(self.__metadata_output)
+                if not (self.__metadata_output is None)
+                else None
+            )
+            # parse records of all streams
+            self.__streams = self.__parse_stream_records(self.__input_lines["streams"])
+            # parse resolution and framerate
+            video_rfparams = self.__extract_resolution_framerate(
+                default_stream=default_stream_indexes[0]
+            )
+            if video_rfparams:
+                self.__default_video_resolution = video_rfparams["resolution"]
+                self.__default_video_framerate = video_rfparams["framerate"]
+                self.__default_video_orientation = video_rfparams["orientation"]
+
+            # parse output parameters through filters (if available)
+            if not (self.__metadata_output is None):
+                # parse output resolution and framerate
+                out_video_rfparams = self.__extract_resolution_framerate(
+                    default_stream=default_stream_indexes[0], extract_output=True
+                )
+                if out_video_rfparams:
+                    self.__output_frames_resolution = out_video_rfparams["resolution"]
+                    self.__output_framerate = out_video_rfparams["framerate"]
+                    self.__output_orientation = out_video_rfparams["orientation"]
+                # parse output pixel-format
+                self.__output_frames_pixfmt = self.__extract_video_pixfmt(
+                    default_stream=default_stream_indexes[0], extract_output=True
+                )
+
+            # parse pixel-format
+            self.__default_video_pixfmt = self.__extract_video_pixfmt(
                 default_stream=default_stream_indexes[0]
             )
-            # parse audio bitrate and samplerate
-            audio_params = self.__extract_audio_bitrate_nd_samplerate(
-                default_stream=default_stream_indexes[1]
+
+            # parse video decoder
+            self.__default_video_decoder = self.__extract_video_decoder(
+                default_stream=default_stream_indexes[0]
             )
-            if audio_params:
-                self.__default_audio_bitrate = audio_params["bitrate"]
-                self.__default_audio_samplerate = audio_params["samplerate"]
-            # parse video duration
-            self.__default_source_duration = self.__extract_duration()
-            # calculate all flags
+            # parse rest of metadata
+            if not self.__contains_images:
+                # parse video bitrate
+                self.__default_video_bitrate = self.__extract_video_bitrate(
+                    default_stream=default_stream_indexes[0]
+                )
+                # parse audio bitrate and samplerate
+                audio_params = self.__extract_audio_bitrate_nd_samplerate(
+                    default_stream=default_stream_indexes[1]
+                )
+                if audio_params:
+                    self.__default_audio_bitrate = audio_params["bitrate"]
+                    self.__default_audio_samplerate = audio_params["samplerate"]
+                # parse video duration
+                self.__default_source_duration = self.__extract_duration()
+        # calculate all flags
+        if not self.__contains_images:
             if (
                 self.__default_video_bitrate
                 or (self.__default_video_framerate and self.__default_video_resolution)
@@ -313,8 +583,12 @@ def probe_stream(self, default_stream_indexes=(0, 0)):
                 raise ValueError(
                     "Invalid source with no decodable audio or video stream provided. Aborting!"
                 )
-        # calculate approximate number of video frame
-        if self.__default_video_framerate and self.__default_source_duration:
+        # calculate approximate number of video frame (if not probed already)
+        if (
+            not self.__approx_video_nframes
+            and self.__default_video_framerate
+            and self.__default_source_duration
+        ):
             self.__approx_video_nframes = np.rint(
                 self.__default_video_framerate * self.__default_source_duration
             ).astype(int, casting="unsafe")
@@ -441,15 +715,170 @@ def enumerate_devices(self):
             dev_idx: dev for dev_idx, dev in enumerate(self.__extracted_devices_list)
         }
 
+    @classmethod
+    def probe_many(
+        cls,
+        sources,
+        max_workers=None,
+        timeout=None,
+        default_stream_indexes=(0, 0),
+        source_demuxer=None,
+        custom_ffmpeg="",
+        verbose=False,
+        **sourcer_params,
+    ):
+        """
+        This method probes many sources concurrently in a thread pool, and returns a [Generator function](https://wiki.python.org/moin/Generators)
+        of `(source, metadata, error)` tuples in order of completion, where `metadata` is the probed metadata dictionary
+        _(as returned by `retrieve_metadata()` method)_ on success, and `error` is the raised exception otherwise.
+
+        All probes share the same parameters, as well as the process-wide FFmpeg capabilities registry. A failure with
+        any source is returned with its result instead of being raised, and sources are consumed lazily, so that
+        only a bounded number of probes is pending at any time.
+
+        Parameters:
+            sources (iterable): sources to be probed. Consumed lazily, so it can be a Generator itself.
+            max_workers (int): maximum number of concurrent probes. Defaults to number of CPU cores.
+            timeout (int, float): timeout of each probing subprocess in seconds. No timeout if `None`.
+            default_stream_indexes (list, tuple): selects specific video and audio stream index in case of multiple ones.
+            source_demuxer (str): specifies the demuxer(`-f`) for the input sources.
+            custom_ffmpeg (str): assigns the location of custom path/directory for custom FFmpeg executable.
+            verbose (bool): enables/disables verbose.
+            sourcer_params (dict): provides the flexibility to control supported internal and FFmpeg parameters.
+        """
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+        # reset improper values
+        if (
+            not isinstance(max_workers, int)
+            or isinstance(max_workers, bool)
+            or max_workers < 1
+        ):
+            not (max_workers is None) and logger.warning(
+                "Discarding invalid `max_workers` value: `{}`!".format(max_workers)
+            )
+            max_workers = os.cpu_count() or 1
+        if not (timeout is None):
+            sourcer_params["-probe_timeout"] = timeout
+
+        def probe(source):
+            return (
+                cls(
+                    source,
+                    source_demuxer=source_demuxer,
+                    custom_ffmpeg=custom_ffmpeg,
+                    verbose=verbose,
+                    **sourcer_params,
+                )
+                .probe_stream(default_stream_indexes=default_stream_indexes)
+                .retrieve_metadata()
+            )
+
+        sources = iter(sources)
+        pending = {}  # probing futures with their sources
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="Sourcer"
+        )
+        try:
+            while True:
+                # keep submitting next sources upto twice the concurrency limit
+                while len(pending) < 2 * max_workers:
+                    source = next(sources, StopIteration)
+                    if source is StopIteration:
+                        break
+                    pending[executor.submit(probe, source)] = source
+                if not pending:
+                    break
+                (done, _) = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    source = pending.pop(future)
+                    error = future.exception()
+                    if not (error is None):
+                        verbose and logger.error(
+                            "Failed to probe `{}` source: {}".format(source, str(error))
+                        )
+                    yield (source, None if error else future.result(), error)
+        finally:
+            # discard sources yet to be probed
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    @property
+    def streams(self):
+        """
+        A property object that returns records of all streams of the probed source, in order of their index.
+
+        **Returns:** List of [StreamInfo](#deffcode.sourcer.StreamInfo) objects.
+        """
+        # check if metadata has been probed or not
+        assert (
+            self.__metadata_probed
+        ), "Source Metadata not been probed yet! Check if you called `probe_stream()` method."
+        return list(self.__streams)
+
+    def select_stream(self, kind="video", predicate=None, key=None, reverse=False):
+        """
+        This method selects a stream of given type among all streams of the probed source, that satisfies given predicate
+        and has the lowest(or highest, if `reverse=True`) value of given key.
+
+        For example, `select_stream(key=lambda s: s.width * s.height, reverse=True)` selects the video stream with highest resolution,
+        and `select_stream(kind="audio", predicate=lambda s: s.language == "eng", key=lambda s: s.bitrate or 0)` selects the english
+        audio stream with lowest bitrate. The selected stream's `kind_index` attribute can then be used with `default_stream_indexes`
+        parameter and FFmpeg's `-map` parameter _(for e.g. `"-map": "0:v:{}".format(stream.kind_index)`)_ for decoding it.
+
+        Parameters:
+            kind (str): type of stream, i.e. `video`, `audio`, `subtitle`, `data` or `attachment`.
+            predicate (callable): function that returns whether given StreamInfo object is acceptable. Accepts all if `None`.
+            key (callable): function that returns comparable value of given StreamInfo object. Selects first acceptable stream if `None`.
+            reverse (bool): whether to select the stream with highest value of key instead of lowest.
+
+        **Returns:** Selected [StreamInfo](#deffcode.sourcer.StreamInfo) object, or `None` if no stream is acceptable.
+        """
+        candidates = [
+            x
+            for x in self.streams
+            if x.kind == kind and (predicate is None or predicate(x))
+        ]
+        if not candidates:
+            return None
+        if key is None:
+            return candidates[0]
+        return (max if reverse else min)(candidates, key=key)
+
+    def __run_probe(self, probe):
+        """
+        This Internal method drives given probe generator to completion, by executing every command it yields in a
+        blocking subprocess and sending back its decoded output.
+
+        Parameters:
+            probe (generator): probe generator _(such as returned by `__validate_source()` method)_.
+
+        **Returns:** Return value of the probe generator.
+        """
+        try:
+            cmd = next(probe)
+            while True:
+                output = check_sp_output(
+                    cmd, force_retrieve_stderr=True, timeout=self.__probe_timeout
+                )
+                cmd = probe.send(output.decode("utf-8").strip())
+        except StopIteration as result:
+            return result.value
+        finally:
+            probe.close()
+
     def __validate_source(self, source, source_demuxer=None, forced_validate=False):
         """
-        This Internal method validates source and extracts its metadata.
+        This Internal method validates source and extracts its metadata. It is a generator, that yields
+        probe commands and expects their decoded outputs to be sent back, so that they can be executed
+        either in blocking or `asyncio` subprocesses.
 
         Parameters:
             source_demuxer(str): specifies the demuxer(`-f`) for the input source.
             forced_validate (bool): whether to skip validation tests or not?
 
-        **Returns:** `True` if passed tests else `False`.
+        **Returns:** Extracted input metadata as string.
         """
         # validate source demuxer(if defined)
         if not (source_demuxer is None):
@@ -556,6 +985,14 @@ def __validate_source(self, source, source_demuxer=None, forced_validate=False):
             logger.error("`source` value is unusable or unsupported!")
             # discard the value otherwise
             raise ValueError("Input source is invalid. Aborting!")
+        # probe structured metadata with FFprobe (if available), unless output
+        # metadata through additional params(such as filters) is also required
+        if not (self.__ffprobe is None) and not self.__sourcer_params:
+            self.__ffprobe_metadata = yield from self.__probe_ffprobe(
+                source, source_demuxer
+            )
+            if not (self.__ffprobe_metadata is None):
+                return ""
         # format command
         if self.__sourcer_params:
             # handle additional params separately
@@ -567,6 +1004,7 @@ def __validate_source(self, source, source_demuxer=None, forced_validate=False):
                 + (["-f", source_demuxer] if source_demuxer else [])
                 + ["-i", source]
                 + dict2Args(self.__sourcer_params)
+                + ["-frames:v", "1"]  # `-t` alone doesn't bound infinite sources
                 + ["-f", "null", "-"]
             )
         else:
@@ -577,21 +1015,309 @@ def __validate_source(self, source, source_demuxer=None, forced_validate=False):
                 + (["-f", source_demuxer] if source_demuxer else [])
                 + ["-i", source]
             )
-        # extract metadata, decode, and filter
-        metadata = (
-            check_sp_output(
-                meta_cmd,
-                force_retrieve_stderr=True,
-            )
-            .decode("utf-8")
-            .strip()
-        )
+        # extract metadata
+        metadata = yield from self.__probeOutput(meta_cmd, source)
         # separate input and output metadata (if available)
         if "Output #" in metadata:
             (metadata, self.__metadata_output) = metadata.split("Output #")
         # return metadata based on params
         return metadata
 
+    def __probeOutput(self, meta_cmd, source):
+        """
+        This Internal generator yields given probe command for execution and returns its decoded output sent back,
+        reusing cached output for local file sources (if enabled).
+
+        Parameters:
+            meta_cmd (list): probe command.
+            source (str): input source.
+
+        **Returns:** Probe output as string.
+        """
+        # look up probed metadata of local files in cache (if enabled)
+        cache_key = (
+            self.__probeCacheKey(meta_cmd, source)
+            if not (self.__probe_cache is None)
+            else None
+        )
+        metadata = None if cache_key is None else self.__probe_cache.get(cache_key)
+        if metadata is None:
+            # extract decoded and filtered metadata
+            metadata = yield meta_cmd
+            cache_key is None or self.__probe_cache.put(cache_key, metadata)
+        else:
+            self.__verbose_logs and logger.debug(
+                "Reusing cached metadata for source: `{}`".format(source)
+            )
+        return metadata
+
+    def __probe_ffprobe(self, source, source_demuxer=None):
+        """
+        This Internal generator probes streams and format metadata of source with FFprobe, as JSON.
+
+        Parameters:
+            source (str): input source.
+            source_demuxer(str): specifies the demuxer(`-f`) for the input source.
+
+        **Returns:** Probed metadata as dictionary, or `None` if FFprobe failed.
+        """
+        probe_cmd = (
+            [self.__ffprobe, "-v", "quiet"]
+            + ["-show_streams", "-show_format", "-of", "json"]
+            + self.__ffmpeg_prefixes
+            + (["-f", source_demuxer] if source_demuxer else [])
+            + ["-i", source]
+        )
+        try:
+            metadata = json.loads((yield from self.__probeOutput(probe_cmd, source)))
+        except ValueError:
+            metadata = {}
+        if not (isinstance(metadata, dict) and metadata.get("streams")):
+            self.__verbose_logs and logger.warning(
+                "FFprobe failed to probe source. Falling back to `regex` probe backend!"
+            )
+            return None
+        return metadata
+
+    def __parse_ffprobe_metadata(self, default_stream_indexes=(0, 0)):
+        """
+        This Internal method parses metadata probed with FFprobe into same properties as parsed from FFmpeg's metadata.
+
+        Parameters:
+            default_stream_indexes (list, tuple): selects specific video and audio stream index in case of multiple ones.
+        """
+
+        def to_float(value):
+            # parses FFprobe's decimals and exact rationals(such as `30000/1001`)
+            try:
+                return float(Fraction(str(value)))
+            except (ValueError, ZeroDivisionError):
+                return 0.0
+
+        def to_int(value):
+            # parses FFprobe's integers, which are missing or `N/A` if unknown
+            try:
+                return int(value)
+            except (TypeError, ValueError):
+                return 0
+
+        def select_stream(codec_type, default_stream):
+            # selects same stream as FFmpeg's metadata parsers do
+            streams = [
+                x
+                for x in self.__ffprobe_metadata.get("streams", [])
+                if x.get("codec_type") == codec_type
+            ]
+            if not streams:
+                return None
+            return streams[default_stream if 0 < default_stream < len(streams) else 0]
+
+        # parse records of all streams
+        self.__streams = []
+        kind_counts = {}
+        for stream in self.__ffprobe_metadata.get("streams", []):
+            kind = stream.get("codec_type", "")
+            properties = {
+                "language": stream.get("tags", {}).get("language"),
+                "bitrate": to_int(stream.get("bit_rate")) // 1000 or None,
+                "disposition": [
+                    x.replace("_", " ")
+                    for x, v in stream.get("disposition", {}).items()
+                    if v
+                ],
+            }
+            if kind == "video":
+                properties.update(
+                    width=to_int(stream.get("width")) or None,
+                    height=to_int(stream.get("height")) or None,
+                    framerate=to_float(stream.get("avg_frame_rate", 0))
+                    or to_float(stream.get("r_frame_rate", 0))
+                    or None,
+                    pixfmt=stream.get("pix_fmt"),
+                )
+            elif kind == "audio":
+                properties.update(
+                    samplerate=to_int(stream.get("sample_rate")) or None,
+                    channel_layout=stream.get("channel_layout"),
+                )
+            self.__streams.append(
+                StreamInfo(
+                    to_int(stream.get("index")),
+                    kind,
+                    kind_counts.get(kind, 0),
+                    stream.get("codec_name", ""),
+                    **properties,
+                )
+            )
+            kind_counts[kind] = kind_counts.get(kind, 0) + 1
+
+        video = select_stream("video", default_stream_indexes[0])
+        audio = select_stream("audio", default_stream_indexes[1])
+        if not (video is None):
+            # parse resolution, framerate and orientation
+            framerate = to_float(video.get("avg_frame_rate", 0)) or to_float(
+                video.get("r_frame_rate", 0)
+            )
+            if video.get("width") and video.get("height") and framerate:
+                self.__default_video_resolution = [
+                    int(video["width"]),
+                    int(video["height"]),
+                ]
+                self.__default_video_framerate = framerate
+                self.__default_video_orientation = next(
+                    (
+                        to_float(x["rotation"])
+                        for x in video.get("side_data_list", [])
+                        if "rotation" in x
+                    ),
+                    0.0,
+                )
+            # parse pixel-format and decoder
+            self.__default_video_pixfmt = video.get("pix_fmt", "")
+            self.__default_video_decoder = video.get("codec_name", "")
+        # parse rest of metadata
+        if not self.__contains_images:
+            if not (video is None):
+                # parse video bitrate and exact number of frames(if available)
+                if to_int(video.get("bit_rate")):
+                    self.__default_video_bitrate = "{}k".format(
+                        to_int(video["bit_rate"]) // 1000
+                    )
+                if to_int(video.get("nb_frames")):
+                    self.__approx_video_nframes = to_int(video["nb_frames"])
+            if not (audio is None):
+                # parse audio bitrate and samplerate
+                self.__default_audio_bitrate = (
+                    "{}k".format(to_int(audio["bit_rate"]) // 1000)
+                    if to_int(audio.get("bit_rate"))
+                    else ""
+                )
+                self.__default_audio_samplerate = (
+                    "{} Hz".format(audio["sample_rate"])
+                    if audio.get("sample_rate")
+                    else ""
+                )
+            # parse duration
+            self.__default_source_duration = to_float(
+                self.__ffprobe_metadata.get("format", {}).get("duration", 0)
+            )
+
+    @staticmethod
+    def __probeCacheKey(meta_cmd, source):
+        """
+        This Internal method identifies probe of a local file source by FFmpeg binary, absolute path, size and
+        modification time of source, and rest of probe command _(including filters and other parameters)_. Stream
+        indexes aren't part of it, since they are selected only while parsing the cached metadata.
+
+        Parameters:
+            meta_cmd (list): probe command.
+            source (str): input source.
+
+        **Returns:** Cache key as string, or `None` if source isn't a local file.
+        """
+        try:
+            stat = os.stat(source) if os.path.isfile(source) else None
+        except OSError:
+            stat = None
+        if stat is None:
+            return None
+        return json.dumps(
+            [
+                get_ffmpeg_binary_key(meta_cmd[0]) or meta_cmd[0],
+                os.path.abspath(source),
+                stat.st_size,
+                stat.st_mtime_ns,
+                [x if x != source else "{source}" for x in meta_cmd[1:]],
+            ]
+        )
+
+    @staticmethod
+    def __parse_metadata_lines(metadata):
+        """
+        This Internal method splits FFmpeg's metadata into lines of each kind of stream records, in a single pass.
+
+        Parameters:
+            metadata (str): FFmpeg's metadata.
+
+        **Returns:** Dictionary of `streams`(all types), `video`, `audio`, `orientation` and `duration` lists of stripped lines, in order of streams.
+        """
+        records = {
+            "streams": [],
+            "video": [],
+            "audio": [],
+            "orientation": [],
+            "duration": [],
+        }
+        for line in metadata.split("\n"):
+            if "Stream #" in line:
+                records["streams"].append(line.strip())
+                if "Video:" in line:
+                    records["video"].append(line.strip())
+                if "Audio:" in line:
+                    records["audio"].append(line.strip())
+            if "displaymatrix:" in line and "rotation" in line:
+                records["orientation"].append(line.strip())
+            if "Duration:" in line:
+                records["duration"].append(line.strip())
+        return records
+
+    @staticmethod
+    def __parse_stream_records(lines):
+        """
+        This Internal method parses stream lines of FFmpeg's metadata into stream records.
+
+        Parameters:
+            lines (list): stream lines of FFmpeg's metadata.
+
+        **Returns:** List of StreamInfo objects.
+        """
+        streams = []
+        kind_counts = {}
+        for line in lines:
+            matched = _stream_pattern.search(line)
+            if matched is None:
+                continue
+            (index, language, kind, codec) = matched.groups()
+            kind = kind.lower()
+            bitrate = _stream_bitrate_pattern.findall(line)
+            properties = {
+                "language": language,
+                "bitrate": int(bitrate[0]) if bitrate else None,
+                "disposition": [
+                    x for x in _disposition_pattern.findall(line) if x in _dispositions
+                ],
+            }
+            if kind == "video":
+                resolution = _resolution_pattern.findall(line)
+                if resolution:
+                    (properties["width"], properties["height"]) = (
+                        int(x) for x in resolution[0]
+                    )
+                framerate = _framerate_pattern.findall(line) or _tbr_pattern.findall(
+                    line
+                )
+                if framerate:
+                    properties["framerate"] = float(
+                        _number_pattern.findall(framerate[0])[0]
+                    )
+                pixfmt = _video_pixfmt_pattern.findall(line)
+                if pixfmt:
+                    properties["pixfmt"] = pixfmt[0].split(" ")[-1]
+            elif kind == "audio":
+                samplerate = _audio_samplerate_pattern.findall(line)
+                if samplerate:
+                    properties["samplerate"] = int(samplerate[0].split(" ")[1])
+                channel_layout = _channel_layout_pattern.findall(line)
+                if channel_layout:
+                    properties["channel_layout"] = channel_layout[0].strip()
+            streams.append(
+                StreamInfo(
+                    int(index), kind, kind_counts.get(kind, 0), codec, **properties
+                )
+            )
+            kind_counts[kind] = kind_counts.get(kind, 0) + 1
+        return streams
+
     def __extract_video_bitrate(self, default_stream=0):
         """
         This Internal method parses default video-stream bitrate from metadata.
@@ -601,12 +1327,7 @@ def __extract_video_bitrate(self, default_stream=0):
 
         **Returns:** Default Video bitrate as string value.
         """
-        identifiers = ["Video:", "Stream #"]
-        video_bitrate_text = [
-            line.strip()
-            for line in self.__ffsp_output.split("\n")
-            if all(x in line for x in identifiers)
-        ]
+        video_bitrate_text = self.__input_lines["video"]
         if video_bitrate_text:
             selected_stream = video_bitrate_text[
                 (
@@ -615,9 +1336,7 @@ def __extract_video_bitrate(self, default_stream=0):
                     else 0
                 )
             ]
-            filtered_bitrate = re.findall(
-                r",\s[0-9]+\s\w\w[\/]s", selected_stream.strip()
-            )
+            filtered_bitrate = _video_bitrate_pattern.findall(selected_stream)
             if len(filtered_bitrate):
                 default_video_bitrate = filtered_bitrate[0].split(" ")[1:3]
                 final_bitrate = "{}{}".format(
@@ -637,12 +1356,7 @@ def __extract_video_decoder(self, default_stream=0):
         **Returns:** Default Video decoder as string value.
         """
         assert isinstance(default_stream, int), "Invalid input!"
-        identifiers = ["Video:", "Stream #"]
-        meta_text = [
-            line.strip()
-            for line in self.__ffsp_output.split("\n")
-            if all(x in line for x in identifiers)
-        ]
+        meta_text = self.__input_lines["video"]
         if meta_text:
             selected_stream = meta_text[
                 (
@@ -651,9 +1365,7 @@ def __extract_video_decoder(self, default_stream=0):
                     else 0
                 )
             ]
-            filtered_pixfmt = re.findall(
-                r"Video:\s[a-z0-9_-]*", selected_stream.strip()
-            )
+            filtered_pixfmt = _video_decoder_pattern.findall(selected_stream)
             if filtered_pixfmt:
                 return filtered_pixfmt[0].split(" ")[-1]
         return ""
@@ -667,19 +1379,10 @@ def __extract_video_pixfmt(self, default_stream=0, extract_output=False):
 
         **Returns:** Default Video pixel-format as string value.
         """
-        identifiers = ["Video:", "Stream #"]
         meta_text = (
-            [
-                line.strip()
-                for line in self.__ffsp_output.split("\n")
-                if all(x in line for x in identifiers)
-            ]
+            self.__input_lines["video"]
             if not extract_output
-            else [
-                line.strip()
-                for line in self.__metadata_output.split("\n")
-                if all(x in line for x in identifiers)
-            ]
+            else self.__output_lines["video"]
         )
         if meta_text:
             selected_stream = meta_text[
@@ -689,9 +1392,7 @@ def __extract_video_pixfmt(self, default_stream=0, extract_output=False):
                     else 0
                 )
             ]
-            filtered_pixfmt = re.findall(
-                r",\s[a-z][a-z0-9_-]*", selected_stream.strip()
-            )
+            filtered_pixfmt = _video_pixfmt_pattern.findall(selected_stream)
             if filtered_pixfmt:
                 return filtered_pixfmt[0].split(" ")[-1]
         return ""
@@ -705,12 +1406,7 @@ def __extract_audio_bitrate_nd_samplerate(self, default_stream=0):
 
         **Returns:** Default Audio-stream bitrate and sample-rate as string value.
         """
-        identifiers = ["Audio:", "Stream #"]
-        meta_text = [
-            line.strip()
-            for line in self.__ffsp_output.split("\n")
-            if all(x in line for x in identifiers)
-        ]
+        meta_text = self.__input_lines["audio"]
         result = {}
         if meta_text:
             selected_stream = meta_text[
@@ -721,11 +1417,9 @@ def __extract_audio_bitrate_nd_samplerate(self, default_stream=0):
                 )
             ]
             # filter data
-            filtered_audio_bitrate = re.findall(
-                r"fltp,\s[0-9]+\s\w\w[\/]s", selected_stream.strip()
-            )
-            filtered_audio_samplerate = re.findall(
-                r",\s[0-9]+\sHz", selected_stream.strip()
+            filtered_audio_bitrate = _audio_bitrate_pattern.findall(selected_stream)
+            filtered_audio_samplerate = _audio_samplerate_pattern.findall(
+                selected_stream
             )
             # get audio bitrate metadata
             if filtered_audio_bitrate:
@@ -754,36 +1448,11 @@ def __extract_resolution_framerate(self, default_stream=0, extract_output=False)
 
         **Returns:** Default Video resolution and framerate as dictionary value.
         """
-        identifiers = ["Video:", "Stream #"]
         # use output metadata if available
-        meta_text = (
-            [
-                line.strip()
-                for line in self.__ffsp_output.split("\n")
-                if all(x in line for x in identifiers)
-            ]
-            if not extract_output
-            else [
-                line.strip()
-                for line in self.__metadata_output.split("\n")
-                if all(x in line for x in identifiers)
-            ]
-        )
+        records = self.__input_lines if not extract_output else self.__output_lines
+        meta_text = records["video"]
         # extract video orientation metadata if available
-        identifiers_orientation = ["displaymatrix:", "rotation"]
-        meta_text_orientation = (
-            [
-                line.strip()
-                for line in self.__ffsp_output.split("\n")
-                if all(x in line for x in identifiers_orientation)
-            ]
-            if not extract_output
-            else [
-                line.strip()
-                for line in self.__metadata_output.split("\n")
-                if all(x in line for x in identifiers_orientation)
-            ]
-        )
+        meta_text_orientation = records["orientation"]
         # use metadata if available
         result = {}
         if meta_text:
@@ -796,25 +1465,19 @@ def __extract_resolution_framerate(self, default_stream=0, extract_output=False)
             ]
 
             # filter data
-            filtered_resolution = re.findall(
-                r"([1-9]\d+)x([1-9]\d+)", selected_stream.strip()
-            )
-            filtered_framerate = re.findall(
-                r"\d+(?:\.\d+)?\sfps", selected_stream.strip()
-            )
-            filtered_tbr = re.findall(r"\d+(?:\.\d+)?\stbr", selected_stream.strip())
+            filtered_resolution = _resolution_pattern.findall(selected_stream)
+            filtered_framerate = _framerate_pattern.findall(selected_stream)
+            filtered_tbr = _tbr_pattern.findall(selected_stream)
 
             # extract framerate metadata
             if filtered_framerate:
                 # calculate actual framerate
                 result["framerate"] = float(
-                    re.findall(r"[\d\.\d]+", filtered_framerate[0])[0]
+                    _number_pattern.findall(filtered_framerate[0])[0]
                 )
             elif filtered_tbr:
                 # guess from TBR(if fps unavailable)
-                result["framerate"] = float(
-                    re.findall(r"[\d\.\d]+", filtered_tbr[0])[0]
-                )
+                result["framerate"] = float(_number_pattern.findall(filtered_tbr[0])[0])
 
             # extract resolution metadata
             if filtered_resolution:
@@ -829,9 +1492,7 @@ def __extract_resolution_framerate(self, default_stream=0, extract_output=False)
                         else 0
                     )
                 ]
-                filtered_orientation = re.findall(
-                    r"[-]?\d+\.\d+", selected_stream.strip()
-                )
+                filtered_orientation = _orientation_pattern.findall(selected_stream)
                 result["orientation"] = float(filtered_orientation[0])
             else:
                 result["orientation"] = 0.0
@@ -847,17 +1508,9 @@ def __extract_duration(self, inseconds=True):
 
         **Returns:** Default Stream duration as string value.
         """
-        identifiers = ["Duration:"]
-        stripped_data = [
-            line.strip()
-            for line in self.__ffsp_output.split("\n")
-            if all(x in line for x in identifiers)
-        ]
+        stripped_data = self.__input_lines["duration"]
         if stripped_data:
-            t_duration = re.findall(
-                r"(?:[01]\d|2[0123]):(?:[012345]\d):(?:[012345]\d+(?:\.\d+)?)",
-                stripped_data[0],
-            )
+            t_duration = _duration_pattern.findall(stripped_data[0])
             if t_duration:
                 return (
                     sum(
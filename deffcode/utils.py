@@ -23,13 +23,35 @@
 # import the necessary packages
 import os, sys
 import logging
+import threading
 from pathlib import Path
-from colorlog import ColoredFormatter
+from contextlib import closing
+from collections import OrderedDict
 
 # import internal packages
 from .version import __version__
 
 
+class _LazyColoredFormatter(logging.Formatter):
+    """
+    A logging formatter that creates `colorlog`'s ColoredFormatter on first formatted record,
+    so that `colorlog` isn't imported until something is actually logged.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.__args = args
+        self.__kwargs = kwargs
+        self.__formatter = None
+
+    def format(self, record):
+        if self.__formatter is None:
+            from colorlog import ColoredFormatter
+
+            self.__formatter = ColoredFormatter(*self.__args, **self.__kwargs)
+        return self.__formatter.format(record)
+
+
 def logger_handler():
     """
     ## logger_handler
@@ -39,7 +61,7 @@ def logger_handler():
     **Returns:** A logger handler
     """
     # logging formatter
-    formatter = ColoredFormatter(
+    formatter = _LazyColoredFormatter(
         "{green}{asctime}{reset} :: {bold_purple}{name:^13}{reset} :: {log_color}{levelname:^8}{reset} :: {bold_white}{message}",
         datefmt="%H:%M:%S",
         reset=True,
@@ -82,8 +104,20 @@ def logger_handler():
 logger.propagate = False
 logger.addHandler(logger_handler())
 logger.setLevel(logging.DEBUG)
-# log current version for debugging
-logger.info("Running DeFFcode Version: {}".format(str(__version__)))
+
+# handles whether current version is logged already
+_version_logged = threading.Event()
+
+
+def log_version():
+    """
+    ## log_version
+
+    Logs current DeFFcode version for debugging, only once per process.
+    """
+    if not _version_logged.is_set():
+        _version_logged.set()
+        logger.info("Running DeFFcode Version: {}".format(str(__version__)))
 
 
 def dict2Args(param_dict):
@@ -161,3 +195,273 @@ def validate_device_index(index):
     else:
         # return false otherwise
         return False
+
+
+class LatencyHistogram:
+    """
+    ## LatencyHistogram
+
+    Fixed-size histogram of durations with logarithmic(base-2) microseconds buckets, which records each
+    duration in constant time and memory.
+    """
+
+    # number of buckets, where bucket `k` holds durations within `[2^(k-1), 2^k)` microseconds
+    num_buckets = 32
+
+    __slots__ = ("counts", "count", "total", "minimum", "maximum")
+
+    def __init__(self):
+        self.counts = [0] * self.num_buckets
+        self.count = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = 0.0
+
+    def record(self, seconds):
+        """
+        Records given duration.
+
+        Parameters:
+            seconds (float): duration in seconds.
+        """
+        bucket = int(seconds * 1e6).bit_length() if seconds > 0 else 0
+        self.counts[min(bucket, self.num_buckets - 1)] += 1
+        self.count += 1
+        self.total += seconds
+        if self.minimum is None or seconds < self.minimum:
+            self.minimum = seconds
+        if seconds > self.maximum:
+            self.maximum = seconds
+
+    def percentile(self, fraction):
+        """
+        Estimates given percentile as upper bound of the bucket it falls in.
+
+        Parameters:
+            fraction (float): percentile as fraction within `(0, 1]`.
+
+        **Returns:** Duration in seconds, or `None` if empty.
+        """
+        if not self.count:
+            return None
+        threshold = fraction * self.count
+        cumulative = 0
+        for bucket, num in enumerate(self.counts):
+            cumulative += num
+            if num and cumulative >= threshold:
+                break
+        return min((1 << bucket) / 1e6, self.maximum)
+
+    def snapshot(self):
+        """
+        Returns current state of histogram.
+
+        **Returns:** A dictionary of count, total, mean, min, max, estimated p50/p90/p99 durations in seconds,
+        and non-empty `buckets` as `{upper bound in microseconds: count}` dictionary.
+        """
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else None,
+            "min": self.minimum,
+            "max": self.maximum if self.count else None,
+            "p50": self.percentile(0.5),
+            "p90": self.percentile(0.9),
+            "p99": self.percentile(0.99),
+            "buckets": {1 << k: num for k, num in enumerate(self.counts) if num},
+        }
+
+
+class ProbeCache:
+    """
+    ## ProbeCache
+
+    Thread-safe cache of source probing outputs, held in memory with Least-Recently-Used(LRU) eviction, and
+    optionally persisted to a SQLite database _(for `.db`, `.sqlite` or `.sqlite3` file extensions)_ or a JSON file
+    _(for any other extension)_, so that it is shared across processes and runs.
+
+    !!! tip "Use `ProbeCache.get_shared(path)` to obtain the cache shared in the process for given file."
+    """
+
+    # handles shared caches per file path
+    __shared = {}
+    __shared_lock = threading.Lock()
+
+    def __init__(self, path=None, maxsize=256):
+        """
+        This constructor method initializes the object state and attributes of the ProbeCache Class.
+
+        Parameters:
+            path (str): persistent cache file path. Cache lives only in memory if `None`.
+            maxsize (int): maximum number of entries kept in memory, as well as in JSON persistent file.
+        """
+        self.__path = os.path.abspath(path) if path else None
+        self.__sqlite = bool(self.__path) and self.__path.lower().endswith(
+            (".db", ".sqlite", ".sqlite3")
+        )
+        self.__maxsize = max(1, int(maxsize))
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def get_shared(cls, path=None):
+        """
+        Returns cache shared in the process for given file path, creating it if needed.
+
+        Parameters:
+            path (str): persistent cache file path. Cache lives only in memory if `None`.
+
+        **Returns:** A ProbeCache object.
+        """
+        path = os.path.abspath(path) if path else None
+        with cls.__shared_lock:
+            cache = cls.__shared.get(path)
+            if cache is None:
+                cache = cls.__shared[path] = cls(path=path)
+        return cache
+
+    @property
+    def path(self):
+        """
+        A property object that returns persistent cache file path, or `None`.
+        """
+        return self.__path
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def get(self, key):
+        """
+        Returns cached value of given key, looking up persistent file on misses in memory.
+
+        Parameters:
+            key (str): cache key.
+
+        **Returns:** Cached value as string, or `None` if missing.
+        """
+        with self.__lock:
+            value = self.__entries.get(key)
+            if not (value is None):
+                self.__entries.move_to_end(key)
+                return value
+        value = self.__load(key) if self.__path else None
+        if not (value is None):
+            self.__remember(key, value)
+        return value
+
+    def put(self, key, value):
+        """
+        Caches given value for given key, in memory as well as in persistent file (if defined).
+
+        Parameters:
+            key (str): cache key.
+            value (str): value to be cached.
+        """
+        self.__remember(key, value)
+        if self.__path:
+            try:
+                self.__store(key, value)
+            except Exception as e:
+                # cache is only an optimization
+                logger.warning(
+                    "Failed to write probe cache `{}`: {}".format(self.__path, str(e))
+                )
+
+    def clear(self):
+        """
+        Discards all cached entries, in memory as well as in persistent file (if defined).
+        """
+        with self.__lock:
+            self.__entries.clear()
+            if self.__path and os.path.isfile(self.__path):
+                delete_file_safe(self.__path)
+
+    def __remember(self, key, value):
+        """
+        This Internal method caches given entry in memory, evicting least recently used ones.
+        """
+        with self.__lock:
+            self.__entries[key] = value
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__maxsize:
+                self.__entries.popitem(last=False)
+
+    def __connect(self):
+        """
+        This Internal method opens SQLite database of persistent cache.
+        """
+        import sqlite3
+
+        connection = sqlite3.connect(self.__path, timeout=10)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS probes (key TEXT PRIMARY KEY, value TEXT)"
+        )
+        return connection
+
+    def __load_json(self):
+        """
+        This Internal method loads all entries of JSON persistent cache.
+        """
+        import json
+
+        try:
+            with open(self.__path, "r") as f:
+                entries = json.load(f)
+            return entries if isinstance(entries, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def __load(self, key):
+        """
+        This Internal method looks up given key in persistent cache file.
+        """
+        if not os.path.isfile(self.__path):
+            return None
+        if not self.__sqlite:
+            return self.__load_json().get(key)
+        try:
+            with closing(self.__connect()) as connection:
+                row = connection.execute(
+                    "SELECT value FROM probes WHERE key = ?", (key,)
+                ).fetchone()
+        except Exception as e:
+            logger.warning(
+                "Failed to read probe cache `{}`: {}".format(self.__path, str(e))
+            )
+            return None
+        return row[0] if row else None
+
+    def __store(self, key, value):
+        """
+        This Internal method writes given entry to persistent cache file.
+        """
+        os.makedirs(os.path.dirname(self.__path), exist_ok=True)
+        if self.__sqlite:
+            with closing(self.__connect()) as connection, connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO probes (key, value) VALUES (?, ?)",
+                    (key, value),
+                )
+            return
+        import json
+        import tempfile
+
+        with self.__lock:
+            # merge with entries written by other processes
+            entries = self.__load_json()
+            entries.pop(key, None)
+            entries[key] = value
+            # evict least recently written entries beyond size limit
+            for stale in list(entries)[: max(len(entries) - self.__maxsize, 0)]:
+                del entries[stale]
+            # write atomically, so that readers never see partial files
+            fd, temp_path = tempfile.mkstemp(
+                dir=os.path.dirname(self.__path), suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(entries, f)
+                os.replace(temp_path, self.__path)
+            except Exception:
+                delete_file_safe(temp_path)
+                raise
@@ -0,0 +1,39 @@
+"""
+===============================================
+DeFFcode library source-code is deployed under the Apache 2.0 License:
+
+Copyright (c) 2021 Abhishek Thakur(@abhiTronix) <abhi.una12@gmail.com>
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+===============================================
+"""
+
+# import the necessary packages
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def capabilities_cache_dir(tmp_path_factory):
+    """
+    Temporary persistent FFmpeg capabilities cache directory shared by whole test session
+    """
+    return str(tmp_path_factory.mktemp("deffcode_cache"))
+
+
+@pytest.fixture(autouse=True)
+def isolated_capabilities_cache(capabilities_cache_dir, monkeypatch):
+    """
+    Keeps tests away from developer's own persistent FFmpeg capabilities cache
+    """
+    monkeypatch.setenv("DEFFCODE_CACHE_DIR", capabilities_cache_dir)
@@ -0,0 +1,91 @@
+"""
+===============================================
+DeFFcode library source-code is deployed under the Apache 2.0 License:
+
+Copyright (c) 2021 Abhishek Thakur(@abhiTronix) <abhi.una12@gmail.com>
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+===============================================
+"""
+
+# import the necessary packages
+
+import os
+import json
+import pytest
+import logging
+import tempfile
+from .essentials import return_static_ffmpeg
+from deffcode.utils import logger_handler
+from benchmarks import build_cases, main
+
+# define test logger
+logger = logging.getLogger("Test_Benchmarks")
+logger.propagate = False
+logger.addHandler(logger_handler())
+logger.setLevel(logging.DEBUG)
+
+
+def test_build_cases():
+    """
+    Testing benchmark cases matrix.
+    """
+    cases = build_cases(
+        sources=["testsrc2"],
+        resolutions=["640x360", "1280x720"],
+        num_frames=10,
+    )
+    assert len(cases) == 2 * 6 * 3, "Test Failed!"
+    assert all(x["ffparams"]["-frames:v"] == 10 for x in cases), "Test Failed!"
+
+
+@pytest.mark.parametrize(
+    "frame_format, variant",
+    [("yuv420p", "source"), ("rgb48be", "vf_scale"), ("gray", "custom_resolution")],
+)
+def test_benchmarks(frame_format, variant):
+    """
+    Testing benchmarks run with results written to JSON file.
+    """
+    output = os.path.join(tempfile.gettempdir(), "benchmark_results.json")
+    try:
+        main(
+            [
+                "-n",
+                "10",
+                "-o",
+                output,
+                "--sources",
+                "testsrc2",
+                "--resolutions",
+                "320x240",
+                "--frame-formats",
+                frame_format,
+                "--variants",
+                variant,
+                "--ffmpeg",
+                return_static_ffmpeg(),
+                "--no-isolate",
+            ]
+        )
+        with open(output) as f:
+            report = json.load(f)
+        result = report["results"][0]
+        logger.debug("Benchmark result: `{}`".format(result))
+        assert not "error" in result, "Test Failed!"
+        assert result["frames"] == 10, "Test Failed!"
+        assert result["fps"] > 0 and result["ttff_s"] > 0, "Test Failed!"
+    except Exception as e:
+        pytest.fail(str(e))
+    finally:
+        os.path.isfile(output) and os.remove(output)
@@ -0,0 +1,135 @@
+"""
+===============================================
+DeFFcode library source-code is deployed under the Apache 2.0 License:
+
+Copyright (c) 2021 Abhishek Thakur(@abhiTronix) <abhi.una12@gmail.com>
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+===============================================
+"""
+
+# import the necessary packages
+
+import time
+import pytest
+import logging
+from .essentials import (
+    return_static_ffmpeg,
+    return_testvideo_path,
+    actual_frame_count_n_frame_size,
+)
+from deffcode import DecoderPool
+from deffcode.utils import logger_handler
+
+# define test logger
+logger = logging.getLogger("Test_DecoderPool")
+logger.propagate = False
+logger.addHandler(logger_handler())
+logger.setLevel(logging.DEBUG)
+
+
+@pytest.mark.parametrize(
+    "max_workers, batch_size, ordered, result",
+    [
+        (2, None, True, True),
+        (3, 16, False, True),
+        ("invalid", None, True, True),
+        (2, 0, True, False),
+    ],
+)
+def test_decoder_pool(max_workers, batch_size, ordered, result):
+    """
+    Testing DecoderPool bulk decoding with failed sources.
+    """
+    sources = [
+        return_testvideo_path(fmt="vo"),
+        "unknown://invalid.com/",  # invalid source
+        return_testvideo_path(fmt="vo"),
+        return_testvideo_path(fmt="av"),
+    ]
+    try:
+        actual_frame_num = actual_frame_count_n_frame_size(
+            return_testvideo_path(fmt="vo")
+        )[0]
+        with DecoderPool(
+            max_workers=max_workers,
+            frame_format="bgr24",
+            custom_ffmpeg=return_static_ffmpeg(),
+            verbose=True,
+        ) as pool:
+            decoded = []
+            for source, frames in pool.decode(
+                sources, batch_size=batch_size, ordered=ordered
+            ):
+                frame_num = sum(
+                    1 if batch_size is None else len(batch) for batch in frames
+                )
+                assert frame_num == actual_frame_num, "Test Failed!"
+                decoded.append(source)
+            # check all valid sources decoded
+            assert len(decoded) == 3, "Test Failed!"
+            if ordered:
+                assert decoded == [
+                    x for x in sources if x != "unknown://invalid.com/"
+                ], "Test Failed!"
+            # check failures recorded
+            assert [x[0] for x in pool.failures] == [
+                "unknown://invalid.com/"
+            ], "Test Failed!"
+    except Exception as e:
+        if result:
+            pytest.fail(str(e))
+        else:
+            pytest.xfail(str(e))
+
+
+def test_decoder_pool_early_exit():
+    """
+    Testing DecoderPool reaps all pipelines on early exit.
+    """
+    try:
+        pool = DecoderPool(
+            max_workers=2,
+            custom_ffmpeg=return_static_ffmpeg(),
+        )
+        results = pool.decode([return_testvideo_path(fmt="vo")] * 4)
+        # consume only first frame of first source
+        (_, frames) = next(results)
+        assert not (next(frames) is None), "Test Failed!"
+        # abandon all results
+        results.close()
+        assert next(frames, None) is None, "Test Failed!"
+    except Exception as e:
+        pytest.fail(str(e))
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_decoder_pool_concurrency(max_workers):
+    """
+    Testing DecoderPool never keeps more than `max_workers` pipelines alive.
+    """
+    try:
+        with DecoderPool(
+            max_workers=max_workers,
+            frame_format="bgr24",
+            custom_ffmpeg=return_static_ffmpeg(),
+        ) as pool:
+            alive = 0
+            for _, frames in pool.decode([return_testvideo_path(fmt="vo")] * 5):
+                for _ in frames:
+                    # let background launches catch up
+                    time.sleep(0.001)
+                    alive = max(alive, len(pool._DecoderPool__decoders))
+            assert 0 < alive <= max_workers, "Test Failed!"
+    except Exception as e:
+        pytest.fail(str(e))
@@ -22,7 +22,9 @@
 
 import os
 import cv2
+import asyncio
 import json
+import time
 import pytest
 import tempfile
 import platform
@@ -36,8 +38,9 @@
     remove_file_safe,
 )
 from PIL import Image
-from deffcode import FFdecoder
+from deffcode import FFdecoder, SharedFrameRing
 from deffcode.utils import logger_handler
+from deffcode.ffhelper import check_sp_output
 
 # define test logger
 logger = logging.getLogger("Test_FFdecoder")
@@ -568,3 +571,966 @@ def test_discard_n_filter_params(frame_format, ffparams, result):
     finally:
         # terminate
         not (decoder is None) and decoder.terminate()
+
+
+@pytest.mark.parametrize(
+    "pixfmts, ffparams, use_out, result",
+    [
+        ("bgr24", {"-frame_buffer_pool": 3}, False, True),
+        ("gray", {"-frame_buffer_pool": 2}, False, True),
+        ("bgr48be", {"-frame_buffer_pool": "invalid"}, True, True),
+        (
+            "yuv420p",
+            {"-frame_buffer_pool": 1, "-enforce_cv_patch": True},
+            False,
+            True,
+        ),
+        ("gray", {"-prefetch_frames": 2}, True, True),
+        ("bgr48be", {}, "flat", False),
+        ("rgb24", {}, "invalid", False),
+    ],
+)
+def test_frame_buffer_pool(pixfmts, ffparams, use_out, result):
+    """
+    Testing recycled frame buffers pool and user-defined `out` buffer.
+    """
+    decoder = None
+    try:
+        # formulate the decoder with suitable source(for e.g. foo.mp4)
+        decoder = FFdecoder(
+            return_testvideo_path(fmt="vo"),
+            frame_format=pixfmts,
+            custom_ffmpeg=return_static_ffmpeg(),
+            verbose=True,
+            **ffparams,
+        ).formulate()
+        # prepare output buffer(if required)
+        out = None
+        if use_out == "invalid":
+            out = np.empty((2, 2), dtype=np.float32)
+        elif use_out:
+            metadata = json.loads(decoder.metadata)
+            width, height = metadata["output_frames_resolution"]
+            out = (
+                np.empty((height, width), dtype=np.uint8)
+                if pixfmts == "gray"
+                else np.empty((height, width, 3), dtype=">u2")
+            )
+            if use_out == "flat":
+                # flattened buffers are refused
+                out = out.reshape(-1)
+        # grab few frames from decoder
+        frames = []
+        for frame in decoder.generateFrame(out=out):
+            # check if frames are writable
+            assert frame.flags.writeable, "Test Failed!"
+            # check if user-defined buffer is used
+            use_out and not (frame is out) and pytest.fail("Test Failed!")
+            frames.append(frame)
+            if len(frames) == 3:
+                break
+        assert len(frames) == 3, "Test Failed!"
+    except Exception as e:
+        if result:
+            pytest.fail(str(e))
+        else:
+            pytest.xfail(str(e))
+    finally:
+        # terminate the decoder
+        not (decoder is None) and decoder.terminate()
+
+
+def test_frame_buffer_pool_async():
+    """
+    Testing recycled frame buffers pool is discarded with warning for asyncio pipeline.
+    """
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    ffdecoder_logger = logging.getLogger("FFdecoder")
+    ffdecoder_logger.addHandler(handler)
+
+    async def decode():
+        async with FFdecoder(
+            return_testvideo_path(fmt="vo"),
+            frame_format="bgr24",
+            custom_ffmpeg=return_static_ffmpeg(),
+            **{"-frame_buffer_pool": 3},
+        ) as decoder:
+            frames = []
+            async for frame in decoder.agenerateFrame():
+                frames.append(frame)
+                if len(frames) == 4:
+                    break
+            return frames
+
+    try:
+        frames = asyncio.run(decode())
+        # frames are never recycled
+        assert len({id(x) for x in frames}) == 4, "Test Failed!"
+        assert any(
+            "-frame_buffer_pool" in x.getMessage() for x in records
+        ), "Test Failed!"
+    except Exception as e:
+        pytest.fail(str(e))
+    finally:
+        ffdecoder_logger.removeHandler(handler)
+
+
+@pytest.mark.parametrize(
+    "ffparams, num_frames, result",
+    [
+        ({"-prefetch_frames": 4}, None, True),
+        ({"-prefetch_frames": 2, "-frame_buffer_pool": 1}, None, True),
+        ({"-prefetch_frames": 8}, 5, True),
+        ({"-prefetch_frames": -1}, 5, True),
+    ],
+)
+def test_prefetch_frames(ffparams, num_frames, result):
+    """
+    Testing background frames prefetching with bounded queue.
+    """
+    decoder = None
+    try:
+        # formulate the decoder with suitable source(for e.g. foo.mp4)
+        decoder = FFdecoder(
+            return_testvideo_path(fmt="vo"),
+            frame_format="bgr24",
+            custom_ffmpeg=return_static_ffmpeg(),
+            verbose=True,
+            **ffparams,
+        ).formulate()
+        # gather data
+        actual_frame_num, actual_frame_shape = actual_frame_count_n_frame_size(
+            return_testvideo_path(fmt="vo")
+        )
+        frame_num = 0
+        for frame in decoder.generateFrame():
+            # check shape
+            assert frame.shape == actual_frame_shape, "Test Failed!"
+            frame_num += 1
+            if not (num_frames is None) and frame_num == num_frames:
+                break
+        # check frames count
+        assert frame_num == (
+            actual_frame_num if num_frames is None else num_frames
+        ), "Test Failed!"
+        # print prefetch stats
+        logger.debug(decoder.prefetch_stats)
+    except Exception as e:
+        if result:
+            pytest.fail(str(e))
+        else:
+            pytest.xfail(str(e))
+    finally:
+        # terminate the decoder
+        not (decoder is None) and decoder.terminate()
+
+
+@pytest.mark.parametrize(
+    "pixfmts, batch_size, ffparams, result",
+    [
+        ("bgr24", 16, {}, True),
+        ("gray", 7, {"-prefetch_frames": 4}, True),
+        ("bgr24", 1000, {"-frames:v": 10}, True),
+        ("bgr24", 0, {}, False),
+    ],
+)
+def test_generate_batch(pixfmts, batch_size, ffparams, result):
+    """
+    Testing batched frames generation as contiguous 4D arrays.
+    """
+    decoder = None
+    try:
+        # formulate the decoder with suitable source(for e.g. foo.mp4)
+        decoder = FFdecoder(
+            return_testvideo_path(fmt="vo"),
+            frame_format=pixfmts,
+            custom_ffmpeg=return_static_ffmpeg(),
+            verbose=True,
+            **ffparams,
+        ).formulate()
+        # gather data
+        actual_frame_num, actual_frame_shape = actual_frame_count_n_frame_size(
+            return_testvideo_path(fmt="vo")
+        )
+        if "-frames:v" in ffparams:
+            actual_frame_num = ffparams["-frames:v"]
+        frame_num = 0
+        for batch in decoder.generateBatch(batch_size):
+            # check if contiguous batch of frames
+            assert batch.flags.c_contiguous, "Test Failed!"
+            assert batch.shape[1:] == (
+                actual_frame_shape[:2] if pixfmts == "gray" else actual_frame_shape
+            ), "Test Failed!"
+            assert len(batch) <= batch_size, "Test Failed!"
+            frame_num += len(batch)
+        # check frames count
+        assert frame_num == actual_frame_num, "Test Failed!"
+    except Exception as e:
+        if result:
+            pytest.fail(str(e))
+        else:
+            pytest.xfail(str(e))
+    finally:
+        # terminate the decoder
+        not (decoder is None) and decoder.terminate()
+
+
+@pytest.mark.parametrize(
+    "pixfmts, num_frames, result",
+    [
+        ("bgr24", None, True),
+        ("gray", 5, True),
+        ("yuv420p", 5, True),
+    ],
+)
+def test_async_generate_frame(pixfmts, num_frames, result):
+    """
+    Testing asyncio pipeline and asynchronous frames generator.
+    """
+
+    async def decode():
+        frame_num = 0
+        async with FFdecoder(
+            return_testvideo_path(fmt="vo"),
+            frame_format=pixfmts,
+            custom_ffmpeg=return_static_ffmpeg(),
+            verbose=True,
+        ) as decoder:
+            async for frame in decoder.agenerateFrame():
+                frame_num += 1
+                if not (num_frames is None) and frame_num == num_frames:
+                    break
+        return frame_num
+
+    async def decode_concurrently():
+        return await asyncio.wait_for(asyncio.gather(decode(), decode()), timeout=60)
+
+    try:
+        # gather data
+        actual_frame_num, _ = actual_frame_count_n_frame_size(
+            return_testvideo_path(fmt="vo")
+        )
+        # decode frames concurrently
+        frames = asyncio.run(decode_concurrently())
+        assert all(
+            x == (actual_frame_num if num_frames is None else num_frames)
+            for x in frames
+        ), "Test Failed!"
+    except Exception as e:
+        if result:
+            pytest.fail(str(e))
+        else:
+            pytest.xfail(str(e))
+
+
+@pytest.mark.parametrize(
+    "ffparams, consumers, result",
+    [
+        ({"-shm_ring_slots": 4}, 1, True),
+        ({"-shm_ring_slots": 2, "-shm_ring_consumers": 2}, 2, True),
+        ({"-shm_ring_slots": 3, "-prefetch_frames": 2}, 1, True),
+        ({"-shm_ring_slots": "invalid"}, 1, False),
+    ],
+)
+def test_shared_frame_ring(ffparams, consumers, result):
+    """
+    Testing frames generation into shared memory frames ring.
+    """
+    decoder = None
+    attached = []
+    try:
+        # formulate the decoder with suitable source(for e.g. foo.mp4)
+        decoder = FFdecoder(
+            return_testvideo_path(fmt="vo"),
+            frame_format="bgr24",
+            custom_ffmpeg=return_static_ffmpeg(),
+            verbose=True,
+            **ffparams,
+        ).formulate()
+        # attach consumers to ring
+        attached = [
+            SharedFrameRing(name=decoder.frame_ring.name, consumer_id=i)
+            for i in range(consumers)
+        ]
+        # gather data
+        actual_frame_num, actual_frame_shape = actual_frame_count_n_frame_size(
+            return_testvideo_path(fmt="vo")
+        )
+        frame_num = 0
+        for handle in decoder.generateSharedFrame(timeout=5):
+            for consumer in attached:
+                # map handle to zero-copy frame
+                assert consumer.view(handle).shape == actual_frame_shape, "Test Failed!"
+                consumer.release(handle)
+            frame_num += 1
+        assert frame_num == actual_frame_num, "Test Failed!"
+    except Exception as e:
+        if result:
+            pytest.fail(str(e))
+        else:
+            pytest.xfail(str(e))
+    finally:
+        # close consumers and terminate the decoder
+        for consumer in attached:
+            consumer.close()
+        not (decoder is None) and decoder.terminate()
+
+
+def test_shared_frame_ring_async():
+    """
+    Testing shared memory frames ring is not created for asyncio pipeline.
+    """
+
+    async def decode():
+        async with FFdecoder(
+            return_testvideo_path(fmt="vo"),
+            frame_format="bgr24",
+            custom_ffmpeg=return_static_ffmpeg(),
+            **{"-shm_ring_slots": 4},
+        ) as decoder:
+            frame_num = 0
+            async for frame in decoder.agenerateFrame():
+                frame_num += 1
+                if frame_num == 10:
+                    break
+            return (frame_num, decoder.frame_ring)
+
+    try:
+        frame_num, frame_ring = asyncio.run(decode())
+        assert frame_num == 10, "Test Failed!"
+        assert frame_ring is None, "Test Failed!"
+    except Exception as e:
+        pytest.fail(str(e))
+
+
+@pytest.mark.parametrize(
+    "pixfmts, indices, result",
+    [
+        ("bgr24", [50, 3, 49, 3, 0, 99], True),
+        ("gray", [10, 11, 12], True),
+        ("bgr24", [-1], False),
+        ("bgr24", "invalid", False),
+    ],
+)
+def test_get_frames(pixfmts, indices, result):
+    """
+    Testing frame-accurate random access against sequentially decoded frames.
+    """
+    decoder = None
+    try:
+        # decode all frames sequentially for reference
+        decoder = FFdecoder(
+            return_testvideo_path(fmt="vo"),
+            frame_format=pixfmts,
+            custom_ffmpeg=return_static_ffmpeg(),
+        ).formulate()
+        frames = [frame.copy() for frame in decoder.generateFrame()]
+        decoder.terminate()
+        # formulate the decoder with suitable source(for e.g. foo.mp4)
+        decoder = FFdecoder(
+            return_testvideo_path(fmt="vo"),
+            frame_format=pixfmts,
+            custom_ffmpeg=return_static_ffmpeg(),
+            verbose=True,
+        ).formulate()
+        # grab frames at random
+        for index, frame in zip(indices, decoder.get_frames(indices)):
+            assert not (frame is None), "Test Failed!"
+            assert np.array_equal(frame, frames[index]), "Test Failed!"
+        # frames beyond end of source are unavailable
+        assert decoder.get_frame(len(frames) + 10) is None, "Test Failed!"
+    except Exception as e:
+        if result:
+            pytest.fail(str(e))
+        else:
+            pytest.xfail(str(e))
+    finally:
+        # terminate the decoder
+        not (decoder is None) and decoder.terminate()
+
+
+@pytest.mark.parametrize(
+    "pixfmts, segments, ordered, result",
+    [
+        ("bgr24", 4, True, True),
+        ("gray", None, False, True),
+        ("bgr24", 0, True, False),
+    ],
+)
+def test_generate_frame_parallel(pixfmts, segments, ordered, result):
+    """
+    Testing parallel segments decoding against sequentially decoded frames.
+    """
+    decoder = None
+    try:
+        # decode all frames sequentially for reference
+        decoder = FFdecoder(
+            return_testvideo_path(fmt="vo"),
+            frame_format=pixfmts,
+            custom_ffmpeg=return_static_ffmpeg(),
+        ).formulate()
+        frames = [frame.copy() for frame in decoder.generateFrame()]
+        decoder.terminate()
+        # formulate the decoder with suitable source(for e.g. foo.mp4)
+        decoder = FFdecoder(
+            return_testvideo_path(fmt="vo"),
+            frame_format=pixfmts,
+            custom_ffmpeg=return_static_ffmpeg(),
+            verbose=True,
+        ).formulate()
+        output = list(decoder.generateFrameParallel(segments=segments, ordered=ordered))
+        # check frames count and order
+        assert len(output) == len(frames), "Test Failed!"
+        if ordered:
+            output = enumerate(output)
+        else:
+            assert sorted(x[0] for x in output) == list(
+                range(len(frames))
+            ), "Test Failed!"
+        for index, frame in output:
+            assert np.array_equal(frame, frames[index]), "Test Failed!"
+    except Exception as e:
+        if result:
+            pytest.fail(str(e))
+        else:
+            pytest.xfail(str(e))
+    finally:
+        # terminate the decoder
+        not (decoder is None) and decoder.terminate()
+
+
+@pytest.mark.parametrize(
+    "buffer_limit, result",
+    [(2**30, True), (0, False)],
+)
+def test_generate_frame_parallel_buffering(buffer_limit, result):
+    """
+    Testing segments ahead of current one keep decoding in ordered parallel mode.
+    """
+    decoder = None
+    source = os.path.join(tempfile.gettempdir(), "temp_write", "gop_foo.mp4")
+    try:
+        # generate source with many keyframes
+        os.makedirs(os.path.dirname(source), exist_ok=True)
+        check_sp_output(
+            [
+                return_static_ffmpeg(),
+                "-y",
+                "-f",
+                "lavfi",
+                "-i",
+                "testsrc=size=640x360:rate=25:duration=4",
+                "-g",
+                "25",
+                source,
+            ]
+        )
+        # formulate the decoder with suitable source(for e.g. foo.mp4)
+        decoder = FFdecoder(
+            source,
+            frame_format="bgr24",
+            custom_ffmpeg=return_static_ffmpeg(),
+        ).formulate()
+        generator = decoder.generateFrameParallel(
+            segments=2, queue_size=1, buffer_limit=buffer_limit
+        )
+        assert not (next(generator) is None), "Test Failed!"
+        # last segment must be decoded completely while first one is pending
+        processes = decoder._FFdecoder__segment_processes
+        timeout = time.time() + 30
+        while processes[-1].poll() is None and time.time() < timeout:
+            time.sleep(0.1)
+        assert not (processes[-1].poll() is None), "Test Failed!"
+        generator.close()
+    except Exception as e:
+        if result:
+            pytest.fail(str(e))
+        else:
+            pytest.xfail(str(e))
+    finally:
+        # terminate the decoder
+        not (decoder is None) and decoder.terminate()
+        remove_file_safe(source)
+
+
+@pytest.mark.parametrize(
+    "ffparams, result",
+    [
+        ({"-pipeline_stats": True}, True),
+        ({"-pipeline_stats": True, "-frames:v": 10}, True),
+        ({"-pipeline_stats": "invalid"}, False),
+    ],
+)
+def test_pipeline_stats(ffparams, result):
+    """
+    Testing FFmpeg progress statistics of the pipeline.
+    """
+    decoder = None
+    try:
+        # formulate the decoder with suitable source(for e.g. foo.mp4)
+        decoder = FFdecoder(
+            return_testvideo_path(fmt="vo"),
+            custom_ffmpeg=return_static_ffmpeg(),
+            **ffparams,
+        ).formulate()
+        frame_num = sum(1 for _ in decoder.generateFrame())
+        # wait for final statistics after pipeline ends
+        decoder.terminate()
+        stats = decoder.pipeline_stats
+        logger.debug("Pipeline Stats: `{}`".format(stats))
+        assert stats and stats["progress"] == "end", "Test Failed!"
+        assert stats["frame"] == frame_num, "Test Failed!"
+        assert stats["total_size"] > 0 and stats["speed"] > 0, "Test Failed!"
+    except Exception as e:
+        if result:
+            pytest.fail(str(e))
+        else:
+            pytest.xfail(str(e))
+    finally:
+        # terminate the decoder
+        not (decoder is None) and decoder.terminate()
+
+
+@pytest.mark.skipif(
+    platform.system() != "Linux", reason="Open file descriptors are listed on Linux."
+)
+def test_pipeline_stats_failed_launch():
+    """
+    Testing progress pipe is released when FFmpeg pipeline fails to launch.
+    """
+    ffmpeg_dir = os.path.join(tempfile.gettempdir(), "failed_launch")
+    custom_ffmpeg = os.path.join(ffmpeg_dir, "ffmpeg")
+    try:
+        # use removable FFmpeg executable
+        os.makedirs(ffmpeg_dir, exist_ok=True)
+        os.path.lexists(custom_ffmpeg) and os.remove(custom_ffmpeg)
+        os.symlink(os.path.abspath(return_static_ffmpeg()), custom_ffmpeg)
+        decoder = FFdecoder(
+            return_testvideo_path(fmt="vo"),
+            custom_ffmpeg=custom_ffmpeg,
+            **{"-pipeline_stats": True},
+        )
+        # launching pipeline fails without FFmpeg executable
+        os.remove(custom_ffmpeg)
+        open_fds = len(os.listdir("/proc/self/fd"))
+        with pytest.raises(OSError):
+            decoder.formulate()
+        assert len(os.listdir("/proc/self/fd")) == open_fds, "Test Failed!"
+        decoder.terminate()
+    except Exception as e:
+        pytest.fail(str(e))
+    finally:
+        os.path.lexists(custom_ffmpeg) and os.remove(custom_ffmpeg)
+
+
+@pytest.mark.parametrize(
+    "ffparams, result",
+    [
+        ({"-latency_stats": True}, True),
+        ({"-latency_stats": True, "-prefetch_frames": 4}, True),
+        ({"-latency_stats": "invalid"}, False),
+    ],
+)
+def test_latency_stats(ffparams, result):
+    """
+    Testing per-frame latency instrumentation.
+    """
+    decoder = None
+    try:
+        # formulate the decoder with suitable source(for e.g. foo.mp4)
+        decoder = FFdecoder(
+            return_testvideo_path(fmt="vo"),
+            custom_ffmpeg=return_static_ffmpeg(),
+            verbose=True,
+            **ffparams,
+        ).formulate()
+        frame_num = 0
+        for frame in decoder.generateFrame():
+            frame_num += 1
+        stats = decoder.latency_stats
+        logger.debug("Latency Stats: `{}`".format(stats))
+        # check recorded latencies
+        assert stats, "Test Failed!"
+        assert stats["pipe_read"]["count"] >= frame_num, "Test Failed!"
+        assert stats["reshape"]["count"] == frame_num, "Test Failed!"
+        assert stats["consumer"]["count"] == frame_num, "Test Failed!"
+        assert (
+            sum(stats["pipe_read"]["buckets"].values()) == stats["pipe_read"]["count"]
+        ), "Test Failed!"
+        assert stats["bytes_total"] == frame_num * frame.nbytes, "Test Failed!"
+    except Exception as e:
+        if result:
+            pytest.fail(str(e))
+        else:
+            pytest.xfail(str(e))
+    finally:
+        # terminate the decoder
+        not (decoder is None) and decoder.terminate()
+
+
+def test_latency_stats_async():
+    """
+    Testing latency instrumentation is discarded for asyncio pipeline.
+    """
+
+    async def decode():
+        async with FFdecoder(
+            return_testvideo_path(fmt="vo"),
+            frame_format="bgr24",
+            custom_ffmpeg=return_static_ffmpeg(),
+            **{"-latency_stats": True},
+        ) as decoder:
+            async for _ in decoder.agenerateFrame():
+                break
+            return decoder.latency_stats
+
+    try:
+        # no misleading empty snapshot
+        assert asyncio.run(decode()) == {}, "Test Failed!"
+    except Exception as e:
+        pytest.fail(str(e))
+
+
+@pytest.mark.parametrize(
+    "ffparams, fail_relaunch, result",
+    [
+        ({"-auto_reconnect": 3, "-auto_reconnect_backoff": (0.01, 0.05)}, False, True),
+        (
+            {
+                "-auto_reconnect": 3,
+                "-auto_reconnect_backoff": [0.01, 0.05],
+                "-prefetch_frames": 4,
+            },
+            False,
+            True,
+        ),
+        ({"-auto_reconnect": 2, "-auto_reconnect_backoff": (0.01, 0.05)}, True, True),
+        ({"-auto_reconnect": "invalid", "-auto_reconnect_backoff": 0.1}, False, False),
+    ],
+)
+def test_auto_reconnect(ffparams, fail_relaunch, result):
+    """
+    Testing automatic reconnection of dropped live sources.
+    """
+    if fail_relaunch and platform.system() == "Windows":
+        pytest.skip("Failing FFmpeg script isn't executable on Windows.")
+    decoder = None
+    ffmpeg_dir = os.path.join(tempfile.gettempdir(), "auto_reconnect")
+    try:
+        custom_ffmpeg = return_static_ffmpeg()
+        if fail_relaunch:
+            # use replaceable FFmpeg executable
+            os.makedirs(ffmpeg_dir, exist_ok=True)
+            custom_ffmpeg = os.path.join(ffmpeg_dir, "ffmpeg")
+            remove_file_safe(custom_ffmpeg)
+            os.symlink(os.path.abspath(return_static_ffmpeg()), custom_ffmpeg)
+        # formulate the decoder with live source that drops after 15 frames
+        decoder = FFdecoder(
+            "testsrc=size=64x48:rate=30:duration=0.5",
+            source_demuxer="lavfi",
+            custom_ffmpeg=custom_ffmpeg,
+            **ffparams,
+        ).formulate()
+        if fail_relaunch:
+            # every relaunch fails without any frame
+            remove_file_safe(custom_ffmpeg)
+            with open(custom_ffmpeg, "w") as f:
+                f.write("#!/bin/sh\nexit 1\n")
+            os.chmod(custom_ffmpeg, 0o755)
+            frame_num = sum(1 for _ in decoder.generateFrame())
+            stats = decoder.reconnect_stats
+            logger.debug("Reconnect Stats: `{}`".format(stats))
+            assert frame_num == 15, "Test Failed!"
+            assert stats["reconnects"] == 2 and stats["recoveries"] == 0
+            assert stats["down"], "Test Failed!"
+        else:
+            # frames continue across drops
+            frame_num = 0
+            for frame in decoder.generateFrame():
+                frame_num += 1
+                if frame_num == 60:
+                    break
+            batch = next(decoder.generateBatch(20))
+            stats = decoder.reconnect_stats
+            logger.debug("Reconnect Stats: `{}`".format(stats))
+            assert frame_num == 60 and len(batch) == 20, "Test Failed!"
+            assert stats["reconnects"] >= 4, "Test Failed!"
+            assert stats["recoveries"] == stats["reconnects"], "Test Failed!"
+            assert stats["downtime"] > 0 and stats["last_gap"][1] > 0, "Test Failed!"
+    except Exception as e:
+        if result:
+            pytest.fail(str(e))
+        else:
+            pytest.xfail(str(e))
+    finally:
+        # terminate the decoder
+        not (decoder is None) and decoder.terminate()
+        fail_relaunch and remove_file_safe(custom_ffmpeg)
+
+
+def test_auto_reconnect_async():
+    """
+    Testing automatic reconnection is discarded with warning for asyncio pipeline.
+    """
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    ffdecoder_logger = logging.getLogger("FFdecoder")
+    ffdecoder_logger.addHandler(handler)
+
+    async def decode():
+        async with FFdecoder(
+            "testsrc=size=64x48:rate=30:duration=0.5",
+            source_demuxer="lavfi",
+            custom_ffmpeg=return_static_ffmpeg(),
+            **{"-auto_reconnect": 2},
+        ) as decoder:
+            frame_num = 0
+            async for _ in decoder.agenerateFrame():
+                frame_num += 1
+            return (frame_num, decoder.reconnect_stats)
+
+    try:
+        frame_num, stats = asyncio.run(decode())
+        # stream ends without any relaunch
+        assert frame_num == 15 and stats["reconnects"] == 0, "Test Failed!"
+        assert any("-auto_reconnect" in x.getMessage() for x in records), "Test Failed!"
+    except Exception as e:
+        pytest.fail(str(e))
+    finally:
+        ffdecoder_logger.removeHandler(handler)
+
+
+@pytest.mark.parametrize(
+    "ffparams, result",
+    [
+        ({"-latest_frame_only": True}, True),
+        ({"-latest_frame_only": True, "-prefetch_frames": 2}, True),
+        ({"-latest_frame_only": True, "-frame_buffer_pool": 4}, True),
+        ({"-latest_frame_only": "invalid"}, False),
+    ],
+)
+def test_latest_frame_only(ffparams, result):
+    """
+    Testing latest-frame-only (drop-stale) mode with slow consumer.
+    """
+    decoder = None
+    try:
+        # formulate the decoder with realtime live source
+        decoder = FFdecoder(
+            "testsrc=size=64x48:rate=50",
+            source_demuxer="lavfi",
+            custom_ffmpeg=return_static_ffmpeg(),
+            **{"-ffprefixes": ["-re"], **ffparams},
+        ).formulate()
+        frame_num = 0
+        for frame in decoder.generateFrame():
+            frame_num += 1
+            # slow consumer
+            time.sleep(0.1)
+            if frame_num == 5:
+                break
+        stats = decoder.prefetch_stats
+        logger.debug("Prefetch Stats: `{}`".format(stats))
+        # stale frames must be dropped instead of piling up
+        assert stats["frames_dropped"] > 0, "Test Failed!"
+        assert stats["queue_depth"] <= stats["queue_capacity"], "Test Failed!"
+    except Exception as e:
+        if result:
+            pytest.fail(str(e))
+        else:
+            pytest.xfail(str(e))
+    finally:
+        # terminate the decoder
+        not (decoder is None) and decoder.terminate()
+
+
+@pytest.mark.parametrize(
+    "ffparams, result",
+    [
+        ({"-frame_stride": 4}, True),
+        ({"-frame_stride": 7, "-vf": "scale=320:-2"}, True),
+        ({"-keyframes_only": True}, True),
+        ({"-keyframes_only": True, "-frame_stride": 2}, True),
+        ({"-frame_stride": 4, "-frames:v": 3}, True),
+        ({"-frame_stride": 0, "-keyframes_only": "invalid"}, False),
+    ],
+)
+def test_frame_selection(ffparams, result):
+    """
+    Testing decode-time frame stride and keyframes-only modes.
+    """
+    decoder = None
+    try:
+        # formulate the decoder with suitable source(for e.g. foo.mp4)
+        decoder = FFdecoder(
+            return_testvideo_path(fmt="vo"),
+            frame_format="bgr24",
+            custom_ffmpeg=return_static_ffmpeg(),
+            **ffparams,
+        ).formulate()
+        metadata = json.loads(decoder.metadata)
+        logger.debug(
+            "Selected frames: `{}` at `{}` fps".format(
+                metadata["approx_video_nframes"], metadata["output_framerate"]
+            )
+        )
+        frame_num = sum(1 for _ in decoder.generateFrame())
+        # check frames count
+        if "-frames:v" in ffparams:
+            assert frame_num == ffparams["-frames:v"], "Test Failed!"
+        elif ffparams.get("-keyframes_only", False):
+            # keyframes are read until EOF
+            assert metadata["approx_video_nframes"] is None, "Test Failed!"
+        else:
+            assert frame_num == metadata["approx_video_nframes"], "Test Failed!"
+        actual_frame_num, _ = actual_frame_count_n_frame_size(
+            return_testvideo_path(fmt="vo")
+        )
+        stride = ffparams.get("-frame_stride", 1)
+        if not ffparams.get("-keyframes_only", False) and not "-frames:v" in ffparams:
+            assert frame_num == -(-actual_frame_num // stride), "Test Failed!"
+            assert (
+                metadata["output_framerate"]
+                == metadata["source_video_framerate"] / stride
+            ), "Test Failed!"
+        assert 0 < frame_num < actual_frame_num, "Test Failed!"
+        # check random access is refused
+        with pytest.raises(RuntimeError):
+            decoder.get_frame(0)
+    except Exception as e:
+        if result:
+            pytest.fail(str(e))
+        else:
+            pytest.xfail(str(e))
+    finally:
+        # terminate the decoder
+        not (decoder is None) and decoder.terminate()
+
+
+@pytest.mark.parametrize(
+    "pixfmts, rois, result",
+    [
+        ("bgr24", (10, 11, 100, 50), True),
+        ("gray", [(10, 11, 100, 50), (200, 201, 120, 60)], True),
+        ("rgb24", [[0, 0, 40, 300], [500, 100, 60, 300], [7, 9, 13, 290]], True),
+        ("bgr24", (1000, 1000, 100, 50), False),
+        ("bgr24", [(10, 11, 100)], False),
+    ],
+)
+def test_roi(pixfmts, rois, result):
+    """
+    Testing region-of-interest cropping within FFmpeg pipeline.
+    """
+    decoder = None
+    try:
+        # decode reference full frames
+        with FFdecoder(
+            return_testvideo_path(fmt="vo"),
+            frame_format=pixfmts,
+            custom_ffmpeg=return_static_ffmpeg(),
+            **{"-frames:v": 5},
+        ) as reference:
+            full_frames = [x.copy() for x in reference.generateFrame()]
+        # formulate the decoder with regions of interest
+        decoder = FFdecoder(
+            return_testvideo_path(fmt="vo"),
+            frame_format=pixfmts,
+            custom_ffmpeg=return_static_ffmpeg(),
+            **{"-roi": rois, "-frames:v": 5},
+        ).formulate()
+        regions = rois if isinstance(rois, list) else [rois]
+        frame_num = 0
+        for frame, full_frame in zip(decoder.generateFrame(), full_frames):
+            # each region is returned separately for multiple regions
+            crops = frame if isinstance(rois, list) else [frame]
+            assert len(crops) == len(regions), "Test Failed!"
+            for (x, y, w, h), crop in zip(regions, crops):
+                assert crop.shape[:2] == (h, w), "Test Failed!"
+                assert (
+                    np.abs(
+                        crop.astype(np.int16)
+                        - full_frame[y : y + h, x : x + w].astype(np.int16)
+                    ).max()
+                    <= 2
+                ), "Test Failed!"
+            frame_num += 1
+        assert frame_num == 5, "Test Failed!"
+    except Exception as e:
+        if result:
+            pytest.fail(str(e))
+        else:
+            pytest.xfail(str(e))
+    finally:
+        # terminate the decoder
+        not (decoder is None) and decoder.terminate()
+
+
+@pytest.mark.parametrize(
+    "pixfmts, mean, std, result",
+    [
+        ("gbrp", None, None, True),
+        ("gbrp", (123.675, 116.28, 103.53), (58.395, 57.12, 57.375), True),
+        ("gbrpf32le", [0.485, 0.456, 0.406], [0.229, 0.224, 0.225], True),
+        ("grayf32le", 0.5, 0.5, True),
+        ("gbrp", (0.5, 0.5), 1.0, False),
+        ("gbrpf32le", 0.5, 0, False),
+    ],
+)
+def test_planar_normalization(pixfmts, mean, std, result):
+    """
+    Testing planar(CHW) frames and in-place normalized batches.
+    """
+    decoder = None
+    try:
+        # decode reference RGB frames
+        with FFdecoder(
+            return_testvideo_path(fmt="vo"),
+            frame_format="gray" if pixfmts.startswith("gray") else "rgb24",
+            custom_ffmpeg=return_static_ffmpeg(),
+            **{"-frames:v": 6},
+        ) as reference:
+            reference_frames = np.stack([x.copy() for x in reference.generateFrame()])
+        # convert to planar and frame values units
+        if not pixfmts.startswith("gray"):
+            reference_frames = reference_frames.transpose(0, 3, 1, 2)
+        reference_frames = reference_frames.astype(np.float32) / (
+            255.0 if pixfmts.endswith("f32le") else 1.0
+        )
+        # formulate the decoder with planar pixel-format
+        decoder = FFdecoder(
+            return_testvideo_path(fmt="vo"),
+            frame_format=pixfmts,
+            custom_ffmpeg=return_static_ffmpeg(),
+            **{"-frames:v": 6},
+        ).formulate()
+        batches = []
+        for batch in decoder.generateBatch(4, mean=mean, std=std):
+            assert batch.flags.c_contiguous, "Test Failed!"
+            assert batch.dtype == (
+                np.float32 if not (mean is None and std is None) else np.uint8
+            ) or pixfmts.endswith("f32le"), "Test Failed!"
+            batches.append(batch.copy())
+        frames = np.concatenate(batches)
+        assert frames.shape == reference_frames.shape, "Test Failed!"
+        # undo normalization
+        if not (mean is None and std is None):
+            frames = frames * np.asarray(std, dtype=np.float32).reshape(
+                (-1, 1, 1) if np.size(std) > 1 else ()
+            ) + np.asarray(mean, dtype=np.float32).reshape(
+                (-1, 1, 1) if np.size(mean) > 1 else ()
+            )
+        # compare with reference in RGB planes order (FFmpeg may keep limited range of `grayf32le`)
+        assert np.abs(frames - reference_frames).mean() < (
+            0.05 if pixfmts.endswith("f32le") else 5.0
+        ), "Test Failed!"
+    except Exception as e:
+        if result:
+            pytest.fail(str(e))
+        else:
+            pytest.xfail(str(e))
+    finally:
+        # terminate the decoder
+        not (decoder is None) and decoder.terminate()
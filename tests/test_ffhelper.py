@@ -17,14 +17,17 @@
 limitations under the License.
 ===============================================
 """
+
 # import the necessary packages
 
 import os
+import json
 import pytest
 import shutil
 import logging
 import requests
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from .essentials import (
     is_windows,
     return_static_ffmpeg,
@@ -41,6 +44,12 @@
     is_valid_url,
     check_sp_output,
     extract_device_n_demuxer,
+    check_cached_sp_output,
+    get_capabilities_cache_path,
+    get_supported_pixfmts,
+    get_supported_demuxers,
+    get_ffmpeg_binary_key,
+    FFmpegCapabilities,
 )
 
 # define test logger
@@ -214,4 +223,114 @@ def test_extract_device_n_demuxer():
     """
     Testing extract_device_n_demuxer method
     """
-    extract_device_n_demuxer(return_static_ffmpeg(), machine_OS="invalid", verbose=True)
\ No newline at end of file
+    extract_device_n_demuxer(return_static_ffmpeg(), machine_OS="invalid", verbose=True)
+
+
+@pytest.mark.parametrize(
+    "cache_dir, corrupt",
+    [
+        (os.path.join(tempfile.gettempdir(), "temp_cache"), False),
+        (os.path.join(tempfile.gettempdir(), "temp_cache_corrupt"), True),
+    ],
+)
+def test_capabilities_cache(cache_dir, corrupt):
+    """
+    Testing persistent FFmpeg capabilities cache
+    """
+    os.environ["DEFFCODE_CACHE_DIR"] = cache_dir
+    try:
+        cache_path = get_capabilities_cache_path()
+        assert cache_path.startswith(cache_dir), "Test Failed!"
+        if corrupt:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(cache_path, "w") as f:
+                f.write("{invalid")
+        cmd = [return_static_ffmpeg(), "-hide_banner", "-pix_fmts"]
+        # first query executes and caches output
+        output = check_cached_sp_output(cmd)
+        assert output == check_sp_output(cmd), "Test Failed!"
+        with open(cache_path, "r") as f:
+            entries = json.load(f)
+        assert len(entries) == 1, "Test Failed!"
+        assert (
+            "-hide_banner -pix_fmts" in list(entries.values())[0]["queries"]
+        ), "Test Failed!"
+        # next query is served from cache
+        assert check_cached_sp_output(cmd) == output, "Test Failed!"
+        assert check_cached_sp_output(cmd, report_hit=True) == (
+            output,
+            True,
+        ), "Test Failed!"
+        assert get_supported_pixfmts(return_static_ffmpeg()), "Test Failed!"
+        # capabilities report fields served from cache
+        FFmpegCapabilities.clear()
+        assert validate_ffmpeg(return_static_ffmpeg(), verbose=True), "Test Failed!"
+        FFmpegCapabilities.clear()
+        assert validate_ffmpeg(return_static_ffmpeg(), verbose=True), "Test Failed!"
+        assert FFmpegCapabilities.get(return_static_ffmpeg()).is_cached(
+            "version"
+        ), "Test Failed!"
+    except Exception as e:
+        pytest.fail(str(e))
+    finally:
+        FFmpegCapabilities.clear()
+        os.environ.pop("DEFFCODE_CACHE_DIR", None)
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+def test_capabilities_cache_unwritable():
+    """
+    Testing persistent FFmpeg capabilities cache fails silently when unwritable
+    """
+    blocker = os.path.join(tempfile.gettempdir(), "temp_cache_blocker")
+    os.environ["DEFFCODE_CACHE_DIR"] = os.path.join(blocker, "cache")
+    try:
+        # cache directory can't be created under a file
+        with open(blocker, "w") as f:
+            f.write("")
+        cmd = [return_static_ffmpeg(), "-hide_banner", "-pix_fmts"]
+        assert check_cached_sp_output(cmd) == check_sp_output(cmd), "Test Failed!"
+        assert validate_ffmpeg(return_static_ffmpeg(), verbose=True), "Test Failed!"
+        assert os.path.isfile(blocker), "Test Failed!"
+        # binary identity includes its inode
+        key = get_ffmpeg_binary_key(return_static_ffmpeg())
+        assert key.split("|")[1] == str(
+            os.stat(os.path.realpath(key.split("|")[0])).st_ino
+        ), "Test Failed!"
+    except Exception as e:
+        pytest.fail(str(e))
+    finally:
+        os.environ.pop("DEFFCODE_CACHE_DIR", None)
+        os.path.isfile(blocker) and os.remove(blocker)
+
+
+def test_capabilities_registry():
+    """
+    Testing process-wide shared FFmpeg capabilities registry
+    """
+    try:
+        FFmpegCapabilities.clear()
+        capabilities = FFmpegCapabilities.get(return_static_ffmpeg())
+        # one shared object per binary
+        assert capabilities is FFmpegCapabilities.get(
+            return_static_ffmpeg()
+        ), "Test Failed!"
+        # concurrent first accesses
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: capabilities.demuxers, range(8)))
+        assert all(x == results[0] for x in results) and results[0], "Test Failed!"
+        assert (
+            get_supported_demuxers(return_static_ffmpeg()) == results[0]
+        ), "Test Failed!"
+        assert ("rgb24", "3", "24") in capabilities.pixfmts, "Test Failed!"
+        assert "h264" in capabilities.vdecoders, "Test Failed!"
+        assert "https" in capabilities.protocols, "Test Failed!"
+        assert "png" in capabilities.image_pipe_formats, "Test Failed!"
+        assert capabilities.version, "Test Failed!"
+        # returned lists are copies
+        capabilities.demuxers.append("invalid")
+        assert not ("invalid" in capabilities.demuxers), "Test Failed!"
+    except Exception as e:
+        pytest.fail(str(e))
+    finally:
+        FFmpegCapabilities.clear()
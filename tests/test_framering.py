@@ -0,0 +1,129 @@
+"""
+===============================================
+DeFFcode library source-code is deployed under the Apache 2.0 License:
+
+Copyright (c) 2021 Abhishek Thakur(@abhiTronix) <abhi.una12@gmail.com>
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+===============================================
+"""
+
+# import the necessary packages
+
+import sys
+import pytest
+import logging
+import subprocess as sp
+import numpy as np
+from deffcode import SharedFrameRing
+from deffcode.utils import logger_handler
+
+# define test logger
+logger = logging.getLogger("Test_FrameRing")
+logger.propagate = False
+logger.addHandler(logger_handler())
+logger.setLevel(logging.DEBUG)
+
+
+@pytest.mark.parametrize(
+    "slots, frame_shape, dtype, consumers",
+    [
+        (2, (4, 6, 3), "u1", 1),
+        (3, (4, 6), ">u2", 2),
+        (1, (8,), np.float32, 3),
+    ],
+)
+def test_shared_frame_ring(slots, frame_shape, dtype, consumers):
+    """
+    Testing SharedFrameRing publishing, mapping and acknowledgement of frames.
+    """
+    producer = None
+    attached = []
+    try:
+        # create ring and attach all consumers
+        producer = SharedFrameRing(
+            slots=slots, frame_shape=frame_shape, dtype=dtype, consumers=consumers
+        )
+        attached = [
+            SharedFrameRing(name=producer.name, consumer_id=i) for i in range(consumers)
+        ]
+        assert all(
+            x.frame_shape == tuple(frame_shape) and x.dtype == np.dtype(dtype)
+            for x in attached
+        ), "Test Failed!"
+        # fill all slots
+        handles = []
+        for i in range(slots):
+            slot, seq, frame = producer.reserve(timeout=0.1)
+            frame[...] = i
+            handles.append(producer.publish(slot, seq))
+        # ring is full now
+        assert producer.reserve(timeout=0.05) is None, "Test Failed!"
+        # check zero-copy views
+        for consumer in attached:
+            assert all(
+                (consumer.view(h) == i).all() for i, h in enumerate(handles)
+            ), "Test Failed!"
+        # release first slot by all but one consumers
+        for consumer in attached[:-1]:
+            consumer.release(handles[0])
+        assert producer.reserve(timeout=0.05) is None, "Test Failed!"
+        # release by last consumer
+        attached[-1].release(handles[0])
+        slot, seq, _ = producer.reserve(timeout=0.1)
+        assert slot == handles[0].slot and seq == slots + 1, "Test Failed!"
+        producer.publish(slot, seq)
+        # overwritten frames are no longer available
+        with pytest.raises(ValueError):
+            attached[0].view(handles[0])
+    finally:
+        # close and destroy ring
+        for consumer in attached:
+            consumer.close()
+        not (producer is None) and producer.unlink()
+
+
+def test_shared_frame_ring_external_consumer():
+    """
+    Testing SharedFrameRing outlives consumers attached from other processes.
+    """
+    producer = None
+    try:
+        producer = SharedFrameRing(slots=1, frame_shape=(4, 6), consumers=1)
+        slot, seq, frame = producer.reserve(timeout=0.1)
+        frame[...] = 7
+        handle = producer.publish(slot, seq)
+        # attach, read and release frame from a separate interpreter
+        script = (
+            "from deffcode.framering import SharedFrameRing, SharedFrameHandle;"
+            "ring = SharedFrameRing(name='{}');"
+            "handle = SharedFrameHandle({}, {});"
+            "assert (ring.view(handle) == 7).all();"
+            "ring.release(handle); ring.close()"
+        ).format(producer.name, handle.slot, handle.seq)
+        sp.run([sys.executable, "-c", script], check=True, timeout=60)
+        # ring must still be available after consumer process exits
+        attached = SharedFrameRing(name=producer.name)
+        assert (attached.view(handle) == 7).all(), "Test Failed!"
+        attached.close()
+        assert not (producer.reserve(timeout=0.1) is None), "Test Failed!"
+    finally:
+        not (producer is None) and producer.unlink()
+
+
+@pytest.mark.xfail(raises=AssertionError)
+def test_shared_frame_ring_invalid():
+    """
+    Testing SharedFrameRing with invalid parameters.
+    """
+    SharedFrameRing(slots=0, frame_shape=(2, 2))
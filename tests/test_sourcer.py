@@ -17,17 +17,24 @@
 limitations under the License.
 ===============================================
 """
+
 # import the necessary packages
 
+import os
+import json
 import pytest
+import platform
+import subprocess as sp
+import shutil
 import logging
+import tempfile
 from .essentials import (
     return_static_ffmpeg,
     return_testvideo_path,
     return_generated_frames_path,
     actual_frame_count_n_frame_size,
 )
-from deffcode.utils import logger_handler
+from deffcode.utils import logger_handler, ProbeCache
 from deffcode import Sourcer
 
 # define test logger
@@ -150,3 +157,453 @@ def test_probe_stream_n_retrieve_metadata(source, default_stream_indexes, params
             pytest.xfail("Test Still Passed!")
         else:
             pytest.fail(str(e))
+
+
+@pytest.mark.parametrize(
+    "probe_cache",
+    [
+        True,
+        os.path.join(tempfile.gettempdir(), "probe_cache", "cache.json"),
+        os.path.join(tempfile.gettempdir(), "probe_cache", "cache.db"),
+        5,  # invalid value
+    ],
+)
+def test_probe_cache(probe_cache):
+    """
+    Testing source metadata probe cache
+    """
+    source = os.path.join(tempfile.gettempdir(), "probe_cache_source.mp4")
+    try:
+        shutil.copyfile(return_testvideo_path(), source)
+        sourcer_params = {"-probe_cache": probe_cache, "-vf": "scale=320:-2"}
+        metadata = (
+            Sourcer(source, custom_ffmpeg=return_static_ffmpeg(), **sourcer_params)
+            .probe_stream()
+            .retrieve_metadata()
+        )
+        # re-opening same file reuses cached metadata
+        assert (
+            Sourcer(source, custom_ffmpeg=return_static_ffmpeg(), **sourcer_params)
+            .probe_stream()
+            .retrieve_metadata()
+            == metadata
+        ), "Test Failed!"
+        if isinstance(probe_cache, bool) or isinstance(probe_cache, str):
+            cache = ProbeCache.get_shared(None if probe_cache is True else probe_cache)
+            entries = len(cache)
+            assert entries >= 1, "Test Failed!"
+            # modified file invalidates cached metadata
+            os.utime(source, ns=(0, 0))
+            Sourcer(
+                source, custom_ffmpeg=return_static_ffmpeg(), **sourcer_params
+            ).probe_stream()
+            assert len(cache) == entries + 1, "Test Failed!"
+            if isinstance(probe_cache, str):
+                # persisted entries are shared with other caches of same file
+                assert os.path.isfile(probe_cache), "Test Failed!"
+                ProbeCache(path=probe_cache).put("key", "value")
+                assert (
+                    ProbeCache(path=probe_cache).get("key") == "value"
+                ), "Test Failed!"
+                cache.clear()
+                assert not os.path.isfile(probe_cache), "Test Failed!"
+    except Exception as e:
+        pytest.fail(str(e))
+    finally:
+        os.path.isfile(source) and os.remove(source)
+
+
+def test_probe_cache_json_limit():
+    """
+    Testing JSON persistent probe cache keeps only most recently written entries
+    """
+    path = os.path.join(tempfile.gettempdir(), "probe_cache_limit", "cache.json")
+    try:
+        for i in range(5):
+            ProbeCache(path=path, maxsize=3).put("key{}".format(i), str(i))
+        # rewriting entry refreshes it
+        ProbeCache(path=path, maxsize=3).put("key2", "2")
+        ProbeCache(path=path, maxsize=3).put("key5", "5")
+        with open(path, "r") as f:
+            entries = json.load(f)
+        assert list(entries) == ["key4", "key2", "key5"], "Test Failed!"
+        # no temporary files are left behind
+        assert os.listdir(os.path.dirname(path)) == ["cache.json"], "Test Failed!"
+    except Exception as e:
+        pytest.fail(str(e))
+    finally:
+        shutil.rmtree(os.path.dirname(path), ignore_errors=True)
+
+
+# FFprobe JSON output of a sample source with rotated video and audio stream
+ffprobe_json = {
+    "streams": [
+        {
+            "index": 0,
+            "codec_name": "h264",
+            "codec_type": "video",
+            "width": 1280,
+            "height": 720,
+            "pix_fmt": "yuv420p",
+            "r_frame_rate": "30000/1001",
+            "avg_frame_rate": "30000/1001",
+            "bit_rate": "1500321",
+            "nb_frames": "120",
+            "side_data_list": [{"side_data_type": "Display Matrix", "rotation": -90}],
+            "disposition": {"default": 1, "dub": 0},
+        },
+        {
+            "index": 1,
+            "codec_name": "aac",
+            "codec_type": "audio",
+            "sample_fmt": "s16",
+            "sample_rate": "44100",
+            "bit_rate": "128000",
+        },
+    ],
+    "format": {"duration": "4.004000"},
+}
+
+
+@pytest.mark.parametrize(
+    "probe_backend, use_ffprobe",
+    [
+        ("ffprobe", True),
+        ("auto", True),
+        ("ffprobe", False),  # falls back to `regex`
+        ("invalid", True),  # falls back to `regex`
+    ],
+)
+def test_probe_backend(probe_backend, use_ffprobe):
+    """
+    Testing FFprobe JSON probe backend
+    """
+    if use_ffprobe and platform.system() == "Windows":
+        pytest.skip("FFprobe script isn't executable on Windows.")
+    ffmpeg_dir = os.path.join(tempfile.gettempdir(), "ffprobe_backend")
+    try:
+        custom_ffmpeg = return_static_ffmpeg()
+        if use_ffprobe:
+            # pair FFmpeg with an FFprobe that prints sample JSON output
+            os.makedirs(ffmpeg_dir, exist_ok=True)
+            custom_ffmpeg = os.path.join(ffmpeg_dir, "ffmpeg")
+            os.path.lexists(custom_ffmpeg) or os.symlink(
+                os.path.abspath(return_static_ffmpeg()), custom_ffmpeg
+            )
+            ffprobe = os.path.join(ffmpeg_dir, "ffprobe")
+            with open(ffprobe, "w") as f:
+                f.write(
+                    "#!/bin/sh\ncat <<'EOF'\n{}\nEOF\n".format(json.dumps(ffprobe_json))
+                )
+            os.chmod(ffprobe, 0o755)
+        sourcer = Sourcer(
+            return_testvideo_path(),
+            custom_ffmpeg=custom_ffmpeg,
+            **{"-probe_backend": probe_backend}
+        ).probe_stream()
+        metadata = sourcer.retrieve_metadata()
+        logger.debug("Found Metadata: `{}`".format(metadata))
+        if use_ffprobe and probe_backend != "invalid":
+            assert metadata["source_video_resolution"] == [1280, 720], "Test Failed!"
+            assert metadata["source_video_framerate"] == 30000 / 1001, "Test Failed!"
+            assert metadata["source_video_orientation"] == -90.0, "Test Failed!"
+            assert metadata["source_video_pixfmt"] == "yuv420p", "Test Failed!"
+            assert metadata["source_video_decoder"] == "h264", "Test Failed!"
+            assert metadata["source_video_bitrate"] == "1500k", "Test Failed!"
+            assert metadata["source_audio_bitrate"] == "128k", "Test Failed!"
+            assert metadata["source_audio_samplerate"] == "44100 Hz", "Test Failed!"
+            assert metadata["source_duration_sec"] == 4.004, "Test Failed!"
+            assert metadata["approx_video_nframes"] == 120, "Test Failed!"
+            assert metadata["source_has_video"] and metadata["source_has_audio"]
+            assert [x.kind for x in sourcer.streams] == ["video", "audio"]
+            assert sourcer.streams[0].disposition == ("default",), "Test Failed!"
+            assert sourcer.streams[1].bitrate == 128, "Test Failed!"
+        else:
+            # same metadata as `regex` backend
+            assert (
+                metadata
+                == Sourcer(return_testvideo_path(), custom_ffmpeg=custom_ffmpeg)
+                .probe_stream()
+                .retrieve_metadata()
+            ), "Test Failed!"
+    except Exception as e:
+        pytest.fail(str(e))
+    finally:
+        shutil.rmtree(ffmpeg_dir, ignore_errors=True)
+
+
+@pytest.mark.parametrize(
+    "extension, audio_params, bitrate",
+    [
+        ("mkv", ["-c:a", "pcm_s16le"], "705k"),
+        ("mkv", ["-c:a", "pcm_s32le"], "1411k"),
+        ("mp4", ["-c:a", "aac", "-b:a", "96k"], None),
+    ],
+)
+def test_audio_bitrate_sample_formats(extension, audio_params, bitrate):
+    """
+    Testing audio bitrate extraction of non-`fltp` sample formats with regex backend
+    """
+    source = os.path.join(
+        tempfile.gettempdir(), "audio_sample_format.{}".format(extension)
+    )
+    try:
+        # generate source with video and mono audio stream of given codec
+        sp.check_call(
+            [return_static_ffmpeg(), "-hide_banner", "-loglevel", "error"]
+            + ["-f", "lavfi", "-i", "testsrc2=size=160x120:rate=25"]
+            + ["-f", "lavfi", "-i", "sine", "-t", "1"]
+            + audio_params
+            + ["-y", source]
+        )
+        metadata = (
+            Sourcer(
+                source,
+                custom_ffmpeg=return_static_ffmpeg(),
+                **{"-probe_backend": "regex"}
+            )
+            .probe_stream()
+            .retrieve_metadata()
+        )
+        logger.debug("Audio Bitrate: `{}`".format(metadata["source_audio_bitrate"]))
+        if bitrate is None:
+            assert metadata["source_audio_bitrate"].endswith("k"), "Test Failed!"
+        else:
+            assert metadata["source_audio_bitrate"] == bitrate, "Test Failed!"
+    except Exception as e:
+        pytest.fail(str(e))
+    finally:
+        os.path.isfile(source) and os.remove(source)
+
+
+def test_streams_n_select_stream():
+    """
+    Testing records of all streams and stream selection by predicate
+    """
+    source = os.path.join(tempfile.gettempdir(), "multi_stream.mp4")
+    try:
+        # generate source with two video streams of different resolutions, and one audio stream
+        sp.check_call(
+            [return_static_ffmpeg(), "-hide_banner", "-loglevel", "error"]
+            + ["-f", "lavfi", "-i", "testsrc2=size=320x240:rate=25"]
+            + ["-f", "lavfi", "-i", "testsrc2=size=640x480:rate=30"]
+            + ["-f", "lavfi", "-i", "sine", "-t", "1"]
+            + ["-map", "0", "-map", "1", "-map", "2", "-c:a", "aac"]
+            + ["-metadata:s:a:0", "language=eng", "-y", source]
+        )
+        sourcer = Sourcer(source, custom_ffmpeg=return_static_ffmpeg()).probe_stream()
+        streams = sourcer.streams
+        logger.debug("Found Streams: `{}`".format(streams))
+        assert [(x.index, x.kind, x.kind_index) for x in streams] == [
+            (0, "video", 0),
+            (1, "video", 1),
+            (2, "audio", 0),
+        ], "Test Failed!"
+        assert streams[1].resolution == (640, 480), "Test Failed!"
+        assert streams[1].framerate == 30.0, "Test Failed!"
+        assert streams[2].samplerate == 44100, "Test Failed!"
+        assert streams[2].language == "eng", "Test Failed!"
+        # highest resolution video stream
+        selected = sourcer.select_stream(key=lambda x: x.width * x.height, reverse=True)
+        assert selected.kind_index == 1, "Test Failed!"
+        # lowest bitrate video stream
+        selected = sourcer.select_stream(key=lambda x: x.bitrate)
+        assert selected.kind_index == 0, "Test Failed!"
+        # predicates
+        assert (
+            sourcer.select_stream(
+                kind="audio", predicate=lambda x: x.language == "eng"
+            ).to_dict()["codec"]
+            == "aac"
+        ), "Test Failed!"
+        assert sourcer.select_stream(kind="subtitle") is None, "Test Failed!"
+        # selected stream metadata
+        metadata = (
+            Sourcer(source, custom_ffmpeg=return_static_ffmpeg())
+            .probe_stream(default_stream_indexes=(selected.kind_index, 0))
+            .retrieve_metadata()
+        )
+        assert metadata["source_video_resolution"] == [320, 240], "Test Failed!"
+    except Exception as e:
+        pytest.fail(str(e))
+    finally:
+        os.path.isfile(source) and os.remove(source)
+
+
+@pytest.mark.parametrize(
+    "source, sourcer_params, resolution",
+    [
+        ("mandelbrot=size=640x480", {"-vf": "scale=320:-2"}, [320, 240]),
+        (
+            "testsrc2=size=640x480:rate=30",
+            {"-vf": "fps=15,scale=160:-2"},
+            [160, 120],
+        ),
+    ],
+)
+def test_probe_infinite_source_with_filters(source, sourcer_params, resolution):
+    """
+    Testing probing of output metadata of infinite sources with filters ends
+    """
+    try:
+        metadata = (
+            Sourcer(
+                source,
+                source_demuxer="lavfi",
+                custom_ffmpeg=return_static_ffmpeg(),
+                **dict(sourcer_params, **{"-probe_timeout": 30})
+            )
+            .probe_stream()
+            .retrieve_metadata()
+        )
+        logger.debug("Output Metadata: `{}`".format(metadata))
+        assert metadata["output_frames_resolution"] == resolution, "Test Failed!"
+    except Exception as e:
+        pytest.fail(str(e))
+
+
+@pytest.mark.parametrize(
+    "max_workers, timeout",
+    [(2, None), (None, 30), ("invalid", 30)],
+)
+def test_probe_many(max_workers, timeout):
+    """
+    Testing concurrent batch probing
+    """
+    sources = [return_testvideo_path(), "invalid", return_testvideo_path(fmt="vo")] * 3
+    try:
+        results = list(
+            Sourcer.probe_many(
+                (x for x in sources),
+                max_workers=max_workers,
+                timeout=timeout,
+                custom_ffmpeg=return_static_ffmpeg(),
+            )
+        )
+        assert sorted(x[0] for x in results) == sorted(sources), "Test Failed!"
+        for source, metadata, error in results:
+            if source == "invalid":
+                assert metadata is None and isinstance(error, ValueError)
+            else:
+                assert error is None and metadata["source"].endswith(
+                    os.path.basename(source)
+                ), "Test Failed!"
+        # timed out probes are returned as errors
+        (result,) = Sourcer.probe_many(
+            ["mandelbrot"],
+            timeout=1e-4,
+            source_demuxer="lavfi",
+            custom_ffmpeg=return_static_ffmpeg(),
+            **{"-vf": "scale=320:-2"}
+        )
+        assert isinstance(result[2], sp.TimeoutExpired), "Test Failed!"
+    except Exception as e:
+        pytest.fail(str(e))
+
+
+@pytest.mark.parametrize(
+    "source, source_demuxer, sourcer_params",
+    [
+        (return_testvideo_path(), None, {}),
+        (return_testvideo_path(fmt="vo"), None, {"-vf": "scale=320:-2"}),
+        ("testsrc=size=320x240:rate=30", "lavfi", {"-probe_timeout": 30}),
+    ],
+)
+def test_aprobe_stream(source, source_demuxer, sourcer_params):
+    """
+    Testing asyncio-native probing
+    """
+    import asyncio
+
+    async def probe_all():
+        sourcers = [
+            Sourcer(
+                source,
+                source_demuxer=source_demuxer,
+                custom_ffmpeg=return_static_ffmpeg(),
+                **sourcer_params
+            )
+            for _ in range(3)
+        ]
+        results = await asyncio.gather(*(x.aprobe_stream() for x in sourcers))
+        return [x.retrieve_metadata() for x in results]
+
+    async def probe_timeout():
+        await Sourcer(
+            "mandelbrot",
+            source_demuxer="lavfi",
+            custom_ffmpeg=return_static_ffmpeg(),
+            **{"-vf": "scale=320:-2", "-probe_timeout": 1e-4}
+        ).aprobe_stream()
+
+    async def probe_cancel():
+        task = asyncio.ensure_future(
+            Sourcer(
+                "mandelbrot=size=3840x2160",
+                source_demuxer="lavfi",
+                custom_ffmpeg=return_static_ffmpeg(),
+                **{"-vf": "scale=320:-2"}
+            ).aprobe_stream()
+        )
+        await asyncio.sleep(0.01)
+        task.cancel()
+        await task
+
+    try:
+        # asynchronous probing must match synchronous one
+        expected = (
+            Sourcer(
+                source,
+                source_demuxer=source_demuxer,
+                custom_ffmpeg=return_static_ffmpeg(),
+                **sourcer_params
+            )
+            .probe_stream()
+            .retrieve_metadata()
+        )
+        assert all(x == expected for x in asyncio.run(probe_all())), "Test Failed!"
+        # timed out and cancelled probes must raise
+        with pytest.raises(sp.TimeoutExpired):
+            asyncio.run(probe_timeout())
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(probe_cancel())
+    except Exception as e:
+        pytest.fail(str(e))
+
+
+@pytest.mark.parametrize(
+    "source",
+    ["rtsp://127.0.0.1:1/stream", "http://127.0.0.1:1/video.mp4"],
+)
+def test_aprobe_stream_nonblocking(source, monkeypatch):
+    """
+    Testing asyncio-native probing of network sources runs no blocking subprocesses
+    """
+    import asyncio
+    import deffcode.sourcer
+    import deffcode.ffhelper
+    from deffcode.ffhelper import FFmpegCapabilities
+
+    blocking_calls = []
+
+    def spy(*args, **kwargs):
+        blocking_calls.append(args)
+        raise AssertionError("Blocking subprocess called!")
+
+    try:
+        sourcer = Sourcer(source, custom_ffmpeg=return_static_ffmpeg())
+        # query capabilities afresh without persistent cache
+        FFmpegCapabilities.clear()
+        monkeypatch.setenv("DEFFCODE_CACHE", "0")
+        monkeypatch.setattr(deffcode.ffhelper, "check_sp_output", spy)
+        monkeypatch.setattr(deffcode.sourcer, "check_sp_output", spy)
+        try:
+            asyncio.run(sourcer.aprobe_stream())
+        except ValueError as e:
+            # unreachable sources fail later while parsing metadata
+            logger.debug(str(e))
+        assert not blocking_calls, "Test Failed!"
+    except Exception as e:
+        pytest.fail(str(e))
+    finally:
+        FFmpegCapabilities.clear()
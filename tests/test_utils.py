@@ -22,7 +22,10 @@
 import pytest
 import logging
 import os
+import sys
+import json
 import tempfile
+import subprocess as sp
 from os.path import expanduser
 from deffcode.utils import dict2Args, logger_handler, delete_file_safe
 
@@ -104,3 +107,30 @@ def test_delete_file_safe(file_path, result):
             pytest.fail(str(e))
         else:
             pytest.xfail(str(e))
+
+
+def test_import_time():
+    """
+    Testing `import deffcode` time stays within budget(in seconds, overridable with
+    `DEFFCODE_IMPORT_BUDGET` environment variable), without loading lazily imported modules.
+    """
+    budget = float(os.environ.get("DEFFCODE_IMPORT_BUDGET", 0.5))
+    script = (
+        "import sys, json, time, numpy;"
+        "start = time.perf_counter();"
+        "import deffcode;"
+        "elapsed = time.perf_counter() - start;"
+        "lazy = ['requests', 'urllib3', 'tqdm', 'colorlog', 'asyncio', 'deffcode.framering', 'deffcode.decoderpool'];"
+        "print(json.dumps([elapsed, [m for m in lazy if m in sys.modules]]))"
+    )
+    try:
+        # measure in fresh interpreter, excluding `numpy` which is needed anyway
+        output = sp.check_output([sys.executable, "-c", script])
+        elapsed, loaded = json.loads(output.decode("utf-8").strip().splitlines()[-1])
+        logger.debug("`import deffcode` took {:.3f}s".format(elapsed))
+        assert not loaded, "Modules `{}` loaded at import time!".format(loaded)
+        assert elapsed < budget, "Import time {:.3f}s exceeds {}s budget!".format(
+            elapsed, budget
+        )
+    except Exception as e:
+        pytest.fail(str(e))